@@ -0,0 +1,48 @@
+from typing import Any, AsyncIterator, Callable, Generic, List, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.pagination import DEFAULT_PAGE_SIZE
+
+S = TypeVar("S")
+
+
+class AsyncService(Generic[S]):
+    """Base dos servicos assincronos: cada metodo roda o servico sincrono.
+
+    ``AsyncSession.run_sync`` executa o servico sincrono sobre a sessao
+    interna em um greenlet, e o I/O do aiosqlite nao bloqueia o event loop.
+    Consultas, cache e invalidacoes sao os mesmos dos servicos sincronos.
+
+    Os objetos devolvidos nao carregam relacionamentos nem atributos
+    expirados fora do greenlet (isso levantaria ``MissingGreenlet``). Por
+    isso, as listagens devolvem linhas e as buscas por id ja carregam os
+    contadores.
+    """
+
+    sync_class: Type[S]
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.sync = self.sync_class(session.sync_session)
+
+    async def _run(self, method: Callable[..., Any], *args, **kwargs) -> Any:
+        return await self.session.run_sync(lambda _: method(*args, **kwargs))
+
+    async def _load(self, method: Callable[..., Any], *args) -> Any:
+        """Como ``_run``, carregando os atributos expirados do objeto devolvido."""
+        def load(session):
+            instance = method(*args)
+            expired = inspect(instance).expired_attributes
+            if expired:
+                session.refresh(instance, list(expired))
+            return instance
+        return await self.session.run_sync(load)
+
+    async def _stream(self, statement, chunk_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[List[tuple]]:
+        """Percorre ``statement`` em blocos de ``chunk_size`` linhas com um cursor do servidor."""
+        connection = await self.session.connection()
+        result = await connection.stream(statement, execution_options={"yield_per": chunk_size})
+        async for rows in result.partitions():
+            yield rows
@@ -0,0 +1,234 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Set, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import Session, SQLModel, select
+
+from app.config import get_cache_size, get_cache_ttl
+
+
+# Chaves sao tuplas cujo primeiro item e o namespace (ex.: ``("tasks", 1)``),
+# o que permite invalidar um namespace inteiro apos escritas em lote.
+CacheKey = Tuple[Hashable, ...]
+
+# Parametros por consulta ``IN (...)`` ao buscar as chaves ausentes do cache.
+MISSING_IDS_CHUNK = 5000
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """Cache LRU limitado a ``maxsize`` entradas, com validade opcional.
+
+    Seguro para uso entre threads. ``maxsize=0`` desativa o cache: nada e
+    guardado e toda consulta conta como miss.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key: CacheKey) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires = entry
+        if expires is not None and expires <= self.clock():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: CacheKey, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def set(self, key: CacheKey, value: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            expires = self.clock() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: CacheKey, loader: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, *keys: CacheKey):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate_namespace(self, *namespaces: Hashable):
+        """Remove as entradas cujas chaves comecam por um dos ``namespaces``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in namespaces]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+
+# Um cache por engine: bancos diferentes nunca compartilham entradas, e o
+# cache some junto com o engine descartado.
+_caches: "WeakKeyDictionary[Engine, LRUCache]" = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_cache(session: Session) -> LRUCache:
+    engine = session.get_bind()
+    engine = getattr(engine, "engine", engine)
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = _caches[engine] = LRUCache(get_cache_size(), get_cache_ttl())
+        return cache
+
+
+def snapshot(instance: SQLModel) -> Dict[str, Any]:
+    """Valores das colunas de ``instance``, guardados no lugar do objeto do ORM."""
+    return {attribute.key: getattr(instance, attribute.key) for attribute in inspect(instance).mapper.column_attrs}
+
+
+def load_entity(
+    session: Session,
+    model: Type[SQLModel],
+    entity_id: int,
+    expire: Sequence[str] = ()
+) -> Optional[SQLModel]:
+    """Busca ``model`` pela chave primaria passando pelo cache.
+
+    Um hit vira uma instancia da sessao via ``merge(load=False)``, sem SELECT.
+    Ausencias nao sao guardadas.
+    Os atributos em ``expire`` (ex.: contadores mantidos por triggers) nao
+    sao confiaveis no cache nem na sessao e sao recarregados do banco se
+    acessados.
+    """
+    existing = session.identity_map.get(identity_key(model, entity_id))
+    if existing is not None:
+        # Com ``expire_on_commit=False``, a instancia da sessao pode ter
+        # contadores anteriores a escritas que dispararam os triggers.
+        if expire:
+            session.expire(existing, list(expire))
+        return existing
+
+    cache = get_cache(session)
+    key = (model.__tablename__, entity_id)
+    values = cache.get(key)
+    if values is not None:
+        instance = model(**values)
+        make_transient_to_detached(instance)
+        instance = session.merge(instance, load=False)
+        if expire:
+            session.expire(instance, list(expire))
+        return instance
+
+    instance = session.exec(select(model).where(model.id == entity_id)).first()
+    if instance is not None:
+        cache.set(key, snapshot(instance))
+    return instance
+
+
+def existing_ids(session: Session, model: Type[SQLModel], ids: Iterable[int]) -> Set[int]:
+    """Subconjunto de ``ids`` cadastrado em ``model``.
+
+    Os ids ja vistos vem do cache; os demais sao buscados juntos com
+    ``IN (...)``. So a existencia e guardada: um id ausente pode ser criado
+    por qualquer caminho e e consultado de novo.
+    """
+    cache = get_cache(session)
+    namespace = f"{model.__tablename__}:exists"
+    found, missing = set(), []
+    for entity_id in set(ids):
+        if cache.get((namespace, entity_id)):
+            found.add(entity_id)
+        else:
+            missing.append(entity_id)
+
+    for start in range(0, len(missing), MISSING_IDS_CHUNK):
+        chunk = missing[start:start + MISSING_IDS_CHUNK]
+        loaded = set(session.exec(select(model.id).where(model.id.in_(chunk))).all())
+        for entity_id in loaded:
+            cache.set((namespace, entity_id), True)
+        found |= loaded
+    return found
+
+
+def cached_exists(session: Session, key: CacheKey, loader: Callable[[], bool]) -> bool:
+    """``loader`` passando pelo cache; como em ``existing_ids``, so ``True`` e guardado."""
+    cache = get_cache(session)
+    if cache.get(key):
+        return True
+    exists = loader()
+    if exists:
+        cache.set(key, True)
+    return exists
+
+
+def invalidate(session: Session, *keys: CacheKey):
+    get_cache(session).invalidate(*keys)
+
+
+def invalidate_entities(session: Session, model: Type[SQLModel], *ids: int):
+    """Remove do cache as entidades ``ids`` e sua existencia."""
+    table = model.__tablename__
+    get_cache(session).invalidate(
+        *((table, entity_id) for entity_id in ids),
+        *((f"{table}:exists", entity_id) for entity_id in ids)
+    )
+
+
+def invalidate_model(session: Session, model: Type[SQLModel], *namespaces: Hashable):
+    """Remove todas as entradas de ``model`` (apos escritas em lote)."""
+    table = model.__tablename__
+    get_cache(session).invalidate_namespace(table, f"{table}:exists", *namespaces)
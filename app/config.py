@@ -1,6 +1,22 @@
 import os
+import tempfile
+from typing import Optional
 
 DB_URL_ENV = "TODO_CLI_DB_URL"
+DB_PROFILE_ENV = "TODO_CLI_DB_PROFILE"
+DB_POOL_ENV = "TODO_CLI_DB_POOL"
+DB_POOL_SIZE_ENV = "TODO_CLI_DB_POOL_SIZE"
+DB_MAX_OVERFLOW_ENV = "TODO_CLI_DB_MAX_OVERFLOW"
+SOCKET_PATH_ENV = "TODO_CLI_SOCKET"
+SLOW_QUERY_MS_ENV = "TODO_CLI_SLOW_QUERY_MS"
+CACHE_SIZE_ENV = "TODO_CLI_CACHE_SIZE"
+CACHE_TTL_ENV = "TODO_CLI_CACHE_TTL"
+
+DEFAULT_DB_PROFILE = "performance"
+DEFAULT_DB_POOL_SIZE = 5
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_CACHE_SIZE = 1024
 
 def get_db_url(test = False) -> str:
     if test:
@@ -10,3 +26,38 @@ def get_db_url(test = False) -> str:
 
 def set_db_url(url: str):
     os.environ[DB_URL_ENV] = url
+
+def get_db_profile() -> str:
+    return os.environ.get(DB_PROFILE_ENV, DEFAULT_DB_PROFILE)
+
+def set_db_profile(profile: str):
+    os.environ[DB_PROFILE_ENV] = profile
+
+def get_db_pool() -> Optional[str]:
+    """Classe de pool configurada; ``None`` deixa o SQLAlchemy escolher pela URL."""
+    return os.environ.get(DB_POOL_ENV) or None
+
+def set_db_pool(pool: str):
+    os.environ[DB_POOL_ENV] = pool
+
+def get_db_pool_size() -> int:
+    return int(os.environ.get(DB_POOL_SIZE_ENV, DEFAULT_DB_POOL_SIZE))
+
+def get_db_max_overflow() -> int:
+    return int(os.environ.get(DB_MAX_OVERFLOW_ENV, DEFAULT_DB_MAX_OVERFLOW))
+
+def get_socket_path() -> str:
+    return os.environ.get(SOCKET_PATH_ENV, os.path.join(tempfile.gettempdir(), "todo-cli.sock"))
+
+def get_slow_query_ms() -> float:
+    """Duracao a partir da qual um statement e registrado como lento."""
+    return float(os.environ.get(SLOW_QUERY_MS_ENV, DEFAULT_SLOW_QUERY_MS))
+
+def get_cache_size() -> int:
+    """Entradas do cache de consultas por engine; 0 desativa o cache."""
+    return int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+
+def get_cache_ttl() -> Optional[float]:
+    """Validade das entradas do cache em segundos; sem valor, nao expiram."""
+    value = os.environ.get(CACHE_TTL_ENV)
+    return float(value) if value else None
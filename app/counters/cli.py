@@ -0,0 +1,23 @@
+import typer
+
+from rich.console import Console
+
+from app.counters.services import CounterService
+from app.database import session_scope
+
+console = Console()
+
+app = typer.Typer()
+
+
+@app.command("recount")
+def recount():
+    """Recalcula os contadores de funcionários e tarefas de times e funcionários."""
+    with session_scope() as session:
+        try:
+            teams, employees = CounterService(session).recount()
+        except Exception as e:
+            console.print(f"[red]Erro ao recalcular contadores: {e}[/red]")
+            raise typer.Exit(1)
+
+        console.print(f"[green]Contadores recalculados: {teams} time(s) e {employees} funcionário(s).[/green]")
@@ -0,0 +1,31 @@
+from typing import Tuple
+from sqlmodel import Session, func, select
+
+from app.employees.models import Employee
+from app.migrations import recount_counters
+from app.teams.models import Team
+
+
+class CounterService:
+    """Contadores desnormalizados de times e funcionarios.
+
+    Os triggers mantem os contadores a cada escrita; ``recount`` os
+    reconstroi a partir das tabelas, por exemplo apos escritas feitas com
+    os triggers desativados ou em outro banco.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def recount(self) -> Tuple[int, int]:
+        """Recalcula os contadores. Retorna (times, funcionarios) recontados."""
+        try:
+            recount_counters(self.session.connection())
+            teams = self.session.exec(select(func.count(Team.id))).one()
+            employees = self.session.exec(select(func.count(Employee.id))).one()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return teams, employees
@@ -1,19 +1,368 @@
 # app/database.py
+import atexit
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, SingletonThreadPool, StaticPool
 from sqlmodel import create_engine, SQLModel, Session
-from app.config import get_db_url
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import (
+    get_db_max_overflow,
+    get_db_pool,
+    get_db_pool_size,
+    get_db_profile,
+    get_db_url,
+    get_slow_query_ms,
+)
+from app.migrations import upgrade
+
+
+# Pragmas aplicados a cada nova conexao SQLite, por perfil.
+SQLITE_PROFILES = {
+    # Configuracao padrao do SQLite (rollback journal, synchronous=FULL).
+    "default": {},
+    # WAL permite leitores concorrentes com um escritor; synchronous=NORMAL
+    # e seguro em WAL e reduz fsyncs nos commits.
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+# Classes de pool selecionaveis pela configuracao. Bancos em memoria
+# (``sqlite://``) precisam de ``static`` ou ``singleton``: cada conexao
+# nova de um ``queue`` abriria um banco vazio.
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "static": StaticPool,
+    "singleton": SingletonThreadPool,
+    "null": NullPool,
+}
 
+# Drivers assincronos usados por ``build_async_engine`` para cada dialeto.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+}
 
 _engine = None
+_async_engine = None
+
+slow_query_logger = logging.getLogger("app.database.slow_queries")
+
+def get_sqlite_pragmas(profile: str) -> dict:
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Perfil de banco desconhecido: {profile}. "
+            f"Opcoes: {', '.join(SQLITE_PROFILES)}"
+        )
+    return SQLITE_PROFILES[profile]
+
+def get_pool_options(pool: Optional[str], pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    if pool is None:
+        return {}
+    if pool not in POOL_CLASSES:
+        raise ValueError(
+            f"Pool de conexoes desconhecido: {pool}. "
+            f"Opcoes: {', '.join(POOL_CLASSES)}"
+        )
+
+    options = {"poolclass": POOL_CLASSES[pool]}
+    if pool == "queue":
+        options.update(pool_size=pool_size, max_overflow=max_overflow, pool_pre_ping=True)
+    return options
+
+def build_engine(
+    url: str,
+    profile: str = "default",
+    pool: Optional[str] = None,
+    pool_size: int = 5,
+    max_overflow: int = 10
+):
+    pragmas = get_sqlite_pragmas(profile)
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        **get_pool_options(pool, pool_size, max_overflow)
+    )
+    set_sqlite_pragmas(engine, pragmas)
+    return engine
+
+def set_sqlite_pragmas(engine, pragmas: dict):
+    """Aplica ``pragmas`` a cada nova conexao de ``engine`` (sincrono)."""
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def build_async_engine(
+    url: str,
+    profile: str = "default",
+    pool: Optional[str] = None,
+    pool_size: int = 5,
+    max_overflow: int = 10
+) -> AsyncEngine:
+    """Engine assincrono para a mesma URL de ``build_engine``.
+
+    ``sqlite://`` passa a usar o aiosqlite; perfis e pools sao os mesmos,
+    com ``queue`` trocado pela versao do pool compativel com asyncio.
+    """
+    url = make_url(url)
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    pragmas = get_sqlite_pragmas(profile)
+    options = get_pool_options(pool, pool_size, max_overflow)
+    if options.get("poolclass") is QueuePool:
+        options["poolclass"] = AsyncAdaptedQueuePool
+    elif options.get("poolclass") is SingletonThreadPool:
+        raise ValueError("O pool singleton nao pode ser usado com o engine assincrono.")
+
+    engine = create_async_engine(url, **options)
+    set_sqlite_pragmas(engine.sync_engine, pragmas)
+    return engine
 
 def get_engine(test = False):
     global _engine
     if _engine is None:
-        _engine = create_engine(get_db_url(test) if test else get_db_url(),
-                                connect_args={"check_same_thread": False})
+        _engine = build_engine(
+            get_db_url(test) if test else get_db_url(),
+            get_db_profile(),
+            get_db_pool(),
+            get_db_pool_size(),
+            get_db_max_overflow()
+        )
     return _engine
 
+def dispose_engine():
+    """Fecha todas as conexoes do pool e descarta o engine global."""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+atexit.register(dispose_engine)
+
+def get_async_engine(test = False) -> AsyncEngine:
+    """Engine assincrono global, configurado como ``get_engine``."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = build_async_engine(
+            get_db_url(test) if test else get_db_url(),
+            get_db_profile(),
+            get_db_pool(),
+            get_db_pool_size(),
+            get_db_max_overflow()
+        )
+    return _async_engine
+
+async def dispose_async_engine():
+    """Fecha as conexoes do engine assincrono global.
+
+    Nao ha ``atexit`` para ele: o dispose precisa rodar no event loop que
+    abriu as conexoes, antes de ele ser encerrado.
+    """
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
 def get_session():
-    return Session(get_engine())
+    return Session(get_engine(), expire_on_commit=False)
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Abre uma sessao, desfaz a transacao em caso de erro e sempre a fecha.
+
+    As conexoes voltam ao pool ao final do bloco, entao o mesmo engine pode
+    ser compartilhado entre threads sem vazar conexoes. Os objetos nao
+    expiram no commit: os servicos devolvem o que gravaram sem um SELECT
+    de refresh.
+    """
+    session = Session(get_engine(), expire_on_commit=False)
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Versao assincrona de ``session_scope`` sobre ``get_async_engine``."""
+    session = AsyncSession(get_async_engine(), expire_on_commit=False)
+    try:
+        yield session
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+@dataclass
+class QueryRecord:
+    statement: str
+    duration_ms: float
+    rows: int = 0
+    executemany: bool = False
+
+
+class _RowCountingCursor:
+    """Repassa o cursor DBAPI somando ao registro as linhas lidas dele."""
+
+    def __init__(self, cursor, record: QueryRecord):
+        self._cursor = cursor
+        self._record = record
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._record.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._record.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._record.rows += len(rows)
+        return rows
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._record.rows += 1
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class QueryStats:
+    """Registra os statements executados por um engine enquanto anexado.
+
+    Para cada statement guarda a duracao e as linhas lidas (SELECT) ou
+    afetadas (DML). Statements acima de ``slow_query_ms`` sao registrados
+    no logger ``app.database.slow_queries``.
+    """
+
+    def __init__(self, slow_query_ms: Optional[float] = None):
+        self.slow_query_ms = get_slow_query_ms() if slow_query_ms is None else slow_query_ms
+        self.queries: List[QueryRecord] = []
+        self._engines = []
+        # Chave propria em ``conn.info``: varios coletores podem estar
+        # anexados ao mesmo engine.
+        self._started_key = ("query_stats", id(self))
+
+    def attach(self, engine) -> "QueryStats":
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        self._engines.append(engine)
+        return self
+
+    def detach(self):
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+            event.remove(engine, "handle_error", self._handle_error)
+        self._engines.clear()
+
+    def __enter__(self) -> "QueryStats":
+        return self
+
+    def __exit__(self, *exc):
+        self.detach()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(self._started_key, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info[self._started_key].pop()) * 1000
+        record = QueryRecord(statement, duration_ms, executemany=executemany)
+        self.queries.append(record)
+
+        if cursor.description is None:
+            record.rows = max(cursor.rowcount, 0)
+        elif context is not None and context.cursor is cursor and not executemany:
+            # O resultado ainda nao foi lido: as linhas sao contadas conforme
+            # o CursorResult busca no cursor.
+            context.cursor = _RowCountingCursor(cursor, record)
+
+        if duration_ms >= self.slow_query_ms:
+            slow_query_logger.warning("Consulta lenta (%.1fms): %s", duration_ms, " ".join(statement.split()))
+
+    def _handle_error(self, exception_context):
+        # Statements que falham nao chegam ao after_cursor_execute.
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(self._started_key):
+            connection.info[self._started_key].pop()
+
+    def clear(self):
+        self.queries.clear()
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def __iter__(self) -> Iterator[QueryRecord]:
+        return iter(self.queries)
+
+    @property
+    def statements(self) -> List[str]:
+        return [query.statement for query in self.queries]
+
+    @property
+    def total_ms(self) -> float:
+        return sum(query.duration_ms for query in self.queries)
+
+    @property
+    def rows(self) -> int:
+        return sum(query.rows for query in self.queries)
+
+    @property
+    def slow_queries(self) -> List[QueryRecord]:
+        return [query for query in self.queries if query.duration_ms >= self.slow_query_ms]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Agrupa statements identicos, do maior para o menor tempo total."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for query in self.queries:
+            statement = " ".join(query.statement.split())
+            group = groups.setdefault(statement, {"statement": statement, "count": 0, "total_ms": 0.0, "rows": 0})
+            group["count"] += 1
+            group["total_ms"] += query.duration_ms
+            group["rows"] += query.rows
+        return sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+def get_pool_status() -> Dict[str, Any]:
+    """Estatisticas do pool do engine global."""
+    pool = get_engine().pool
+    status = {"class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow()
+        )
+    return status
 
 def create_db_and_tables(test = False):
-    SQLModel.metadata.create_all(get_engine(test) if test else get_engine())
+    import app.models  # noqa: F401
+
+    engine = get_engine(test) if test else get_engine()
+    SQLModel.metadata.create_all(engine)
+    upgrade(engine)
@@ -0,0 +1,49 @@
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from app.async_services import AsyncService
+from app.employees.models import Employee
+from app.employees.schemas import EmployeeCreate, EmployeeCreateResult, EmployeeRead, EmployeeRow
+from app.employees.services import EmployeeService
+from app.pagination import DEFAULT_PAGE_SIZE, paginate
+
+
+class AsyncEmployeeService(AsyncService[EmployeeService]):
+    """``EmployeeService`` para uso com asyncio, sobre uma ``AsyncSession``."""
+
+    sync_class = EmployeeService
+
+    async def create_employee(self, schema: EmployeeCreate) -> Employee:
+        return await self._run(self.sync.create_employee, schema)
+
+    async def create_employees(self, schemas: List[EmployeeCreate]) -> List[EmployeeCreateResult]:
+        return await self._run(self.sync.create_employees, schemas)
+
+    async def find_existing(self, names: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        return await self._run(self.sync.find_existing, names, emails)
+
+    async def list_employees(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeRead]:
+        return await self._run(self.sync.list_employees, limit, after_id)
+
+    async def get_employee_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeRow]:
+        return await self._run(self.sync.get_employee_rows, limit, after_id)
+
+    async def iter_employee_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[List[tuple]]:
+        """Versao assincrona de ``EmployeeService.iter_employee_rows``."""
+        statement = paginate(self.sync._list_statement(), Employee.id, limit, after_id)
+        async for rows in self._stream(statement, chunk_size):
+            yield rows
+
+    async def get_employee_by_id(self, id: int) -> Employee:
+        # Os contadores voltam expirados do cache e sao carregados aqui.
+        return await self._load(self.sync.get_employee_by_id, id)
+
+    async def exists_by_name(self, name: str) -> bool:
+        return await self._run(self.sync.exists_by_name, name)
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._run(self.sync.exists_by_email, email)
@@ -1,12 +1,16 @@
+from typing import Optional
+
 import typer
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from app.database import get_session
+from app.database import session_scope
+from app.output import OutputFormat, write_rows
+from app.pagination import DEFAULT_PAGE_SIZE, iter_pages
 from app.employees.schemas import EmployeeCreate
-from app.employees.services import EmployeeService
+from app.employees.services import EMPLOYEE_ROW_COLUMNS, EmployeeService
 
 console = Console()
 
@@ -18,56 +22,81 @@ def create(
     email: str = typer.Option(..., "--email", help="Email do funcionario"),
     team: int = typer.Option(..., "--team", help="Id do time responsavel pelo funcionario")
 ):
-    service = EmployeeService(get_session())
-
-    try:
-        schema = EmployeeCreate(name = name, email = email, team_id = team)
-        employee = service.create_employee(schema)
-
-        console.print(
-            Panel(
-                f"[green]Funcionário criado com sucesso![/green]\n"
-                f"ID: {employee.id}\n"
-                f"Nome: {employee.name}\n"
-                f"Email: {employee.email}\n"
-                f"Time ID: {employee.team_id}",
-                title="✅ Sucesso",
-                border_style="green"
+    with session_scope() as session:
+        service = EmployeeService(session)
+
+        try:
+            schema = EmployeeCreate(name = name, email = email, team_id = team)
+            employee = service.create_employee(schema)
+
+            console.print(
+                Panel(
+                    f"[green]Funcionário criado com sucesso![/green]\n"
+                    f"ID: {employee.id}\n"
+                    f"Nome: {employee.name}\n"
+                    f"Email: {employee.email}\n"
+                    f"Time ID: {employee.team_id}",
+                    title="✅ Sucesso",
+                    border_style="green"
+                )
             )
-        )
-    except Exception as e:
-        console.print(f"[red]Erro ao criar funcionário: {e}[/red]")
-        raise typer.Exit(1)
+        except Exception as e:
+            console.print(f"[red]Erro ao criar funcionário: {e}[/red]")
+            raise typer.Exit(1)
+
+
+def build_employees_table(title: Optional[str] = None) -> Table:
+    table = Table(title=title)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Nome", style="magenta")
+    table.add_column("Email", style="blue")
+    table.add_column("Time")
+    table.add_column("Tarefas", justify="center")
+    table.add_column("Abertas", justify="center")
+    return table
 
 
 @app.command("list")
-def list_employees():
-    service = EmployeeService(get_session())
-
-    try:
-        employees = service.get_all_employees()
-        
-        if not employees:
-            console.print("[yellow]Nenhum funcionário encontrado.[/yellow]")
-            return
-        
-        table = Table(title="👥 Lista de Funcionários")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nome", style="magenta")
-        table.add_column("Email", style="blue")
-        table.add_column("Time")
-        table.add_column("Tarefas", justify="center")
-        
-        for employee in employees:
-            table.add_row(
-                str(employee.id),
-                employee.name,
-                employee.email,
-                employee.team.name,
-                str(len(employee.tasks))
-            )
-        
-        console.print(table)
-    except Exception as e:
-        console.print(f"[red]Erro ao listar funcionários: {e}[/red]")
-        raise typer.Exit(1)
\ No newline at end of file
+def list_employees(
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Número máximo de funcionários listados"),
+    after_id: Optional[int] = typer.Option(None, "--after-id", help="Lista apenas funcionários com ID maior que este"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Funcionários buscados por consulta"),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", "-f", help="Formato da saída")
+):
+    with session_scope() as session:
+        service = EmployeeService(session)
+
+        try:
+            if format != OutputFormat.TABLE:
+                write_rows(format, EMPLOYEE_ROW_COLUMNS, service.iter_employee_rows(limit, after_id, page_size))
+                return
+
+            shown = 0
+            last_id = None
+
+            for employees in iter_pages(service.get_employee_rows, page_size, limit, after_id):
+                table = build_employees_table("👥 Lista de Funcionários" if shown == 0 else None)
+
+                for employee in employees:
+                    table.add_row(
+                        str(employee.id),
+                        employee.name,
+                        employee.email,
+                        employee.team_name or "N/A",
+                        str(employee.task_count),
+                        str(employee.open_task_count)
+                    )
+
+                console.print(table)
+                shown += len(employees)
+                last_id = employees[-1].id
+
+            if shown == 0:
+                console.print("[yellow]Nenhum funcionário encontrado.[/yellow]")
+                return
+
+            if limit is not None and shown == limit:
+                console.print(f"[dim]Próxima página: --after-id {last_id}[/dim]")
+        except Exception as e:
+            console.print(f"[red]Erro ao listar funcionários: {e}[/red]")
+            raise typer.Exit(1)
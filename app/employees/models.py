@@ -2,12 +2,18 @@ from datetime import datetime
 from typing import List, Optional
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.schema_sql import TASK_COUNTERS
+
+
+# Colunas mantidas por triggers, que um cache da aplicacao nao acompanha.
+COUNTER_FIELDS = tuple(TASK_COUNTERS)
+
 
 class Employee(SQLModel, table=True):
     __tablename__ = "employees"
     id: int = Field(primary_key=True)
 
-    team_id: int = Field(foreign_key="teams.id")
+    team_id: int = Field(foreign_key="teams.id", index=True)
     team: Optional["Team"] = Relationship(back_populates="employees")
 
     name: str = Field(min_length=1, max_length=100, unique=True)
@@ -15,5 +21,12 @@ class Employee(SQLModel, table=True):
 
     tasks: List["Task"] = Relationship(back_populates="owner")
 
+    # Contadores mantidos por triggers (app.schema_sql); nao grave direto.
+    tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    open_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    pending_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    in_progress_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    completed_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = Field(default=None)
\ No newline at end of file
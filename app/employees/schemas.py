@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import NamedTuple, Optional
 from pydantic import BaseModel, Field
 
 
@@ -12,8 +12,21 @@ class EmployeeCreate(BaseModel):
 class EmployeeRead(BaseModel):
     """Schema para leitura de Funcionário."""
     id: int
+    name: str
+    email: str
     team_name: str = ""
     task_count: int = 0
+    open_task_count: int = 0
+
+
+class EmployeeRow(NamedTuple):
+    """Linha somente leitura da listagem de Funcionários."""
+    id: int
+    name: str
+    email: str
+    team_name: Optional[str]
+    task_count: int
+    open_task_count: int
 
 
 class EmployeeUpdate(BaseModel):
@@ -21,3 +34,10 @@ class EmployeeUpdate(BaseModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=100)
     email: Optional[str] = Field(default=None, min_length=1, max_length=255)
     team_id: Optional[int] = Field(default=None)
+
+
+class EmployeeCreateResult(BaseModel):
+    """Resultado de cada item na criação de Funcionários em lote."""
+    index: int
+    employee_id: Optional[int] = None
+    error: Optional[str] = None
@@ -1,9 +1,26 @@
-from typing import List
-from sqlmodel import Session, select
+from datetime import datetime
+from typing import Iterator, List, Optional, Set, Tuple
+from sqlalchemy import insert
+from sqlmodel import Session, or_, select
 
+from app.cache import cached_exists, load_entity
 from app.employees import utils
-from app.employees.models import Employee
-from app.employees.schemas import EmployeeCreate
+from app.employees.models import COUNTER_FIELDS, Employee
+from app.employees.schemas import EmployeeCreate, EmployeeCreateResult, EmployeeRead, EmployeeRow
+from app.pagination import DEFAULT_PAGE_SIZE, paginate
+from app.teams.models import Team
+
+
+# Cada funcionario ocupa dois parametros (nome e email) na consulta de
+# duplicidade; o lote fica abaixo do limite de variaveis do SQLite.
+DUPLICATE_CHECK_CHUNK = 5000
+
+# Namespaces do cache para ``exists_by_name`` e ``exists_by_email``.
+NAME_NAMESPACE = "employees:name"
+EMAIL_NAMESPACE = "employees:email"
+
+# Colunas das linhas produzidas por ``EmployeeService.iter_employee_rows``.
+EMPLOYEE_ROW_COLUMNS = ("id", "name", "email", "team", "task_count", "open_task_count")
 
 
 class EmployeeService:
@@ -16,7 +33,8 @@ class EmployeeService:
         if not is_valid_email:
             raise Exception("Email invalido.")
         
-        if self.exists_by_name(schema.name) or self.exists_by_email(schema.email):
+        names, emails = self.find_existing([schema.name], [schema.email])
+        if names or emails:
             raise Exception("Funcionario ja cadastrado.")
 
         employee = Employee(
@@ -27,17 +45,125 @@ class EmployeeService:
 
         self.session.add(employee)
         self.session.commit()
-        self.session.refresh(employee)
 
         return employee
 
     
-    def get_all_employees(self) -> List[Employee]:
-        employees = self.session.exec(select(Employee)).all()
+    def create_employees(self, schemas: List[EmployeeCreate]) -> List[EmployeeCreateResult]:
+        """Cria varios funcionarios em uma unica transacao.
+
+        Emails sao validados em uma passada, nomes e emails ja cadastrados
+        sao buscados com ``IN (...)`` e os validos sao inseridos juntos.
+        Retorna um resultado por item, na mesma ordem de ``schemas``.
+        """
+        results = [EmployeeCreateResult(index=index) for index in range(len(schemas))]
+        valid_emails = utils.validate_emails(schema.email for schema in schemas)
+        names, emails = self.find_existing(
+            [schema.name for schema in schemas],
+            [schema.email for schema in schemas]
+        )
+
+        pending = []
+        for result, schema, is_valid_email in zip(results, schemas, valid_emails):
+            if not is_valid_email:
+                result.error = "Email invalido."
+            elif schema.name in names or schema.email in emails:
+                result.error = "Funcionario ja cadastrado."
+            else:
+                # Tambem rejeita repeticoes dentro do proprio lote.
+                names.add(schema.name)
+                emails.add(schema.email)
+                pending.append((result, schema))
+
+        if pending:
+            now = datetime.now()
+            self.session.exec(insert(Employee), params=[{
+                "name": schema.name,
+                "email": schema.email,
+                "team_id": schema.team_id,
+                "created_at": now
+            } for _, schema in pending])
+
+            # O nome e unico: um SELECT por bloco recupera os ids gerados sem
+            # depender de RETURNING linha a linha.
+            inserted = [schema.name for _, schema in pending]
+            ids = {}
+            for start in range(0, len(inserted), DUPLICATE_CHECK_CHUNK):
+                chunk = inserted[start:start + DUPLICATE_CHECK_CHUNK]
+                ids.update(self.session.exec(select(Employee.name, Employee.id).where(Employee.name.in_(chunk))).all())
+            for result, schema in pending:
+                result.employee_id = ids[schema.name]
+
+            self.session.commit()
+
+        return results
+
+    def find_existing(self, names: List[str], emails: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Retorna os nomes e emails informados que ja estao cadastrados."""
+        found_names, found_emails = set(), set()
+
+        for start in range(0, max(len(names), len(emails)), DUPLICATE_CHECK_CHUNK):
+            chunk_names = names[start:start + DUPLICATE_CHECK_CHUNK]
+            chunk_emails = emails[start:start + DUPLICATE_CHECK_CHUNK]
+            statement = select(Employee.name, Employee.email).where(
+                or_(Employee.name.in_(chunk_names), Employee.email.in_(chunk_emails))
+            )
+            for name, email in self.session.exec(statement):
+                found_names.add(name)
+                found_emails.add(email)
+
+        return found_names & set(names), found_emails & set(emails)
+
+    def get_all_employees(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Employee]:
+        statement = paginate(select(Employee), Employee.id, limit, after_id)
+        employees = self.session.exec(statement).all()
         return employees
+
+    def _list_statement(self):
+        # Contadores mantidos por triggers; o time vem pela chave primaria.
+        return (
+            select(
+                Employee.id,
+                Employee.name,
+                Employee.email,
+                Team.name,
+                Employee.tasks_count,
+                Employee.open_tasks_count,
+            )
+            .outerjoin(Team, Team.id == Employee.team_id)
+        )
+
+    def list_employees(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeRead]:
+        """Lista funcionarios com nome do time e total de tarefas em um unico SELECT."""
+        statement = paginate(self._list_statement(), Employee.id, limit, after_id)
+
+        return [EmployeeRead(
+            id=id,
+            name=name,
+            email=email,
+            team_name=team_name or "",
+            task_count=task_count,
+            open_task_count=open_task_count
+        ) for id, name, email, team_name, task_count, open_task_count in self.session.exec(statement).all()]
+
+    def get_employee_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeRow]:
+        """Mesma pagina de ``list_employees`` como tuplas, sem validacao do Pydantic."""
+        statement = paginate(self._list_statement(), Employee.id, limit, after_id)
+        return list(map(EmployeeRow._make, self.session.connection().execute(statement)))
+
+    def iter_employee_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[tuple]]:
+        """Percorre os funcionarios como tuplas (``EMPLOYEE_ROW_COLUMNS``), em blocos, sem o ORM."""
+        statement = paginate(self._list_statement(), Employee.id, limit, after_id)
+        connection = self.session.connection().execution_options(yield_per=chunk_size)
+        yield from connection.execute(statement).partitions()
     
     def get_employee_by_id(self, id: int) -> Employee:
-        employee = self.session.exec(select(Employee).where(Employee.id == id)).first()
+        employee = load_entity(self.session, Employee, id, expire=COUNTER_FIELDS)
         
         if not employee:
             raise Exception("Funcionario nao encontrado")
@@ -45,11 +171,15 @@ class EmployeeService:
         return employee
 
     def exists_by_name(self, name: str) -> bool:
-        employee = self.session.exec(select(Employee).where(Employee.name == name)).first()
-
-        return True if employee else False
+        return cached_exists(
+            self.session,
+            (NAME_NAMESPACE, name),
+            lambda: self.session.exec(select(Employee.id).where(Employee.name == name)).first() is not None
+        )
 
     def exists_by_email(self, email: str) -> bool:
-        employee = self.session.exec(select(Employee).where(Employee.email == email)).first()
-
-        return True if employee else False
\ No newline at end of file
+        return cached_exists(
+            self.session,
+            (EMAIL_NAMESPACE, email),
+            lambda: self.session.exec(select(Employee.id).where(Employee.email == email)).first() is not None
+        )
\ No newline at end of file
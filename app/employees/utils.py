@@ -1,6 +1,12 @@
 import re
+from typing import Iterable, List
 
 regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+pattern = re.compile(regex)
 
 def validate_email(email):
-    return re.match(regex, email) is not None
+    return pattern.match(email) is not None
+
+def validate_emails(emails: Iterable[str]) -> List[bool]:
+    match = pattern.match
+    return [match(email) is not None for email in emails]
@@ -0,0 +1,110 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from rich.console import Console
+from rich.panel import Panel
+
+from app.database import session_scope
+from app.exports.schemas import ExportEntity, ExportFormat, ExportResult
+from app.exports.services import DEFAULT_CHUNK_SIZE, MANIFEST_NAME, ExportService
+
+console = Console()
+
+app = typer.Typer(help="Exportação paralela em shards por faixa de ids")
+
+
+def run_export(
+    entity: ExportEntity,
+    out_dir: Path,
+    format: ExportFormat,
+    shards: Optional[int],
+    workers: Optional[int],
+    merge: bool,
+    chunk_size: int
+):
+    with session_scope() as session:
+        try:
+            result = ExportService(session).export(entity, out_dir, format, shards, workers, merge, chunk_size)
+        except Exception as e:
+            console.print(f"[red]Erro ao exportar {entity.value}: {e}[/red]")
+            raise typer.Exit(1)
+
+        print_result(result, out_dir)
+
+
+def print_result(result: ExportResult, out_dir: Path):
+    files = result.merged or f"{len(result.shards)} shard(s)"
+    console.print(
+        Panel(
+            f"Linhas: {result.rows:,}\n"
+            f"Arquivos: {files} em {out_dir}\n"
+            f"Manifesto: {out_dir / MANIFEST_NAME}\n"
+            f"Tamanho: {result.bytes / 1024 / 1024:,.1f} MB\n"
+            f"Processos: {result.workers}\n"
+            f"Tempo: {result.elapsed:.2f}s ({result.rows_per_second:,.0f} linhas/s)",
+            title=f"📤 Exportação de {result.entity.value}",
+            border_style="green"
+        )
+    )
+
+
+def out_dir_argument():
+    return typer.Argument(..., file_okay=False, help="Diretório dos arquivos e do manifest.json")
+
+
+def format_option():
+    return typer.Option(ExportFormat.CSV, "--format", "-f", help="Formato dos arquivos")
+
+
+def shards_option():
+    return typer.Option(None, "--shards", min=1, help="Número de faixas de ids (padrão: um por processo)")
+
+
+def workers_option():
+    return typer.Option(None, "--workers", "-w", min=1, help="Processos em paralelo (padrão: número de núcleos)")
+
+
+def merge_option():
+    return typer.Option(False, "--merge", help="Junta os shards em um único arquivo ao final")
+
+
+def chunk_size_option():
+    return typer.Option(DEFAULT_CHUNK_SIZE, "--chunk-size", min=1, help="Linhas lidas e escritas por vez em cada processo")
+
+
+@app.command("teams")
+def export_teams(
+    out_dir: Path = out_dir_argument(),
+    format: ExportFormat = format_option(),
+    shards: Optional[int] = shards_option(),
+    workers: Optional[int] = workers_option(),
+    merge: bool = merge_option(),
+    chunk_size: int = chunk_size_option()
+):
+    run_export(ExportEntity.TEAMS, out_dir, format, shards, workers, merge, chunk_size)
+
+
+@app.command("employees")
+def export_employees(
+    out_dir: Path = out_dir_argument(),
+    format: ExportFormat = format_option(),
+    shards: Optional[int] = shards_option(),
+    workers: Optional[int] = workers_option(),
+    merge: bool = merge_option(),
+    chunk_size: int = chunk_size_option()
+):
+    run_export(ExportEntity.EMPLOYEES, out_dir, format, shards, workers, merge, chunk_size)
+
+
+@app.command("tasks")
+def export_tasks(
+    out_dir: Path = out_dir_argument(),
+    format: ExportFormat = format_option(),
+    shards: Optional[int] = shards_option(),
+    workers: Optional[int] = workers_option(),
+    merge: bool = merge_option(),
+    chunk_size: int = chunk_size_option()
+):
+    run_export(ExportEntity.TASKS, out_dir, format, shards, workers, merge, chunk_size)
@@ -0,0 +1,66 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class ExportEntity(str, Enum):
+    """Entidades aceitas pelo comando de exportacao."""
+    TEAMS = "teams"
+    EMPLOYEES = "employees"
+    TASKS = "tasks"
+
+
+class ExportFormat(str, Enum):
+    """Formatos que podem ser concatenados: cada shard e um pedaco do arquivo final."""
+    CSV = "csv"
+    TSV = "tsv"
+    JSONL = "jsonl"
+
+
+class ShardSpec(BaseModel):
+    """Faixa de ids ``[first_id, last_id]`` exportada por um processo."""
+    index: int
+    database: str
+    table: str
+    columns: List[str]
+    first_id: int
+    last_id: int
+    path: str
+    format: ExportFormat
+    chunk_size: int
+
+
+class ShardResult(BaseModel):
+    """Arquivo escrito por um shard."""
+    index: int
+    file: str
+    first_id: int
+    last_id: int
+    rows: int
+    bytes: int
+    elapsed: float
+
+
+class ExportResult(BaseModel):
+    """Resumo de uma exportacao, gravado como ``manifest.json``."""
+    entity: ExportEntity
+    format: ExportFormat
+    columns: List[str]
+    created_at: datetime
+    workers: int
+    shards: List[ShardResult] = []
+    merged: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return sum(shard.rows for shard in self.shards)
+
+    @property
+    def bytes(self) -> int:
+        return sum(shard.bytes for shard in self.shards)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
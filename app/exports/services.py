@@ -0,0 +1,198 @@
+import os
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+
+from sqlmodel import Session, func, select
+
+from app.employees.models import COUNTER_FIELDS as EMPLOYEE_COUNTERS, Employee
+from app.exports.schemas import ExportEntity, ExportFormat, ExportResult, ShardResult, ShardSpec
+from app.output import OutputFormat, write_rows
+from app.tasks.models import Task
+from app.teams.models import COUNTER_FIELDS as TEAM_COUNTERS, Team
+
+# Linhas lidas do cursor e formatadas por vez em cada processo.
+DEFAULT_CHUNK_SIZE = 5000
+
+MANIFEST_NAME = "manifest.json"
+
+# Modelo de cada entidade e colunas que nao sao exportadas (os contadores
+# sao derivados das tarefas e recalculados por triggers).
+EXPORT_MODELS = {
+    ExportEntity.TEAMS: (Team, TEAM_COUNTERS),
+    ExportEntity.EMPLOYEES: (Employee, EMPLOYEE_COUNTERS),
+    ExportEntity.TASKS: (Task, ()),
+}
+
+
+def export_columns(entity: ExportEntity) -> List[str]:
+    model, skipped = EXPORT_MODELS[entity]
+    return [column.name for column in model.__table__.columns if column.name not in skipped]
+
+
+def read_only_connection(database: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{quote(database)}?mode=ro", uri=True)
+
+
+def export_shard(spec: ShardSpec) -> ShardResult:
+    """Escreve as linhas de ``spec`` em ``spec.path``; roda em um processo do pool.
+
+    Usa o ``sqlite3`` direto, com uma conexao somente leitura propria: os
+    valores saem como gravados (ex.: status ``PENDING``), sem ORM nem Enums.
+    """
+    started = time.perf_counter()
+    connection = read_only_connection(spec.database)
+    try:
+        cursor = connection.execute(
+            f"SELECT {', '.join(spec.columns)} FROM {spec.table} WHERE id BETWEEN ? AND ? ORDER BY id",
+            (spec.first_id, spec.last_id)
+        )
+        chunks = iter(lambda: cursor.fetchmany(spec.chunk_size), [])
+        with open(spec.path, "w", newline="", encoding="utf-8") as out:
+            rows = write_rows(OutputFormat(spec.format.value), spec.columns, chunks, out)
+    finally:
+        connection.close()
+
+    return ShardResult(
+        index=spec.index,
+        file=Path(spec.path).name,
+        first_id=spec.first_id,
+        last_id=spec.last_id,
+        rows=rows,
+        bytes=os.path.getsize(spec.path),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def merge_shards(paths: List[Path], format: ExportFormat, target: Path):
+    """Concatena os arquivos dos shards; CSV e TSV mantem apenas o primeiro cabecalho."""
+    with open(target, "wb") as out:
+        for index, path in enumerate(paths):
+            with open(path, "rb") as shard:
+                if index and format != ExportFormat.JSONL:
+                    shard.readline()
+                shutil.copyfileobj(shard, out, 1024 * 1024)
+
+
+def remove_previous_export(out_dir: Path, entity: ExportEntity, format: ExportFormat):
+    """Apaga shards e arquivo unico de uma exportacao anterior de ``entity`` no mesmo formato.
+
+    Sem isso, shards de uma execucao com mais faixas ficariam no diretorio
+    sem aparecer no novo manifesto.
+    """
+    for path in out_dir.glob(f"{entity.value}-[0-9]*.{format.value}"):
+        path.unlink()
+    (out_dir / f"{entity.value}.{format.value}").unlink(missing_ok=True)
+
+
+class ExportService:
+    """Exporta tabelas em shards por faixa de ids, um processo por shard.
+
+    As faixas tem o mesmo numero de linhas. Cada processo abre sua propria
+    conexao somente leitura e escreve um arquivo; em WAL, cada shard le o
+    banco como estava ao iniciar, sem bloquear as escritas.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def database_path(self) -> str:
+        url = self.session.get_bind().url
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            raise ValueError("A exportacao paralela exige um banco SQLite em arquivo.")
+        return str(Path(url.database).resolve())
+
+    def plan_ranges(self, entity: ExportEntity, shards: int) -> List[Tuple[int, int]]:
+        """Divide os ids de ``entity`` em ate ``shards`` faixas ``(primeiro, ultimo)`` com o mesmo numero de linhas."""
+        model, _ = EXPORT_MODELS[entity]
+        total = self.session.exec(select(func.count(model.id))).one()
+        if not total:
+            return []
+
+        # Uma passada pelo indice da chave primaria acha o primeiro id de cada
+        # faixa, pela posicao da linha; as faixas diferem em no maximo uma linha.
+        positions = sorted({index * total // shards + 1 for index in range(shards)})
+        numbered = select(model.id, func.row_number().over(order_by=model.id).label("number")).subquery()
+        firsts = self.session.exec(
+            select(numbered.c.id).where(numbered.c.number.in_(positions)).order_by(numbered.c.id)
+        ).all()
+        last = self.session.exec(select(func.max(model.id))).one()
+        return [(first, following - 1) for first, following in zip(firsts, firsts[1:])] + [(firsts[-1], last)]
+
+    def export(
+        self,
+        entity: ExportEntity,
+        out_dir: Path,
+        format: ExportFormat = ExportFormat.CSV,
+        shards: Optional[int] = None,
+        workers: Optional[int] = None,
+        merge: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> ExportResult:
+        """Exporta ``entity`` para ``out_dir``: um arquivo por shard e ``manifest.json``.
+
+        Com ``merge`` os shards sao concatenados em ``<entidade>.<formato>``
+        e removidos.
+        """
+        started = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        database = self.database_path()
+        columns = export_columns(entity)
+        model, _ = EXPORT_MODELS[entity]
+        ranges = self.plan_ranges(entity, shards or workers)
+        # A leitura dos limites nao deve manter uma transacao aberta durante a exportacao.
+        self.session.commit()
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        remove_previous_export(out_dir, entity, format)
+        specs = [
+            ShardSpec(
+                index=index,
+                database=database,
+                table=model.__tablename__,
+                columns=columns,
+                first_id=first_id,
+                last_id=last_id,
+                path=str(out_dir / f"{entity.value}-{index:05d}.{format.value}"),
+                format=format,
+                chunk_size=chunk_size,
+            )
+            for index, (first_id, last_id) in enumerate(ranges)
+        ]
+
+        workers = max(1, min(workers, len(specs)))
+        if workers == 1:
+            shard_results = list(map(export_shard, specs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shard_results = list(executor.map(export_shard, specs))
+
+        result = ExportResult(
+            entity=entity,
+            format=format,
+            columns=columns,
+            created_at=datetime.now(),
+            workers=workers,
+            shards=shard_results,
+        )
+
+        if merge:
+            target = out_dir / f"{entity.value}.{format.value}"
+            paths = [Path(spec.path) for spec in specs]
+            if paths:
+                merge_shards(paths, format, target)
+            else:
+                with open(target, "w", newline="", encoding="utf-8") as out:
+                    write_rows(OutputFormat(format.value), columns, [], out)
+            for path in paths:
+                path.unlink()
+            result.merged = target.name
+
+        result.elapsed = time.perf_counter() - started
+        (out_dir / MANIFEST_NAME).write_text(result.model_dump_json(indent=2) + "\n", encoding="utf-8")
+        return result
@@ -0,0 +1 @@
+from . import schemas
\ No newline at end of file
@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from app.database import session_scope
+from app.imports.schemas import ImportEntity, ImportFormat, ImportResult
+from app.imports.services import DEFAULT_BATCH_SIZE, ImportService
+
+console = Console()
+
+app = typer.Typer(help="Importação em lote a partir de arquivos CSV ou JSONL")
+
+MAX_ERRORS_SHOWN = 20
+
+
+def run_import(entity: ImportEntity, path: Path, format: Optional[ImportFormat], batch_size: int):
+    with session_scope() as session:
+        service = ImportService(session, batch_size=batch_size)
+
+        try:
+            result = service.import_file(entity, path, format)
+        except Exception as e:
+            console.print(f"[red]Erro ao importar {entity.value}: {e}[/red]")
+            raise typer.Exit(1)
+
+        print_result(result)
+
+        if result.errors:
+            raise typer.Exit(1)
+
+
+def print_result(result: ImportResult):
+    border = "yellow" if result.errors else "green"
+    console.print(
+        Panel(
+            f"Linhas lidas: {result.total}\n"
+            f"Importadas: {result.imported}\n"
+            f"Com erro: {len(result.errors)}\n"
+            f"Tempo: {result.elapsed:.2f}s ({result.rows_per_second:,.0f} linhas/s)",
+            title=f"📥 Importação de {result.entity.value}",
+            border_style=border
+        )
+    )
+
+    if not result.errors:
+        return
+
+    table = Table(title="Linhas rejeitadas")
+    table.add_column("Linha", style="cyan", justify="right")
+    table.add_column("Erro", style="red")
+    for error in result.errors[:MAX_ERRORS_SHOWN]:
+        table.add_row(str(error.line), error.message)
+    console.print(table)
+
+    if len(result.errors) > MAX_ERRORS_SHOWN:
+        console.print(f"[dim]... e mais {len(result.errors) - MAX_ERRORS_SHOWN} erros.[/dim]")
+
+
+def file_argument():
+    return typer.Argument(..., exists=True, dir_okay=False, readable=True, help="Arquivo CSV ou JSONL")
+
+
+def format_option():
+    return typer.Option(None, "--format", "-f", help="Formato do arquivo (padrão: pela extensão)")
+
+
+def batch_size_option():
+    return typer.Option(DEFAULT_BATCH_SIZE, "--batch-size", min=1, help="Linhas inseridas por transação")
+
+
+@app.command("teams")
+def import_teams(
+    path: Path = file_argument(),
+    format: Optional[ImportFormat] = format_option(),
+    batch_size: int = batch_size_option()
+):
+    run_import(ImportEntity.TEAMS, path, format, batch_size)
+
+
+@app.command("employees")
+def import_employees(
+    path: Path = file_argument(),
+    format: Optional[ImportFormat] = format_option(),
+    batch_size: int = batch_size_option()
+):
+    run_import(ImportEntity.EMPLOYEES, path, format, batch_size)
+
+
+@app.command("tasks")
+def import_tasks(
+    path: Path = file_argument(),
+    format: Optional[ImportFormat] = format_option(),
+    batch_size: int = batch_size_option()
+):
+    run_import(ImportEntity.TASKS, path, format, batch_size)
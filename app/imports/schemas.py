@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import List
+from pydantic import BaseModel
+
+
+class ImportEntity(str, Enum):
+    """Entidades aceitas pelo comando de importacao."""
+    TEAMS = "teams"
+    EMPLOYEES = "employees"
+    TASKS = "tasks"
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class ImportRowError(BaseModel):
+    """Erro de uma linha do arquivo importado."""
+    line: int
+    message: str
+
+
+class ImportResult(BaseModel):
+    """Resumo de uma importacao em lote."""
+    entity: ImportEntity
+    total: int = 0
+    imported: int = 0
+    errors: List[ImportRowError] = []
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
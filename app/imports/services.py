@@ -0,0 +1,169 @@
+import csv
+import json
+import time
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.employees import utils
+from app.employees.models import Employee
+from app.employees.schemas import EmployeeCreate
+from app.imports.schemas import ImportEntity, ImportFormat, ImportResult, ImportRowError
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate
+from app.teams.models import Team
+from app.teams.schemas import TeamCreate
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Linhas que nao puderam ser lidas chegam como ``ValueError`` no lugar dos dados.
+Row = Tuple[int, Union[Dict[str, Any], ValueError]]
+
+
+def detect_format(path: Path) -> ImportFormat:
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        return ImportFormat.JSONL
+    return ImportFormat.CSV
+
+
+def read_rows(path: Path, format: Optional[ImportFormat] = None) -> Iterator[Row]:
+    """Le o arquivo linha a linha, devolvendo ``(numero_da_linha, dados)``.
+
+    Uma linha malformada nao interrompe a leitura: vira um ``ValueError``
+    registrado como erro daquela linha.
+    """
+    format = format or detect_format(path)
+
+    with open(path, newline="", encoding="utf-8") as file:
+        if format == ImportFormat.CSV:
+            reader = csv.DictReader(file)
+            for row in reader:
+                if None in row:
+                    yield reader.line_num, ValueError("Linha com mais campos que o cabecalho.")
+                    continue
+                # Campos vazios no CSV usam o valor padrao do schema.
+                yield reader.line_num, {k: v for k, v in row.items() if v not in ("", None)}
+        else:
+            for line_number, line in enumerate(file, start=1):
+                if line.strip():
+                    yield line_number, parse_json_line(line)
+
+
+def parse_json_line(line: str) -> Union[Dict[str, Any], ValueError]:
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        return ValueError(f"JSON invalido: {e.msg}.")
+    if not isinstance(data, dict):
+        return ValueError("A linha deve ser um objeto JSON.")
+    return data
+
+
+def parse_priority(value: Any) -> Any:
+    """Aceita a prioridade pelo nome (``high``) alem do valor numerico."""
+    if isinstance(value, str):
+        if value.upper() in TaskPriority.__members__:
+            return TaskPriority[value.upper()]
+        if value.isdigit():
+            return int(value)
+    return value
+
+
+class ImportService:
+    """Importa times, funcionarios e tarefas em lotes com executemany."""
+
+    def __init__(self, session: Session, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.session = session
+        self.batch_size = batch_size
+
+    def import_file(self, entity: ImportEntity, path: Path, format: Optional[ImportFormat] = None) -> ImportResult:
+        return self.import_rows(entity, read_rows(path, format))
+
+    def import_rows(self, entity: ImportEntity, rows: Iterable[Row]) -> ImportResult:
+        result = ImportResult(entity=entity)
+        started = time.perf_counter()
+
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            result.total += len(batch)
+            valid = []
+
+            for line, data in batch:
+                try:
+                    if isinstance(data, ValueError):
+                        raise data
+                    valid.append((line, self._to_values(entity, data)))
+                except (ValidationError, ValueError, TypeError) as e:
+                    result.errors.append(ImportRowError(line=line, message=self._format_error(e)))
+
+            result.imported += self._insert_batch(entity, valid, result.errors)
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _to_values(self, entity: ImportEntity, data: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now()
+
+        if entity == ImportEntity.TEAMS:
+            schema = TeamCreate(**data)
+            return {"name": schema.name, "description": schema.description, "created_at": now}
+
+        if entity == ImportEntity.EMPLOYEES:
+            schema = EmployeeCreate(**data)
+            if not utils.validate_email(schema.email):
+                raise ValueError("Email invalido.")
+            return {"name": schema.name, "email": schema.email, "team_id": schema.team_id, "created_at": now}
+
+        if "priority" in data:
+            data = {**data, "priority": parse_priority(data["priority"])}
+        schema = TaskCreate(**data)
+        return {
+            "title": schema.title,
+            "description": schema.description,
+            "team_id": schema.team_id,
+            "owner_id": schema.owner_id,
+            "priority": schema.priority,
+            "status": TaskStatus.PENDING,
+            "created_at": now,
+        }
+
+    def _insert_batch(self, entity: ImportEntity, valid: List[Tuple[int, Dict[str, Any]]], errors: List[ImportRowError]) -> int:
+        if not valid:
+            return 0
+
+        model = {ImportEntity.TEAMS: Team, ImportEntity.EMPLOYEES: Employee, ImportEntity.TASKS: Task}[entity]
+        statement = insert(model)
+
+        try:
+            self.session.exec(statement, params=[values for _, values in valid])
+            self.session.commit()
+            return len(valid)
+        except IntegrityError:
+            self.session.rollback()
+
+        # Algum registro do lote violou uma restricao: reinsere linha a linha
+        # com savepoints para isolar apenas as linhas com erro.
+        imported = 0
+        for line, values in valid:
+            try:
+                with self.session.begin_nested():
+                    self.session.exec(statement, params=values)
+                imported += 1
+            except IntegrityError as e:
+                errors.append(ImportRowError(line=line, message=str(e.orig)))
+        self.session.commit()
+        return imported
+
+    @staticmethod
+    def _format_error(error: Exception) -> str:
+        if isinstance(error, ValidationError):
+            return "; ".join(
+                f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in error.errors()
+            )
+        return str(error)
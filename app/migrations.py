@@ -0,0 +1,162 @@
+from sqlalchemy import Connection, Engine, event, inspect, text
+from sqlalchemy.schema import CreateColumn
+from sqlmodel import SQLModel
+
+from app.schema_sql import (
+    COUNTER_DDL,
+    COUNTER_TRIGGER_PREFIX,
+    LEGACY_REPORT_DELETIONS_TABLE,
+    LEGACY_REPORT_TRIGGER,
+    REPORT_DDL,
+    REPORT_QUEUE_TABLE,
+    TASK_COUNTER_TABLES,
+    TASK_COUNTERS,
+    TASK_SEARCH_DDL,
+    TASK_SEARCH_TABLE,
+)
+
+
+def upgrade(engine: Engine):
+    """Atualiza um banco ja existente para o schema atual dos modelos.
+
+    ``create_all`` so cria tabelas que ainda nao existem; as alteracoes em
+    tabelas existentes sao aplicadas aqui e devem ser idempotentes.
+    """
+    create_missing_indexes(engine)
+    with engine.begin() as connection:
+        create_missing_columns(connection)
+        create_task_search(connection)
+        create_counters(connection)
+        create_report_tracking(connection)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def create_sqlite_objects(target, connection, **kw):
+    # Ao final do ``create_all``, quando ``tasks``, ``teams``, ``employees`` e
+    # as tabelas dos relatorios ja existem. Todos os passos sao idempotentes.
+    if "tasks" not in target.tables:
+        return
+    create_task_search(connection)
+    create_counters(connection)
+    create_report_tracking(connection)
+
+
+def create_missing_indexes(engine: Engine):
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
+def create_missing_columns(connection: Connection):
+    """Adiciona com ``ALTER TABLE`` as colunas novas dos modelos.
+
+    As colunas adicionadas precisam aceitar nulo ou ter ``server_default``.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=connection.dialect)
+                connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+
+
+def create_counters(connection: Connection):
+    """Cria os triggers dos contadores de times e funcionarios.
+
+    Tambem chamado ao final do ``create_all``. Se os triggers
+    ainda nao existiam, os contadores sao recalculados a partir das tabelas.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name LIKE :prefix"),
+        {"prefix": f"{COUNTER_TRIGGER_PREFIX}%"}
+    ).first()
+
+    for statement in COUNTER_DDL:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        recount_counters(connection)
+
+
+def recount_counters(connection: Connection):
+    """Recalcula todos os contadores com uma agregacao por tabela.
+
+    Zera os contadores e aplica as contagens com ``UPDATE ... FROM``, entao
+    pais sem filhos tambem ficam corretos.
+    """
+    totals = ", ".join(
+        f"sum({condition.format(row='tasks')}) AS {column}" for column, condition in TASK_COUNTERS.items()
+    )
+    assignments = ", ".join(f"{column} = counts.{column}" for column in TASK_COUNTERS)
+    zeros = ", ".join(f"{column} = 0" for column in TASK_COUNTERS)
+
+    for table, key in TASK_COUNTER_TABLES:
+        connection.exec_driver_sql(f"UPDATE {table} SET {zeros}")
+        connection.exec_driver_sql(
+            f"UPDATE {table} SET {assignments} FROM ("
+            f"SELECT {key} AS parent_id, {totals} FROM tasks WHERE {key} IS NOT NULL GROUP BY {key}"
+            f") AS counts WHERE {table}.id = counts.parent_id"
+        )
+
+    connection.exec_driver_sql("UPDATE teams SET employees_count = 0")
+    connection.exec_driver_sql(
+        "UPDATE teams SET employees_count = counts.total FROM ("
+        "SELECT team_id, count(*) AS total FROM employees GROUP BY team_id"
+        ") AS counts WHERE teams.id = counts.team_id"
+    )
+
+
+def create_report_tracking(connection: Connection):
+    """Cria os triggers da fila de tarefas alteradas para os relatorios.
+
+    So tem efeito quando as tabelas de ``app.reports`` existem; tambem e
+    chamado ao final do ``create_all``. Ids que estavam na fila antiga de
+    exclusoes passam para a nova.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    tables = {
+        name for name, in connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (:queue, :legacy)"),
+            {"queue": REPORT_QUEUE_TABLE, "legacy": LEGACY_REPORT_DELETIONS_TABLE}
+        )
+    }
+    if REPORT_QUEUE_TABLE not in tables:
+        return
+
+    for statement in REPORT_DDL:
+        connection.exec_driver_sql(statement)
+    if LEGACY_REPORT_DELETIONS_TABLE in tables:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {LEGACY_REPORT_TRIGGER}")
+        connection.exec_driver_sql(
+            f"INSERT OR IGNORE INTO {REPORT_QUEUE_TABLE} (task_id) SELECT task_id FROM {LEGACY_REPORT_DELETIONS_TABLE}"
+        )
+        connection.exec_driver_sql(f"DROP TABLE {LEGACY_REPORT_DELETIONS_TABLE}")
+
+
+def create_task_search(connection: Connection):
+    """Cria o indice FTS5 das tarefas e seus triggers, se ainda nao existirem.
+
+    Tambem chamado ao final do ``create_all``. Em um banco que
+    ja tinha tarefas, o indice e reconstruido a partir delas.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": TASK_SEARCH_TABLE}
+    ).first()
+
+    for statement in TASK_SEARCH_DDL:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        connection.exec_driver_sql(f"INSERT INTO {TASK_SEARCH_TABLE}({TASK_SEARCH_TABLE}) VALUES ('rebuild')")
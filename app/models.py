@@ -0,0 +1,7 @@
+# Todos os modelos de tabela. Os relacionamentos de Team, Employee e Task se
+# referenciam pelo nome, entao o mapper so pode ser configurado depois que
+# todos foram importados: importar este modulo registra cada um deles.
+from app.employees.models import Employee  # noqa: F401
+from app.reports.models import EmployeeReport, TeamReport  # noqa: F401
+from app.tasks.models import Task  # noqa: F401
+from app.teams.models import Team  # noqa: F401
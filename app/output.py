@@ -0,0 +1,68 @@
+import csv
+import json
+import sys
+from enum import Enum
+from typing import Iterable, Optional, Sequence, TextIO
+
+
+class OutputFormat(str, Enum):
+    TABLE = "table"
+    JSON = "json"
+    JSONL = "jsonl"
+    CSV = "csv"
+    TSV = "tsv"
+
+
+def tsv_cell(value) -> str:
+    if value is None:
+        return ""
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def write_rows(
+    format: OutputFormat,
+    header: Sequence[str],
+    chunks: Iterable[Sequence[tuple]],
+    out: Optional[TextIO] = None
+) -> int:
+    """Escreve blocos de tuplas em ``format`` conforme chegam do cursor.
+
+    Cada bloco e escrito e descartado antes do proximo, entao a memoria nao
+    depende do total de linhas. Retorna o numero de linhas escritas.
+    """
+    out = out or sys.stdout
+    written = 0
+
+    if format == OutputFormat.CSV:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(header)
+        for rows in chunks:
+            writer.writerows(rows)
+            written += len(rows)
+
+    elif format == OutputFormat.TSV:
+        out.write("\t".join(header) + "\n")
+        for rows in chunks:
+            out.write("".join("\t".join(map(tsv_cell, row)) + "\n" for row in rows))
+            written += len(rows)
+
+    elif format == OutputFormat.JSONL:
+        for rows in chunks:
+            out.write("".join(json.dumps(dict(zip(header, row)), ensure_ascii=False) + "\n" for row in rows))
+            written += len(rows)
+
+    elif format == OutputFormat.JSON:
+        # Array escrito incrementalmente: nunca ha uma lista com todas as linhas.
+        out.write("[")
+        for rows in chunks:
+            out.write("".join(
+                (",\n" if written + index else "\n") + json.dumps(dict(zip(header, row)), ensure_ascii=False)
+                for index, row in enumerate(rows)
+            ))
+            written += len(rows)
+        out.write("\n]\n" if written else "]\n")
+
+    else:
+        raise ValueError(f"Formato sem suporte a streaming: {format.value}")
+
+    return written
@@ -0,0 +1,46 @@
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def paginate(statement, id_column, limit: Optional[int] = None, after_id: Optional[int] = None):
+    """Aplica paginacao por cursor (keyset) sobre a chave primaria.
+
+    Em vez de OFFSET, filtra ``id > after_id`` e ordena pelo id, de forma
+    que o custo de cada pagina nao depende da posicao na tabela.
+    """
+    if after_id is not None:
+        statement = statement.where(id_column > after_id)
+    statement = statement.order_by(id_column)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def iter_pages(
+    fetch_page: Callable[..., List[T]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> Iterator[List[T]]:
+    """Percorre as paginas de ``fetch_page(limit=..., after_id=...)``.
+
+    Cada pagina tem no maximo ``page_size`` itens e o total nao passa de
+    ``limit``. O cursor avanca pelo ``id`` do ultimo item de cada pagina.
+    """
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page = fetch_page(limit=size, after_id=after_id)
+        if not page:
+            return
+
+        yield page
+
+        if remaining is not None:
+            remaining -= len(page)
+        if len(page) < size:
+            return
+        after_id = page[-1].id
@@ -0,0 +1,230 @@
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+
+# Categorias do relatorio, identificadas pelo caminho do arquivo da funcao.
+# Funcoes C do sqlite3 aparecem no cProfile como "<method ... 'sqlite3.Cursor'>".
+CATEGORY_PATTERNS = (
+    ("SQL", ("sqlite3", "/sqlalchemy/engine/", "/sqlalchemy/dialects/", "/sqlalchemy/pool/", "/sqlalchemy/sql/")),
+    ("ORM", ("/sqlalchemy/orm/", "/sqlmodel/")),
+    ("Pydantic", ("/pydantic/", "/pydantic_core/")),
+    ("Rich", ("/rich/",)),
+)
+OTHER_CATEGORY = "Outro"
+
+# Niveis de chamadores percorridos para classificar funcoes genericas
+# (ex.: ``sqlalchemy.util`` chamado pelo ORM).
+MAX_CALLER_DEPTH = 5
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+TOP_HOTSPOTS = 15
+
+# (arquivo, linha, funcao), como nas chaves do pstats.
+FunctionKey = Tuple[str, int, str]
+
+
+def normalize_path(filename: str) -> str:
+    return filename.replace("\\", "/")
+
+
+def categorize(filename: str, function: str = "") -> Optional[str]:
+    location = normalize_path(filename) + " " + function
+    for category, patterns in CATEGORY_PATTERNS:
+        if any(pattern in location for pattern in patterns):
+            return category
+    return None
+
+
+def format_function(key: FunctionKey) -> str:
+    filename, line, function = key
+    if filename == "~":
+        return function
+    return f"{function} ({normalize_path(filename).rsplit('/', 1)[-1]}:{line})"
+
+
+class Hotspot:
+    __slots__ = ("function", "calls", "self_ms", "total_ms")
+
+    def __init__(self, function: str, calls: Optional[int], self_ms: float, total_ms: float):
+        self.function = function
+        self.calls = calls
+        self.self_ms = self_ms
+        self.total_ms = total_ms
+
+
+class ProfileReport:
+    def __init__(self, mode: str, elapsed_ms: float, categories: Dict[str, float], hotspots: List[Hotspot]):
+        self.mode = mode
+        self.elapsed_ms = elapsed_ms
+        self.categories = categories
+        self.hotspots = hotspots
+
+    def print(self, console: Console, top: int = TOP_HOTSPOTS):
+        total = sum(self.categories.values()) or 1.0
+        categories_ms = {category: 0.0 for category, _ in CATEGORY_PATTERNS}
+        categories_ms[OTHER_CATEGORY] = 0.0
+        categories_ms.update(self.categories)
+
+        categories = Table(title=f"⏱️ Perfil ({self.mode}) - {self.elapsed_ms:.1f}ms")
+        categories.add_column("Categoria", style="cyan")
+        categories.add_column("ms", justify="right")
+        categories.add_column("%", justify="right")
+        for category, ms in sorted(categories_ms.items(), key=lambda item: item[1], reverse=True):
+            categories.add_row(category, f"{ms:.1f}", f"{ms / total * 100:.1f}")
+        console.print(categories)
+
+        hotspots = Table(title="🔥 Hotspots")
+        hotspots.add_column("Função", style="magenta", overflow="fold")
+        hotspots.add_column("Chamadas", justify="right")
+        hotspots.add_column("Próprio ms", justify="right")
+        hotspots.add_column("Acumulado ms", justify="right")
+        for hotspot in self.hotspots[:top]:
+            hotspots.add_row(
+                escape(hotspot.function),
+                "-" if hotspot.calls is None else str(hotspot.calls),
+                f"{hotspot.self_ms:.1f}",
+                f"{hotspot.total_ms:.1f}"
+            )
+        console.print(hotspots)
+
+
+class CommandProfiler:
+    """Perfila o comando com cProfile (deterministico) ou por amostragem.
+
+    No modo ``sample`` uma thread le a pilha da thread principal a cada
+    ``interval`` segundos, com custo baixo e independente do numero de
+    chamadas. Com ``output`` o cProfile grava um ``.prof`` (pstats) e a
+    amostragem grava pilhas no formato "folded" usado por flamegraphs.
+    """
+
+    def __init__(self, mode: str = "cprofile", output: Optional[str] = None, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        if mode not in ("cprofile", "sample"):
+            raise ValueError(f"Modo de perfil desconhecido: {mode}. Opcoes: cprofile, sample")
+        self.mode = mode
+        self.output = output
+        self.interval = interval
+        self._profile: Optional[cProfile.Profile] = None
+        self._samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self._elapsed = 0.0
+
+    def start(self) -> "CommandProfiler":
+        self._started_at = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._thread = threading.Thread(
+                target=self._sample, args=(threading.get_ident(),), name="command-profiler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> ProfileReport:
+        if self.mode == "cprofile":
+            self._profile.disable()
+        else:
+            self._stop.set()
+            self._thread.join()
+        self._elapsed = time.perf_counter() - self._started_at
+
+        if self.output:
+            self._write_output()
+        return self._cprofile_report() if self.mode == "cprofile" else self._sample_report()
+
+    def _sample(self, thread_id: int):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self._samples[tuple(stack)] += 1
+
+    def _write_output(self):
+        if self.mode == "cprofile":
+            self._profile.dump_stats(self.output)
+            return
+        with open(self.output, "w", encoding="utf-8") as file:
+            for stack, count in self._samples.items():
+                frames = ";".join(format_function(key) for key in reversed(stack))
+                file.write(f"{frames} {count}\n")
+
+    def _cprofile_report(self) -> ProfileReport:
+        stats = pstats.Stats(self._profile).stats
+        memo: Dict[FunctionKey, Dict[str, float]] = {}
+
+        def weights(key: FunctionKey, depth: int) -> Dict[str, float]:
+            # Classifica pela propria funcao ou, se generica, pelos chamadores
+            # proporcionalmente ao tempo acumulado vindo de cada um.
+            if key in memo:
+                return memo[key]
+            category = categorize(key[0], key[2])
+            if category:
+                result = {category: 1.0}
+            else:
+                callers = stats[key][4] if key in stats else {}
+                total = sum(caller[3] for caller in callers.values())
+                if depth >= MAX_CALLER_DEPTH or not callers or total <= 0:
+                    result = {OTHER_CATEGORY: 1.0}
+                else:
+                    result = {}
+                    memo[key] = {OTHER_CATEGORY: 1.0}  # quebra ciclos de recursao
+                    for caller, timing in callers.items():
+                        for name, share in weights(caller, depth + 1).items():
+                            result[name] = result.get(name, 0.0) + share * timing[3] / total
+            memo[key] = result
+            return result
+
+        categories: Dict[str, float] = {}
+        hotspots = []
+        for key, (_, calls, self_time, total_time, _) in stats.items():
+            for name, share in weights(key, 0).items():
+                categories[name] = categories.get(name, 0.0) + self_time * share * 1000
+            hotspots.append(Hotspot(format_function(key), calls, self_time * 1000, total_time * 1000))
+
+        hotspots.sort(key=lambda hotspot: hotspot.self_ms, reverse=True)
+        return ProfileReport("cProfile", self._elapsed * 1000, categories, hotspots)
+
+    def _sample_report(self) -> ProfileReport:
+        total_samples = sum(self._samples.values())
+        sample_ms = self._elapsed * 1000 / total_samples if total_samples else 0.0
+
+        categories: Counter = Counter()
+        own: Counter = Counter()
+        cumulative: Counter = Counter()
+        for stack, count in self._samples.items():
+            # A amostra conta para a funcao mais interna de uma categoria
+            # conhecida; codigo generico herda a categoria de quem o chamou.
+            category = next(
+                (found for found in (categorize(key[0], key[2]) for key in stack) if found),
+                OTHER_CATEGORY
+            )
+            categories[category] += count
+            own[stack[0]] += count
+            for key in set(stack):
+                cumulative[key] += count
+
+        hotspots = [
+            Hotspot(format_function(key), None, count * sample_ms, cumulative[key] * sample_ms)
+            for key, count in own.most_common()
+        ]
+        return ProfileReport(
+            f"amostragem, {total_samples} amostras",
+            self._elapsed * 1000,
+            {category: count * sample_ms for category, count in categories.items()},
+            hotspots
+        )
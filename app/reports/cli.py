@@ -0,0 +1,138 @@
+from typing import Optional
+
+import typer
+
+from rich.console import Console
+from rich.table import Table
+
+from app.database import session_scope
+from app.output import OutputFormat, write_rows
+from app.reports.schemas import ReportRefreshResult
+from app.reports.services import EMPLOYEE_REPORT_COLUMNS, TEAM_REPORT_COLUMNS, ReportService
+
+console = Console()
+
+app = typer.Typer(help="Relatórios por time e por funcionário")
+
+FULL_HELP = "Reconstrói os relatórios em vez de aplicar apenas as alterações"
+NO_REFRESH_HELP = "Mostra os relatórios como estão, sem atualizá-los"
+
+
+def refresh_caption(result: Optional[ReportRefreshResult]) -> Optional[str]:
+    if result is None:
+        return None
+    mode = "reconstruído" if result.full else "incremental"
+    return f"Atualizado em {result.watermark:%d/%m/%Y %H:%M:%S} ({mode}, {result.changed} tarefa(s) processada(s))"
+
+
+def completion(completed: int, total: int) -> str:
+    return f"{completed / total * 100:.0f}%" if total else "-"
+
+
+def add_measure_columns(table: Table):
+    table.add_column("Tarefas", justify="right", style="cyan")
+    table.add_column("Pendentes", justify="right")
+    table.add_column("Em Progresso", justify="right")
+    table.add_column("Finalizadas", justify="right")
+    table.add_column("Conclusão", justify="right", style="green")
+    table.add_column("Alta", justify="right")
+    table.add_column("Alta abertas", justify="right", style="red")
+
+
+def measure_cells(row) -> list:
+    return [
+        str(row.tasks_count),
+        str(row.pending_count),
+        str(row.in_progress_count),
+        str(row.completed_count),
+        completion(row.completed_count, row.tasks_count),
+        str(row.high_priority_count),
+        str(row.high_priority_open_count),
+    ]
+
+
+@app.command("refresh")
+def refresh(full: bool = typer.Option(False, "--full", help=FULL_HELP)):
+    with session_scope() as session:
+        try:
+            result = ReportService(session).refresh(full)
+        except Exception as e:
+            console.print(f"[red]Erro ao atualizar relatórios: {e}[/red]")
+            raise typer.Exit(1)
+
+        console.print(f"[green]{refresh_caption(result)}[/green]")
+
+
+@app.command("team")
+def team_report(
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Número máximo de times listados"),
+    full: bool = typer.Option(False, "--full", help=FULL_HELP),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help=NO_REFRESH_HELP),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", "-f", help="Formato da saída")
+):
+    with session_scope() as session:
+        service = ReportService(session)
+        try:
+            result = None if no_refresh else service.refresh(full)
+            rows = service.get_team_report(limit)
+
+            if format != OutputFormat.TABLE:
+                write_rows(format, TEAM_REPORT_COLUMNS, [rows])
+                return
+
+            if not rows:
+                console.print("[yellow]Nenhuma tarefa nos relatórios.[/yellow]")
+                return
+
+            table = Table(title="📊 Relatório por Time", caption=refresh_caption(result))
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Time", style="magenta")
+            add_measure_columns(table)
+            for row in rows:
+                table.add_row(str(row.team_id), row.team_name or f"#{row.team_id}", *measure_cells(row))
+
+            console.print(table)
+        except Exception as e:
+            console.print(f"[red]Erro ao gerar relatório: {e}[/red]")
+            raise typer.Exit(1)
+
+
+@app.command("employee")
+def employee_report(
+    team: Optional[int] = typer.Option(None, "--team", "-t", help="Apenas funcionários deste time"),
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Número máximo de funcionários listados"),
+    full: bool = typer.Option(False, "--full", help=FULL_HELP),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help=NO_REFRESH_HELP),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", "-f", help="Formato da saída")
+):
+    with session_scope() as session:
+        service = ReportService(session)
+        try:
+            result = None if no_refresh else service.refresh(full)
+            rows = service.get_employee_report(team, limit)
+
+            if format != OutputFormat.TABLE:
+                write_rows(format, EMPLOYEE_REPORT_COLUMNS, [rows])
+                return
+
+            if not rows:
+                console.print("[yellow]Nenhuma tarefa atribuída nos relatórios.[/yellow]")
+                return
+
+            table = Table(title="👥 Relatório por Funcionário", caption=refresh_caption(result))
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Funcionário", style="magenta")
+            table.add_column("Time")
+            add_measure_columns(table)
+            for row in rows:
+                table.add_row(
+                    str(row.employee_id),
+                    row.employee_name or f"#{row.employee_id}",
+                    row.team_name or "N/A",
+                    *measure_cells(row)
+                )
+
+            console.print(table)
+        except Exception as e:
+            console.print(f"[red]Erro ao gerar relatório: {e}[/red]")
+            raise typer.Exit(1)
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class ReportCounts(SQLModel):
+    tasks_count: int = Field(default=0)
+    pending_count: int = Field(default=0)
+    in_progress_count: int = Field(default=0)
+    completed_count: int = Field(default=0)
+    high_priority_count: int = Field(default=0)
+    high_priority_open_count: int = Field(default=0)
+
+
+class TeamReport(ReportCounts, table=True):
+    __tablename__ = "team_reports"
+
+    team_id: int = Field(primary_key=True)
+
+
+class EmployeeReport(ReportCounts, table=True):
+    __tablename__ = "employee_reports"
+
+    employee_id: int = Field(primary_key=True)
+
+
+class TaskReportEntry(SQLModel, table=True):
+    """Contribuicao de cada tarefa nos relatorios no ultimo refresh.
+
+    Status e prioridade sao copiados como gravados em ``tasks`` (nome do
+    enum). No refresh seguinte, a contribuicao antiga e descontada antes de
+    somar a nova.
+    """
+    __tablename__ = "task_report_ledger"
+
+    task_id: int = Field(primary_key=True)
+    team_id: int
+    owner_id: Optional[int] = Field(default=None)
+    status: str
+    priority: str
+
+
+class ReportQueuedTask(SQLModel, table=True):
+    """Tarefa criada, alterada ou excluida desde o ultimo refresh (gravada por trigger)."""
+    __tablename__ = "report_task_queue"
+
+    task_id: int = Field(primary_key=True)
+
+
+class ReportRefresh(SQLModel, table=True):
+    __tablename__ = "report_refreshes"
+
+    name: str = Field(primary_key=True)
+    watermark: datetime
+    refreshed_at: datetime
+    changed: int = Field(default=0)
+
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+from pydantic import BaseModel
+
+
+class TeamReportRow(NamedTuple):
+    """Linha do relatorio por time."""
+    team_id: int
+    team_name: Optional[str]
+    tasks_count: int
+    pending_count: int
+    in_progress_count: int
+    completed_count: int
+    high_priority_count: int
+    high_priority_open_count: int
+
+
+class EmployeeReportRow(NamedTuple):
+    """Linha do relatorio por funcionario."""
+    employee_id: int
+    employee_name: Optional[str]
+    team_name: Optional[str]
+    tasks_count: int
+    pending_count: int
+    in_progress_count: int
+    completed_count: int
+    high_priority_count: int
+    high_priority_open_count: int
+
+
+class ReportRefreshResult(BaseModel):
+    """Resultado de um refresh dos relatorios."""
+    full: bool
+    changed: int
+    watermark: datetime
@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import Connection, column, insert, table
+from sqlmodel import Session, or_, select
+
+from app.employees.models import Employee
+from app.reports.models import EmployeeReport, ReportRefresh, TaskReportEntry, TeamReport
+from app.reports.schemas import EmployeeReportRow, ReportRefreshResult, TeamReportRow
+from app.schema_sql import REPORT_QUEUE_TABLE
+from app.tasks.models import Task
+from app.teams.models import Team
+
+
+REPORT_NAME = "tasks"
+
+# A fila gravada por triggers e a fonte exata das alteracoes. A busca por
+# ``created_at``/``updated_at`` (com esta folga antes do refresh anterior)
+# confere tambem escritas feitas sem os triggers; o ledger torna o
+# reprocessamento idempotente.
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+# Medidas dos relatorios, como condicao sobre uma linha do ledger (status e
+# prioridade gravados pelo nome do enum).
+REPORT_MEASURES = {
+    "tasks_count": "1",
+    "pending_count": "status = 'PENDING'",
+    "in_progress_count": "status = 'IN_PROGESS'",
+    "completed_count": "status = 'COMPLETED'",
+    "high_priority_count": "priority = 'HIGH'",
+    "high_priority_open_count": "priority = 'HIGH' AND status != 'COMPLETED'",
+}
+# (tabela do relatorio, chave da tabela, coluna correspondente no ledger)
+REPORT_TABLES = (
+    (TeamReport.__tablename__, "team_id", "team_id"),
+    (EmployeeReport.__tablename__, "employee_id", "owner_id"),
+)
+LEDGER_TABLE = TaskReportEntry.__tablename__
+
+# Ids das tarefas reprocessadas no refresh atual (tabela temporaria da conexao).
+CHANGED_TABLE = "report_changed_tasks"
+changed_tasks = table(CHANGED_TABLE, column("task_id"))
+CHANGED_FILTER = f"task_id IN (SELECT task_id FROM {CHANGED_TABLE})"
+
+# Colunas das linhas de ``get_team_report`` / ``get_employee_report``.
+TEAM_REPORT_COLUMNS = ("team_id", "team", *REPORT_MEASURES)
+EMPLOYEE_REPORT_COLUMNS = ("employee_id", "employee", "team", *REPORT_MEASURES)
+
+
+class ReportService:
+    """Relatorios por time e por funcionario em tabelas de resumo.
+
+    O refresh e incremental: so as tarefas criadas, alteradas ou excluidas
+    desde o ultimo refresh (registradas por trigger em uma fila) sao lidas.
+    O ledger guarda a contribuicao de cada tarefa, que e descontada antes de
+    somar os valores atuais.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def refresh(self, full: bool = False) -> ReportRefreshResult:
+        """Atualiza os relatorios; ``full`` (ou o primeiro refresh) reconstroi tudo."""
+        started = datetime.now()
+        state = self.session.exec(
+            select(ReportRefresh)
+            .where(ReportRefresh.name == REPORT_NAME)
+            .execution_options(populate_existing=True)
+        ).first()
+        full = full or state is None
+
+        try:
+            connection = self.session.connection()
+            if full:
+                changed = self._rebuild(connection)
+            else:
+                changed = self._apply_changes(connection, state.watermark - REFRESH_OVERLAP)
+
+            state = state or ReportRefresh(name=REPORT_NAME, watermark=started, refreshed_at=started)
+            state.watermark = started
+            state.refreshed_at = started
+            state.changed = changed
+            self.session.add(state)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return ReportRefreshResult(full=full, changed=changed, watermark=started)
+
+    def _rebuild(self, connection: Connection) -> int:
+        for name in (*(report for report, _, _ in REPORT_TABLES), LEDGER_TABLE, REPORT_QUEUE_TABLE):
+            connection.exec_driver_sql(f"DELETE FROM {name}")
+
+        rebuilt = connection.exec_driver_sql(
+            f"INSERT INTO {LEDGER_TABLE} (task_id, team_id, owner_id, status, priority) "
+            "SELECT id, team_id, owner_id, status, priority FROM tasks"
+        ).rowcount
+        self._add(connection, "1")
+        return rebuilt
+
+    def _apply_changes(self, connection: Connection, since: datetime) -> int:
+        connection.exec_driver_sql(f"CREATE TEMP TABLE IF NOT EXISTS {CHANGED_TABLE} (task_id INTEGER PRIMARY KEY)")
+        connection.exec_driver_sql(f"DELETE FROM {CHANGED_TABLE}")
+
+        connection.exec_driver_sql(
+            f"INSERT OR IGNORE INTO {CHANGED_TABLE} (task_id) SELECT task_id FROM {REPORT_QUEUE_TABLE}"
+        )
+        # ``created_at`` e ``updated_at`` sao indexados: o OR vira duas buscas por faixa.
+        connection.execute(insert(changed_tasks).prefix_with("OR IGNORE").from_select(
+            ["task_id"], select(Task.id).where(or_(Task.created_at >= since, Task.updated_at >= since))
+        ))
+        changed = connection.exec_driver_sql(f"SELECT count(*) FROM {CHANGED_TABLE}").scalar()
+        if not changed:
+            return 0
+
+        self._subtract(connection, CHANGED_FILTER)
+        connection.exec_driver_sql(f"DELETE FROM {LEDGER_TABLE} WHERE {CHANGED_FILTER}")
+        connection.exec_driver_sql(
+            f"INSERT INTO {LEDGER_TABLE} (task_id, team_id, owner_id, status, priority) "
+            f"SELECT id, team_id, owner_id, status, priority FROM tasks WHERE id IN (SELECT task_id FROM {CHANGED_TABLE})"
+        )
+        self._add(connection, CHANGED_FILTER)
+
+        connection.exec_driver_sql(f"DELETE FROM {REPORT_QUEUE_TABLE} WHERE {CHANGED_FILTER}")
+        for report, _, _ in REPORT_TABLES:
+            connection.exec_driver_sql(f"DELETE FROM {report} WHERE tasks_count = 0")
+        return changed
+
+    @staticmethod
+    def _sums() -> str:
+        return ", ".join(f"sum({condition}) AS {name}" for name, condition in REPORT_MEASURES.items())
+
+    def _add(self, connection: Connection, where: str):
+        names = ", ".join(REPORT_MEASURES)
+        increments = ", ".join(f"{name} = {name} + excluded.{name}" for name in REPORT_MEASURES)
+        for report, key, ledger_key in REPORT_TABLES:
+            connection.exec_driver_sql(
+                f"INSERT INTO {report} ({key}, {names}) "
+                f"SELECT {ledger_key}, {self._sums()} FROM {LEDGER_TABLE} "
+                f"WHERE {where} AND {ledger_key} IS NOT NULL GROUP BY {ledger_key} "
+                f"ON CONFLICT ({key}) DO UPDATE SET {increments}"
+            )
+
+    def _subtract(self, connection: Connection, where: str):
+        for report, key, ledger_key in REPORT_TABLES:
+            decrements = ", ".join(f"{name} = {report}.{name} - changes.{name}" for name in REPORT_MEASURES)
+            connection.exec_driver_sql(
+                f"UPDATE {report} SET {decrements} FROM ("
+                f"SELECT {ledger_key} AS parent_id, {self._sums()} FROM {LEDGER_TABLE} "
+                f"WHERE {where} AND {ledger_key} IS NOT NULL GROUP BY {ledger_key}"
+                f") AS changes WHERE {report}.{key} = changes.parent_id"
+            )
+
+    def get_team_report(self, limit: Optional[int] = None) -> List[TeamReportRow]:
+        statement = (
+            select(TeamReport.team_id, Team.name, *(getattr(TeamReport, name) for name in REPORT_MEASURES))
+            .outerjoin(Team, Team.id == TeamReport.team_id)
+            .order_by(TeamReport.team_id)
+            .limit(limit)
+        )
+        return list(map(TeamReportRow._make, self.session.connection().execute(statement)))
+
+    def get_employee_report(self, team_id: Optional[int] = None, limit: Optional[int] = None) -> List[EmployeeReportRow]:
+        statement = (
+            select(
+                EmployeeReport.employee_id,
+                Employee.name,
+                Team.name,
+                *(getattr(EmployeeReport, name) for name in REPORT_MEASURES)
+            )
+            .outerjoin(Employee, Employee.id == EmployeeReport.employee_id)
+            .outerjoin(Team, Team.id == Employee.team_id)
+            .order_by(EmployeeReport.employee_id)
+            .limit(limit)
+        )
+        if team_id is not None:
+            statement = statement.where(Employee.team_id == team_id)
+        return list(map(EmployeeReportRow._make, self.session.connection().execute(statement)))
@@ -0,0 +1,156 @@
+# SQL dos objetos do SQLite que os modelos nao descrevem (indice FTS5 e
+# triggers). Os modelos e servicos leem as constantes daqui; a criacao fica
+# em ``app.migrations``.
+
+
+# Indice de busca textual (FTS5) sobre titulo e descricao das tarefas.
+# A tabela usa ``tasks`` como conteudo externo: guarda so o indice, e os
+# triggers o mantem sincronizado. O UPDATE so reindexa quando titulo ou
+# descricao mudam, nao a cada troca de status.
+TASK_SEARCH_TABLE = "tasks_fts"
+TASK_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # Ranking padrao (coluna ``rank``): bm25 com titulo valendo 10x a descricao.
+    "INSERT INTO tasks_fts(tasks_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+)
+
+
+# Contadores desnormalizados de ``teams`` e ``employees``, mantidos pelos
+# triggers abaixo a cada insert/update/delete de tarefas e funcionarios.
+# Cada contador de tarefas e a condicao (sobre ``new``/``old``) que faz a
+# tarefa entrar nele; o status e gravado pelo nome do enum.
+TASK_COUNTERS = {
+    "tasks_count": "1",
+    "open_tasks_count": "{row}.status != 'COMPLETED'",
+    "pending_tasks_count": "{row}.status = 'PENDING'",
+    "in_progress_tasks_count": "{row}.status = 'IN_PROGESS'",
+    "completed_tasks_count": "{row}.status = 'COMPLETED'",
+}
+# (tabela, coluna de ``tasks`` que aponta para ela)
+TASK_COUNTER_TABLES = (("teams", "team_id"), ("employees", "owner_id"))
+COUNTER_TRIGGER_PREFIX = "counters_"
+
+
+def _counter_changes(row: str, sign: str) -> str:
+    return ", ".join(
+        f"{column} = {column} {sign} ({condition.format(row=row)})"
+        for column, condition in TASK_COUNTERS.items()
+    )
+
+
+def _counter_deltas() -> str:
+    return ", ".join(
+        f"{column} = {column} + ({condition.format(row='new')}) - ({condition.format(row='old')})"
+        for column, condition in TASK_COUNTERS.items()
+        if condition != "1"
+    )
+
+
+def _counter_ddl() -> list:
+    statements = []
+    for table, key in TASK_COUNTER_TABLES:
+        prefix = f"{COUNTER_TRIGGER_PREFIX}tasks_{table}"
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_insert AFTER INSERT ON tasks BEGIN
+                UPDATE {table} SET {_counter_changes('new', '+')} WHERE id = new.{key};
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_delete AFTER DELETE ON tasks BEGIN
+                UPDATE {table} SET {_counter_changes('old', '-')} WHERE id = old.{key};
+            END
+            """,
+            # Troca de status no mesmo pai: um unico UPDATE com a diferenca.
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_status AFTER UPDATE OF status, {key} ON tasks
+            WHEN old.{key} IS new.{key} AND old.status != new.status BEGIN
+                UPDATE {table} SET {_counter_deltas()} WHERE id = new.{key};
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_move AFTER UPDATE OF status, {key} ON tasks
+            WHEN old.{key} IS NOT new.{key} BEGIN
+                UPDATE {table} SET {_counter_changes('old', '-')} WHERE id = old.{key};
+                UPDATE {table} SET {_counter_changes('new', '+')} WHERE id = new.{key};
+            END
+            """,
+        ]
+
+    prefix = f"{COUNTER_TRIGGER_PREFIX}employees_teams"
+    statements += [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_insert AFTER INSERT ON employees BEGIN
+            UPDATE teams SET employees_count = employees_count + 1 WHERE id = new.team_id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_delete AFTER DELETE ON employees BEGIN
+            UPDATE teams SET employees_count = employees_count - 1 WHERE id = old.team_id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_move AFTER UPDATE OF team_id ON employees
+        WHEN old.team_id IS NOT new.team_id BEGIN
+            UPDATE teams SET employees_count = employees_count - 1 WHERE id = old.team_id;
+            UPDATE teams SET employees_count = employees_count + 1 WHERE id = new.team_id;
+        END
+        """,
+    ]
+    return statements
+
+
+COUNTER_DDL = tuple(_counter_ddl())
+
+
+# Fila das tarefas que o proximo refresh dos relatorios (``app.reports``)
+# precisa reprocessar. Os triggers gravam o id na mesma transacao da escrita,
+# entao nenhuma alteracao confirmada fica de fora, por mais longa que seja a
+# transacao. Insercoes e alteracoes so entram depois do primeiro refresh; as
+# exclusoes, apenas de tarefas ja contadas no ledger.
+REPORT_QUEUE_TABLE = "report_task_queue"
+REPORT_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS report_queue_tasks_insert AFTER INSERT ON tasks
+    WHEN EXISTS (SELECT 1 FROM report_refreshes) BEGIN
+        INSERT OR IGNORE INTO report_task_queue (task_id) VALUES (new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS report_queue_tasks_update AFTER UPDATE OF team_id, owner_id, status, priority ON tasks
+    WHEN EXISTS (SELECT 1 FROM report_refreshes) BEGIN
+        INSERT OR IGNORE INTO report_task_queue (task_id) VALUES (new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS report_queue_tasks_delete AFTER DELETE ON tasks
+    WHEN EXISTS (SELECT 1 FROM task_report_ledger WHERE task_id = old.id) BEGIN
+        INSERT OR IGNORE INTO report_task_queue (task_id) VALUES (old.id);
+    END
+    """,
+)
+# Fila antiga, so de exclusoes, substituida por ``REPORT_QUEUE_TABLE``.
+LEGACY_REPORT_DELETIONS_TABLE = "report_deleted_tasks"
+LEGACY_REPORT_TRIGGER = "reports_tasks_delete"
@@ -0,0 +1,76 @@
+import socket
+from typing import List, Optional
+
+import click
+import typer
+
+from rich.console import Console
+
+from app.config import get_socket_path
+from app.server.client import send_command
+
+console = Console()
+
+app = typer.Typer()
+
+
+def get_root_command(ctx: typer.Context) -> click.Command:
+    return ctx.find_root().command
+
+
+@app.command("shell")
+def shell(ctx: typer.Context):
+    # Importado aqui para que o cliente nao carregue o ORM.
+    from app.server.services import CommandRunner, run_shell
+
+    runner = CommandRunner(get_root_command(ctx))
+    runner.warm_up()
+
+    try:
+        import readline  # noqa: F401  (historico e edicao de linha)
+    except ImportError:
+        pass
+
+    console.print("[bold blue]TODO CLI[/bold blue] - digite um comando (ex.: tasks list) ou 'exit' para sair.")
+    run_shell(runner)
+
+
+@app.command("serve")
+def serve(
+    ctx: typer.Context,
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Caminho do socket Unix")
+):
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]O modo servidor requer sockets Unix.[/red]")
+        raise typer.Exit(1)
+
+    from app.server.services import CommandRunner, CommandServer
+
+    runner = CommandRunner(get_root_command(ctx))
+    runner.warm_up()
+
+    socket_path = socket_path or get_socket_path()
+    with CommandServer(socket_path, runner) as server:
+        console.print(f"[green]Servidor aguardando comandos em {socket_path}[/green]")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("[yellow]Servidor encerrado.[/yellow]")
+
+
+@app.command(
+    "client",
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True}
+)
+def client(
+    args: List[str] = typer.Argument(None, help="Comando a ser executado no servidor"),
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Caminho do socket Unix")
+):
+    try:
+        exit_code, output = send_command(args or [], socket_path)
+    except (OSError, RuntimeError) as e:
+        console.print(f"[red]Erro ao conectar ao servidor: {e}[/red]")
+        raise typer.Exit(1)
+
+    typer.echo(output, nl=False)
+    raise typer.Exit(exit_code)
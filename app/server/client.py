@@ -0,0 +1,40 @@
+"""Cliente minimo do modo servidor: usa apenas a biblioteca padrao.
+
+Uso: python -m app.server.client tasks list --limit 10
+"""
+import json
+import socket
+import sys
+from typing import List, Optional, Tuple
+
+from app.config import get_socket_path
+
+
+def send_command(argv: List[str], socket_path: Optional[str] = None) -> Tuple[int, str]:
+    """Envia ``argv`` ao servidor e retorna ``(exit_code, saida)``."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("O modo servidor requer sockets Unix.")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path or get_socket_path())
+        with connection.makefile("rw", encoding="utf-8") as stream:
+            stream.write(json.dumps({"argv": argv}) + "\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+
+    return response["exit_code"], response["output"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    try:
+        exit_code, output = send_command(sys.argv[1:] if argv is None else argv)
+    except (OSError, RuntimeError) as e:
+        print(f"Erro ao conectar ao servidor: {e}", file=sys.stderr)
+        return 1
+
+    sys.stdout.write(output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import io
+import json
+import os
+import shlex
+import socketserver
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Callable, List, Optional, Tuple
+
+import click
+
+from app.database import create_db_and_tables
+
+EXIT_COMMANDS = ("exit", "quit")
+
+# Subcomandos recusados pelo servidor: ``shell`` leria o stdin do servidor
+# segurando o lock do runner e ``serve``/``client`` abririam outro socket.
+SERVER_BLOCKED_COMMANDS = ("shell", "serve", "client")
+
+
+def subcommand_name(command: click.Command, argv: List[str]) -> Optional[str]:
+    """Nome do subcomando em ``argv``, pulando as opcoes do grupo raiz."""
+    takes_value = {
+        opt for param in command.params
+        if isinstance(param, click.Option) and not param.is_flag
+        for opt in param.opts
+    }
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--":
+            return next(tokens, None)
+        if not token.startswith("-"):
+            return token
+        if token in takes_value:
+            next(tokens, None)
+    return None
+
+
+class CommandRunner:
+    """Executa comandos da CLI no proprio processo.
+
+    Engine, metadata e modulos importados continuam vivos entre as chamadas,
+    entao so a primeira execucao paga o custo de inicializacao. As chamadas
+    sao serializadas porque a captura de saida troca ``sys.stdout``.
+    """
+
+    def __init__(self, command: click.Command):
+        self.command = command
+        self.lock = threading.Lock()
+
+    def warm_up(self):
+        """Cria as tabelas e carrega todos os subcomandos antecipadamente."""
+        create_db_and_tables()
+        if isinstance(self.command, click.Group):
+            with click.Context(self.command) as ctx:
+                for name in self.command.list_commands(ctx):
+                    self.command.get_command(ctx, name)
+
+    def run(self, argv: List[str], capture: bool = True) -> Tuple[int, str]:
+        with self.lock:
+            if not capture:
+                return self._invoke(argv), ""
+
+            buffer = io.StringIO()
+            with redirect_stdout(buffer), redirect_stderr(buffer):
+                exit_code = self._invoke(argv)
+            return exit_code, buffer.getvalue()
+
+    def _invoke(self, argv: List[str]) -> int:
+        try:
+            result = self.command.main(args=list(argv), prog_name="main.py", standalone_mode=False)
+            return result if isinstance(result, int) else 0
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            return 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+
+
+def run_shell(runner: CommandRunner, read_line: Callable[[str], str] = input):
+    """Laco interativo: cada linha e executada como argumentos de ``main.py``."""
+    while True:
+        try:
+            line = read_line("todo> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+
+        if not line:
+            continue
+        if line in EXIT_COMMANDS:
+            return
+
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Erro: {e}")
+            continue
+
+        runner.run(argv, capture=False)
+
+
+class CommandRequestHandler(socketserver.StreamRequestHandler):
+    """Recebe uma linha JSON ``{"argv": [...]}`` e responde com o resultado."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            argv = json.loads(line)["argv"]
+            name = subcommand_name(self.server.runner.command, argv)
+            if name in SERVER_BLOCKED_COMMANDS:
+                exit_code, output = 2, f"Erro: o comando '{name}' nao pode ser executado pelo servidor.\n"
+            else:
+                exit_code, output = self.server.runner.run(argv)
+        except (ValueError, KeyError, TypeError) as e:
+            exit_code, output = 2, f"Requisicao invalida: {e}\n"
+
+        response = json.dumps({"exit_code": exit_code, "output": output}) + "\n"
+        self.wfile.write(response.encode("utf-8"))
+
+
+class CommandServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, runner: CommandRunner):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, CommandRequestHandler)
+        self.socket_path = socket_path
+        self.runner = runner
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -1 +1 @@
-from . import cli, models
\ No newline at end of file
+from . import models, schemas
\ No newline at end of file
@@ -0,0 +1,80 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.async_services import AsyncService
+from app.pagination import DEFAULT_PAGE_SIZE
+from app.tasks.models import Task, TaskStatus
+from app.tasks.schemas import TaskCreate, TaskDimension, TaskFilter, TaskRow, TaskSearchResult
+from app.tasks.services import TaskService
+
+
+class AsyncTaskService(AsyncService[TaskService]):
+    """``TaskService`` para uso com asyncio, sobre uma ``AsyncSession``."""
+
+    sync_class = TaskService
+
+    async def create_task(self, schema: TaskCreate) -> Task:
+        return await self._run(self.sync.create_task, schema)
+
+    async def get_task_by_id(self, task_id: int) -> Task:
+        return await self._run(self.sync.get_task_by_id, task_id)
+
+    async def get_task_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> List[TaskRow]:
+        return await self._run(self.sync.get_task_rows, limit, after_id, filters)
+
+    async def iter_task_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE,
+        filters: Optional[TaskFilter] = None,
+        as_records: bool = False
+    ) -> AsyncIterator[List[tuple]]:
+        """Versao assincrona de ``TaskService.iter_task_rows``."""
+        statement = self.sync._task_rows_statement(limit, after_id, filters, stored_enums=not as_records)
+        async for rows in self._stream(statement, chunk_size):
+            yield list(map(TaskRow._make, rows)) if as_records else rows
+
+    async def search_tasks(self, query: str, limit: int = 20, raw: bool = False) -> List[TaskSearchResult]:
+        return await self._run(self.sync.search_tasks, query, limit, raw)
+
+    async def get_tasks_by_team(self, team_id: int) -> List[Task]:
+        return await self._run(self.sync.get_tasks_by_team, team_id)
+
+    async def get_tasks_by_employee(self, employee_id: int) -> List[Task]:
+        return await self._run(self.sync.get_tasks_by_employee, employee_id)
+
+    async def update_task_status(self, task_id: int, status: TaskStatus) -> Optional[Task]:
+        return await self._run(self.sync.update_task_status, task_id, status)
+
+    async def assign_task(self, task_id: int, employee_id: int) -> Optional[Task]:
+        return await self._run(self.sync.assign_task, task_id, employee_id)
+
+    async def bulk_update_status(
+        self,
+        status: TaskStatus,
+        ids: Optional[List[int]] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> int:
+        return await self._run(self.sync.bulk_update_status, status, ids, filters)
+
+    async def bulk_assign(
+        self,
+        owner_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> int:
+        return await self._run(self.sync.bulk_assign, owner_id, ids, filters)
+
+    async def delete_task(self, task_id: int) -> bool:
+        return await self._run(self.sync.delete_task, task_id)
+
+    async def get_task_statistics(self) -> Dict[str, Any]:
+        return await self._run(self.sync.get_task_statistics)
+
+    async def get_task_breakdown(self, dimensions: List[TaskDimension]) -> List[Dict[str, Any]]:
+        return await self._run(self.sync.get_task_breakdown, dimensions)
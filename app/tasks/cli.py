@@ -1,13 +1,19 @@
+from datetime import datetime
+from typing import List, Optional
+
 import typer
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
-from app.database import get_session
+from app.database import session_scope
+from app.output import OutputFormat, write_rows
+from app.pagination import DEFAULT_PAGE_SIZE
 from app.tasks.models import TaskPriority, TaskStatus
-from app.tasks.schemas import TaskCreate
-from app.tasks.services import TaskService
+from app.tasks.schemas import TaskCreate, TaskDimension, TaskFilter, TaskSort
+from app.tasks.services import SNIPPET_END, SNIPPET_START, TASK_ROW_COLUMNS, TaskService
 
 console = Console()
 
@@ -42,71 +48,320 @@ def create(
     priority: TaskPriority = typer.Option(TaskPriority.MEDIUM, "--priority", "-p", help="Prioridade da tarefa")
 
 ):
-    service = TaskService(get_session())
+    with session_scope() as session:
+        service = TaskService(session)
 
-    try:
-        schema = TaskCreate(
-            title=title,
-            description=description,
-            team_id=team_id,
-            owner_id=owner_id,
-            priority=priority
-        )
-
-        task = service.create_task(schema)
-
-        console.print(
-            Panel(
-                f"[green]Tarefa criada com sucesso![/green]\n"
-                f"ID: {task.id}\n"
-                f"Título: {task.title}\n"
-                f"Descrição: {task.description or 'N/A'}\n"
-                f"Status: {task.status.value}\n"
-                f"Prioridade: {task.priority.value}\n"
-                f"Time ID: {task.team_id}\n"
-                f"Responsável ID: {task.owner_id or 'Não atribuído'}",
-                title="✅ Sucesso",
-                border_style="green"
+        try:
+            schema = TaskCreate(
+                title=title,
+                description=description,
+                team_id=team_id,
+                owner_id=owner_id,
+                priority=priority
             )
-        )
-    except Exception as e:
-        console.print(f"[red]Erro ao criar tarefa: {e}[/red]")
-        raise typer.Exit(1)
+
+            task = service.create_task(schema)
+
+            console.print(
+                Panel(
+                    f"[green]Tarefa criada com sucesso![/green]\n"
+                    f"ID: {task.id}\n"
+                    f"Título: {task.title}\n"
+                    f"Descrição: {task.description or 'N/A'}\n"
+                    f"Status: {task.status.value}\n"
+                    f"Prioridade: {task.priority.value}\n"
+                    f"Time ID: {task.team_id}\n"
+                    f"Responsável ID: {task.owner_id or 'Não atribuído'}",
+                    title="✅ Sucesso",
+                    border_style="green"
+                )
+            )
+        except Exception as e:
+            console.print(f"[red]Erro ao criar tarefa: {e}[/red]")
+            raise typer.Exit(1)
+
+
+def build_tasks_table(title: Optional[str] = None) -> Table:
+    table = Table(title=title)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Título", style="magenta")
+    table.add_column("Status")
+    table.add_column("Prioridade")
+    table.add_column("Time")
+    table.add_column("Responsável")
+    return table
 
 
 @app.command("list")
-def list_tasks():
-    service = TaskService(get_session())
+def list_tasks(
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Número máximo de tarefas listadas"),
+    after_id: Optional[int] = typer.Option(None, "--after-id", help="Lista apenas tarefas com ID maior que este"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Tarefas buscadas por consulta"),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", "-f", help="Formato da saída"),
+    stream: bool = typer.Option(False, "--stream", help="Atalho para --format tsv"),
+    statuses: List[TaskStatus] = typer.Option([], "--status", "-s", help="Filtra pelo status (pode ser repetido)"),
+    priorities: List[TaskPriority] = typer.Option([], "--priority", "-p", help="Filtra pela prioridade (pode ser repetido)"),
+    team_id: Optional[int] = typer.Option(None, "--team", "-t", help="Filtra pelo ID do time"),
+    owner_id: Optional[int] = typer.Option(None, "--assignee", "-a", help="Filtra pelo ID do responsável"),
+    created_after: Optional[datetime] = typer.Option(None, "--created-after", help="Lista tarefas criadas depois desta data"),
+    sort: TaskSort = typer.Option(TaskSort.ID, "--sort", help="Ordenação; prefixo - para ordem decrescente"),
+    explain: bool = typer.Option(False, "--explain", help="Mostra o plano de consulta do SQLite em vez das tarefas")
+):
+    if after_id is not None and sort != TaskSort.ID:
+        console.print("[red]--after-id só pode ser usado com --sort id.[/red]")
+        raise typer.Exit(1)
+
+    if stream:
+        if format not in (OutputFormat.TABLE, OutputFormat.TSV):
+            raise typer.BadParameter(f"--stream gera tsv e não pode ser usado com --format {format.value}.")
+        format = OutputFormat.TSV
+
+    filters = TaskFilter(
+        statuses=statuses,
+        priorities=priorities,
+        team_id=team_id,
+        owner_id=owner_id,
+        created_after=created_after,
+        sort=sort
+    )
+
+    with session_scope() as session:
+        service = TaskService(session)
+
+        try:
+            if explain:
+                console.print(Panel(
+                    escape("\n".join(service.explain_task_rows(limit, after_id, filters))),
+                    title="🔎 Plano de consulta",
+                    border_style="blue"
+                ))
+                return
+
+            if format != OutputFormat.TABLE:
+                write_rows(format, TASK_ROW_COLUMNS, service.iter_task_rows(limit, after_id, page_size, filters))
+                return
+
+            shown = 0
+            last_id = None
 
+            for tasks in service.iter_task_rows(limit, after_id, page_size, filters, as_records=True):
+                table = build_tasks_table("📋 Lista de Tarefas" if shown == 0 else None)
+
+                for task in tasks:
+                    status_color = get_status_color(task.status)
+                    priority_color = get_priority_color(task.priority)
+
+                    table.add_row(
+                        str(task.id),
+                        task.title,
+                        f"[{status_color}]{task.status}[/{status_color}]",
+                        f"[{priority_color}]{task.priority}[/{priority_color}]",
+                        task.team_name or "N/A",
+                        task.owner_name or "Não atribuído"
+                    )
+
+                console.print(table)
+                shown += len(tasks)
+                last_id = tasks[-1].id
+
+            if shown == 0:
+                console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
+                return
+
+            if limit is not None and shown == limit and sort == TaskSort.ID:
+                console.print(f"[dim]Próxima página: --after-id {last_id}[/dim]")
+        except Exception as e:
+            console.print(f"[red]Erro ao listar tarefa: {e}[/red]")
+            raise typer.Exit(1)
+
+
+def parse_enum(enum, value: str):
+    """Aceita o nome (``IN_PROGESS``, sem diferenciar maiusculas) ou o valor (``1``)."""
+    value = value.strip()
+    if value.upper() in enum.__members__:
+        return enum[value.upper()]
     try:
-        tasks = service.get_all_tasks()
-
-        if not tasks:
-            console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
-            return
-        
-        table = Table(title="📋 Lista de Tarefas")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Título", style="magenta")
-        table.add_column("Status")
-        table.add_column("Prioridade")
-        table.add_column("Time")
-        table.add_column("Responsável")
-        
-        for task in tasks:
-            status_color = get_status_color(task.status)
-            priority_color = get_priority_color(task.priority)
-            
-            table.add_row(
-                str(task.id),
-                task.title,
-                f"[{status_color}]{task.status}[/{status_color}]",
-                f"[{priority_color}]{task.priority}[/{priority_color}]",
-                task.team.name,
-                task.owner_id or "Não atribuído"
-            )
-        
-        console.print(table)
-    except Exception as e:
-        console.print(f"[red]Erro ao listar tarefa: {e}[/red]")
-        raise typer.Exit(1)
\ No newline at end of file
+        return enum(int(value))
+    except ValueError:
+        options = ", ".join(enum.__members__)
+        raise typer.BadParameter(f"{value!r} inválido. Opções: {options}")
+
+
+def parse_ids(value: Optional[str]) -> Optional[List[int]]:
+    if value is None:
+        return None
+    try:
+        return [int(id) for id in value.split(",") if id.strip()]
+    except ValueError:
+        raise typer.BadParameter(f"IDs inválidos: {value!r}. Use números separados por vírgula.")
+
+
+def parse_where(value: Optional[str]) -> Optional[TaskFilter]:
+    """Converte ``team=3,status=IN_PROGESS|PENDING`` em um ``TaskFilter``.
+
+    Chaves: team, assignee, status, priority e created_after; ``|`` separa
+    alternativas de status e prioridade.
+    """
+    if value is None:
+        return None
+
+    fields = {}
+    for condition in value.split(","):
+        key, separator, raw = condition.partition("=")
+        key = key.strip().lower()
+        if not separator or not raw.strip():
+            raise typer.BadParameter(f"Condição inválida: {condition!r}. Use chave=valor.")
+
+        try:
+            if key == "team":
+                fields["team_id"] = int(raw)
+            elif key == "assignee":
+                fields["owner_id"] = int(raw)
+            elif key == "status":
+                fields["statuses"] = [parse_enum(TaskStatus, item) for item in raw.split("|")]
+            elif key == "priority":
+                fields["priorities"] = [parse_enum(TaskPriority, item) for item in raw.split("|")]
+            elif key == "created_after":
+                fields["created_after"] = datetime.fromisoformat(raw.strip())
+            else:
+                raise typer.BadParameter(
+                    f"Chave desconhecida: {key!r}. Opções: team, assignee, status, priority, created_after"
+                )
+        except ValueError:
+            raise typer.BadParameter(f"Valor inválido em {condition!r}.")
+
+    return TaskFilter(**fields)
+
+
+IDS_HELP = "IDs das tarefas separados por vírgula (ex.: 1,2,3)"
+WHERE_HELP = "Filtro das tarefas (ex.: team=3,status=IN_PROGESS|PENDING,assignee=2)"
+
+
+def run_bulk_update(update, ids: Optional[str], where: Optional[str]):
+    task_ids, filters = parse_ids(ids), parse_where(where)
+    if task_ids is None and filters is None:
+        console.print("[red]Informe --ids ou --where.[/red]")
+        raise typer.Exit(1)
+
+    with session_scope() as session:
+        try:
+            updated = update(TaskService(session), task_ids, filters)
+            console.print(f"[green]{updated} tarefa(s) atualizada(s).[/green]")
+        except Exception as e:
+            console.print(f"[red]Erro ao atualizar tarefas: {e}[/red]")
+            raise typer.Exit(1)
+
+
+@app.command("set-status")
+def set_status(
+    status: str = typer.Argument(..., help="Novo status: PENDING, IN_PROGESS, COMPLETED (ou 0, 1, 2)"),
+    ids: Optional[str] = typer.Option(None, "--ids", help=IDS_HELP),
+    where: Optional[str] = typer.Option(None, "--where", help=WHERE_HELP)
+):
+    """Muda o status de várias tarefas em um único UPDATE."""
+    new_status = parse_enum(TaskStatus, status)
+    run_bulk_update(lambda service, task_ids, filters: service.bulk_update_status(new_status, task_ids, filters), ids, where)
+
+
+@app.command("reassign")
+def reassign(
+    owner_id: int = typer.Argument(..., help="ID do novo responsável"),
+    ids: Optional[str] = typer.Option(None, "--ids", help=IDS_HELP),
+    where: Optional[str] = typer.Option(None, "--where", help=WHERE_HELP)
+):
+    """Atribui várias tarefas a um funcionário em um único UPDATE."""
+    run_bulk_update(lambda service, task_ids, filters: service.bulk_assign(owner_id, task_ids, filters), ids, where)
+
+
+@app.command("search")
+def search(
+    query: str = typer.Argument(..., help="Palavras buscadas no título e na descrição (palavra* busca por prefixo)"),
+    limit: int = typer.Option(20, "--limit", min=1, help="Número máximo de resultados"),
+    raw: bool = typer.Option(False, "--raw", help="Usa a sintaxe do FTS5 diretamente (frases, OR, NOT, title:)")
+):
+    with session_scope() as session:
+        service = TaskService(session)
+
+        try:
+            results = service.search_tasks(query, limit, raw)
+
+            if not results:
+                console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
+                return
+
+            table = build_tasks_table(f"🔍 Busca: {escape(query)}")
+            table.columns.pop()  # Responsável
+            table.add_column("Trecho")
+
+            for result in results:
+                status_color = get_status_color(result.status)
+                priority_color = get_priority_color(result.priority)
+                snippet = escape(result.snippet).replace(SNIPPET_START, "[bold yellow]").replace(SNIPPET_END, "[/bold yellow]")
+
+                table.add_row(
+                    str(result.id),
+                    escape(result.title),
+                    f"[{status_color}]{result.status}[/{status_color}]",
+                    f"[{priority_color}]{result.priority}[/{priority_color}]",
+                    escape(result.team_name or "N/A"),
+                    snippet
+                )
+
+            console.print(table)
+        except Exception as e:
+            console.print(f"[red]Erro ao buscar tarefas: {e}[/red]")
+            raise typer.Exit(1)
+
+
+@app.command("stats")
+def stats(
+    by: List[TaskDimension] = typer.Option(
+        [TaskDimension.PRIORITY], "--by", "-b",
+        help="Dimensão de agrupamento (pode ser repetida para combinar)"
+    )
+):
+    with session_scope() as session:
+        service = TaskService(session)
+
+        try:
+            dimensions = list(dict.fromkeys(by))
+            rows = service.get_task_breakdown(dimensions)
+
+            if not rows:
+                console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
+                return
+
+            headers = {
+                TaskDimension.PRIORITY: "Prioridade",
+                TaskDimension.STATUS: "Status",
+                TaskDimension.TEAM: "Time",
+                TaskDimension.OWNER: "Responsável",
+            }
+
+            table = Table(title="📊 Estatísticas de Tarefas")
+            for dimension in dimensions:
+                table.add_column(headers[dimension])
+            table.add_column("Total", justify="right", style="cyan")
+
+            for row in rows:
+                cells = []
+                for dimension in dimensions:
+                    if dimension == TaskDimension.PRIORITY:
+                        color = get_priority_color(row["priority"])
+                        cells.append(f"[{color}]{row['priority']}[/{color}]")
+                    elif dimension == TaskDimension.STATUS:
+                        color = get_status_color(row["status"])
+                        cells.append(f"[{color}]{row['status']}[/{color}]")
+                    elif dimension == TaskDimension.TEAM:
+                        cells.append(row["team_name"] or f"#{row['team_id']}")
+                    else:
+                        cells.append(row["owner_name"] or "Não atribuído")
+                table.add_row(*cells, str(row["total"]))
+
+            table.add_section()
+            table.add_row(*(["Total"] + [""] * (len(dimensions) - 1)), str(sum(row["total"] for row in rows)))
+
+            console.print(table)
+        except Exception as e:
+            console.print(f"[red]Erro ao gerar estatísticas: {e}[/red]")
+            raise typer.Exit(1)
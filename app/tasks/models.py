@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.employees.models import Employee
 from app.teams.models import Team
@@ -40,6 +40,11 @@ class TaskStatus(Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    # Os indices compostos tambem atendem as buscas so por team_id/owner_id.
+    __table_args__ = (
+        Index("ix_tasks_team_id_status", "team_id", "status"),
+        Index("ix_tasks_owner_id_status", "owner_id", "status"),
+    )
 
     id: int = Field(primary_key=True)
 
@@ -50,8 +55,9 @@ class Task(SQLModel, table=True):
 
     title: str = Field(min_length=1, max_length=255)
     description: str = Field(min_length=1, max_length=255)
-    status: TaskStatus = Field()
-    priority: TaskPriority = Field()
+    status: TaskStatus = Field(index=True)
+    priority: TaskPriority = Field(index=True)
+
+    created_at: datetime = Field(default_factory=datetime.now, index=True)
+    updated_at: Optional[datetime] = Field(default=None, index=True)
 
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: Optional[datetime] = Field(default=None)
\ No newline at end of file
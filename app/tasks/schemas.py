@@ -1,4 +1,6 @@
-from typing import Optional
+from datetime import datetime
+from enum import Enum
+from typing import List, NamedTuple, Optional
 from pydantic import BaseModel, Field
 
 from app.tasks.models import TaskPriority, TaskStatus
@@ -18,4 +20,65 @@ class TaskCreate(BaseModel):
     description: Optional[str] = Field(default=None, max_length=1000)
     team_id: int
     owner_id: Optional[int] = None
-    priority: TaskPriority = TaskPriority.MEDIUM
\ No newline at end of file
+    priority: TaskPriority = TaskPriority.MEDIUM
+
+
+class TaskDimension(str, Enum):
+    """Dimensoes disponiveis para agrupar as estatisticas de tarefas."""
+    PRIORITY = "priority"
+    STATUS = "status"
+    TEAM = "team"
+    OWNER = "owner"
+
+
+class TaskSort(str, Enum):
+    """Ordenacao da listagem; o prefixo ``-`` indica ordem decrescente."""
+    ID = "id"
+    ID_DESC = "-id"
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    PRIORITY = "priority"
+    PRIORITY_DESC = "-priority"
+    STATUS = "status"
+    STATUS_DESC = "-status"
+    TITLE = "title"
+    TITLE_DESC = "-title"
+
+    @property
+    def field(self) -> str:
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+class TaskFilter(BaseModel):
+    """Filtros da listagem de tarefas; listas vazias nao filtram."""
+    statuses: List[TaskStatus] = []
+    priorities: List[TaskPriority] = []
+    team_id: Optional[int] = None
+    owner_id: Optional[int] = None
+    created_after: Optional[datetime] = None
+    sort: TaskSort = TaskSort.ID
+
+
+class TaskRow(NamedTuple):
+    """Linha somente leitura da listagem de tarefas, sem objeto do ORM."""
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    team_name: Optional[str]
+    owner_name: Optional[str]
+
+
+class TaskSearchResult(NamedTuple):
+    """Tarefa encontrada pela busca textual, com trecho destacado e relevancia."""
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    team_name: Optional[str]
+    snippet: str
+    rank: float
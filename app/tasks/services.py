@@ -1,9 +1,60 @@
-from typing import Any, Dict, List, Optional
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import String, case, column, literal_column, table, type_coerce
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, func, or_, select, update
 
-from app.tasks.models import Task, TaskStatus
-from app.tasks.schemas import TaskCreate
+from app.cache import existing_ids, invalidate_entities, invalidate_model, load_entity
+from app.employees.models import Employee
+from app.pagination import DEFAULT_PAGE_SIZE, paginate
+from app.schema_sql import TASK_SEARCH_TABLE
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate, TaskDimension, TaskFilter, TaskRow, TaskSearchResult, TaskSort
+from app.teams.models import Team
+
+
+# Colunas das linhas produzidas por ``TaskService.iter_task_rows``.
+TASK_ROW_COLUMNS = ("id", "title", "status", "priority", "team", "owner")
+
+
+def enum_rank(column, enum):
+    # Os Enums sao gravados pelo nome; o CASE ordena pelo valor (LOW < MEDIUM < HIGH).
+    return case({member.name: member.value for member in enum}, value=type_coerce(column, String))
+
+
+# Ids por UPDATE nas operacoes em lote, abaixo do limite de variaveis do SQLite.
+BULK_UPDATE_CHUNK = 5000
+
+# Indice FTS5 de ``app.schema_sql``; ``rank`` usa o bm25 configurado la.
+tasks_fts = table(TASK_SEARCH_TABLE, column("rowid"), column("rank"))
+
+# Marcadores do trecho destacado em ``TaskSearchResult.snippet``.
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+SNIPPET_TOKENS = 12
+
+SEARCH_TERM = re.compile(r"(\w+)(\*?)")
+
+
+def build_match_query(query: str) -> str:
+    """Converte texto livre em uma consulta FTS5 segura.
+
+    Cada palavra vira um termo entre aspas (pontuacao nao e sintaxe do
+    FTS5) e todos precisam aparecer; ``palavra*`` busca por prefixo.
+    """
+    return " ".join(f'"{term}"{prefix}' for term, prefix in SEARCH_TERM.findall(query))
+
+
+# Expressoes de ordenacao por ``TaskSort.field``.
+SORT_COLUMNS = {
+    "id": Task.id,
+    "created_at": Task.created_at,
+    "priority": enum_rank(Task.priority, TaskPriority),
+    "status": enum_rank(Task.status, TaskStatus),
+    "title": Task.title,
+}
 
 
 class TaskService:
@@ -22,22 +73,154 @@ class TaskService:
             status = TaskStatus.PENDING
         )
 
+        # O id vem do proprio INSERT; com ``expire_on_commit=False`` os demais
+        # campos ja sao conhecidos e nao ha SELECT de refresh apos o commit.
         self.session.add(task)
         self.session.commit()
-        self.session.refresh(task)
 
         return task
     
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
-        task = self.session.exec(select(Task).where(Task.id == task_id)).first()
+        task = load_entity(self.session, Task, task_id)
         if not task:
             raise Exception("Tarefa não encontrada")
         return task
     
-    def get_all_tasks(self) -> List[Task]:
-        tasks = self.session.exec(select(Task)).all()
+    def get_all_tasks(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Task]:
+        # Time e responsavel sao carregados no mesmo SELECT para evitar N+1
+        # na listagem.
+        statement = select(Task).options(joinedload(Task.team), joinedload(Task.owner))
+        statement = paginate(statement, Task.id, limit, after_id)
+        tasks = self.session.exec(statement).all()
         return tasks
     
+    def task_conditions(self, filters: TaskFilter) -> list:
+        """Condicoes do WHERE para os filtros de ``filters`` (sem a ordenacao)."""
+        conditions = []
+        if filters.statuses:
+            conditions.append(Task.status.in_(filters.statuses))
+        if filters.priorities:
+            conditions.append(Task.priority.in_(filters.priorities))
+        if filters.team_id is not None:
+            conditions.append(Task.team_id == filters.team_id)
+        if filters.owner_id is not None:
+            conditions.append(Task.owner_id == filters.owner_id)
+        if filters.created_after is not None:
+            conditions.append(Task.created_at > filters.created_after)
+        return conditions
+
+    def filter_tasks(self, statement, filters: Optional[TaskFilter] = None):
+        """Aplica os filtros e a ordenacao de ``filters`` a um SELECT de tarefas.
+
+        Cada filtro vira uma condicao no WHERE e pode ser combinado com os
+        demais; time ou responsavel com status usam os indices compostos.
+        A ordenacao pelo id e aplicada por ``paginate`` como desempate.
+        """
+        if filters is None:
+            return statement
+        statement = statement.where(*self.task_conditions(filters))
+        if filters.sort != TaskSort.ID:
+            column = SORT_COLUMNS[filters.sort.field]
+            statement = statement.order_by(column.desc() if filters.sort.descending else column)
+        return statement
+
+    def _task_rows_statement(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[TaskFilter] = None,
+        stored_enums: bool = False
+    ):
+        status, priority = Task.status, Task.priority
+        if stored_enums:
+            # Le o texto gravado no banco sem converter para o Enum.
+            status, priority = type_coerce(status, String), type_coerce(priority, String)
+        statement = (
+            select(Task.id, Task.title, status, priority, Team.name, Employee.name)
+            .outerjoin(Team, Team.id == Task.team_id)
+            .outerjoin(Employee, Employee.id == Task.owner_id)
+        )
+        return paginate(self.filter_tasks(statement, filters), Task.id, limit, after_id)
+
+    def get_task_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> List[TaskRow]:
+        """Pagina da listagem com apenas as colunas exibidas.
+
+        Roda pelo Core: nao cria objetos ``Task`` nem passa pelo identity map.
+        """
+        statement = self._task_rows_statement(limit, after_id, filters)
+        return list(map(TaskRow._make, self.session.connection().execute(statement)))
+
+    def iter_task_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE,
+        filters: Optional[TaskFilter] = None,
+        as_records: bool = False
+    ) -> Iterator[List[tuple]]:
+        """Percorre as tarefas como tuplas (``TASK_ROW_COLUMNS``), em blocos.
+
+        A consulta roda pelo Core, sem montar objetos do ORM; status e
+        prioridade saem como o texto gravado no banco (ex.: ``PENDING``).
+        Com ``as_records`` os blocos sao de ``TaskRow``, com os Enums.
+        """
+        statement = self._task_rows_statement(limit, after_id, filters, stored_enums=not as_records)
+        connection = self.session.connection().execution_options(yield_per=chunk_size)
+        for rows in connection.execute(statement).partitions():
+            yield list(map(TaskRow._make, rows)) if as_records else rows
+
+    def explain_task_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> List[str]:
+        """Plano do SQLite (``EXPLAIN QUERY PLAN``) da listagem com ``filters``."""
+        connection = self.session.connection()
+        statement = self._task_rows_statement(limit, after_id, filters)
+        compiled = statement.compile(connection, compile_kwargs={"literal_binds": True})
+
+        lines, depth = [], {0: -1}
+        for id, parent, _, detail in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"):
+            depth[id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[id] + detail)
+        return lines
+
+    def search_tasks(self, query: str, limit: int = 20, raw: bool = False) -> List[TaskSearchResult]:
+        """Busca tarefas por palavras no titulo e na descricao, das mais relevantes.
+
+        Com ``raw`` a consulta e repassada ao FTS5 sem conversao, permitindo
+        frases, ``OR``, ``NOT`` e filtros por coluna (``title: bug``).
+        """
+        match = query if raw else build_match_query(query)
+        if not match:
+            return []
+
+        fts = literal_column(TASK_SEARCH_TABLE)
+        matches = (
+            select(
+                tasks_fts.c.rowid.label("id"),
+                tasks_fts.c.rank.label("rank"),
+                func.snippet(fts, -1, SNIPPET_START, SNIPPET_END, "…", SNIPPET_TOKENS).label("snippet"),
+            )
+            .where(fts.match(match))
+            .order_by(tasks_fts.c.rank)
+            .limit(limit)
+            .subquery()
+        )
+        statement = (
+            select(Task.id, Task.title, Task.status, Task.priority, Team.name, matches.c.snippet, matches.c.rank)
+            .join(Task, Task.id == matches.c.id)
+            .outerjoin(Team, Team.id == Task.team_id)
+            .order_by(matches.c.rank)
+        )
+        return list(map(TaskSearchResult._make, self.session.connection().execute(statement)))
+
     def get_tasks_by_team(self, team_id: int) -> List[Task]:
         tasks = self.session.exec(select(Task).where(Task.team_id == team_id)).all()
         return tasks
@@ -51,44 +234,138 @@ class TaskService:
         # raise Exception("Method not implemented")
     
     def update_task_status(self, task_id: int, status: TaskStatus) -> Optional[Task]:
-        task = self.get_task_by_id(task_id)
-        if not task:
-            return None
-        task.status = status
-        self.session.add(task)
-        self.session.commit()
-        self.session.refresh(task)
-        return task
+        return self._update_task(task_id, status=status)
     
     def assign_task(self, task_id: int, employee_id: int) -> Optional[Task]:
-        task = self.get_task_by_id(task_id)
-        if not task:
-            return None
-        task.owner_id = employee_id
-        self.session.add(task)
+        return self._update_task(task_id, owner_id=employee_id)
+
+    def _update_task(self, task_id: int, **values) -> Optional[Task]:
+        # Um unico UPDATE ... RETURNING altera a tarefa e devolve a linha
+        # atualizada, sem SELECT antes nem refresh depois do commit.
+        statement = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**values, updated_at=datetime.now())
+            .returning(Task)
+        )
+        task = self.session.exec(statement).scalar_one_or_none()
+        # Sem linha alterada nao ha o que desfazer: o commit apenas encerra a
+        # transacao, sem expirar os objetos da sessao como um rollback faria.
         self.session.commit()
-        self.session.refresh(task)
+        if task is not None:
+            invalidate_entities(self.session, Task, task_id)
         return task
     
+    def bulk_update_status(
+        self,
+        status: TaskStatus,
+        ids: Optional[List[int]] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> int:
+        """Muda o status das tarefas selecionadas; retorna quantas mudaram.
+
+        Tarefas que ja estao em ``status`` nao sao regravadas.
+        """
+        return self._bulk_update({"status": status}, ids, filters, Task.status != status)
+
+    def bulk_assign(
+        self,
+        owner_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[TaskFilter] = None
+    ) -> int:
+        """Atribui as tarefas selecionadas a ``owner_id``; retorna quantas mudaram."""
+        if not existing_ids(self.session, Employee, [owner_id]):
+            raise Exception("Funcionario nao encontrado")
+        return self._bulk_update(
+            {"owner_id": owner_id}, ids, filters,
+            or_(Task.owner_id.is_(None), Task.owner_id != owner_id)
+        )
+
+    def _bulk_update(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[List[int]],
+        filters: Optional[TaskFilter],
+        changed
+    ) -> int:
+        """UPDATE em conjunto das tarefas por ``ids`` e/ou ``filters``, em uma transacao.
+
+        Nenhum objeto e carregado: cada bloco de ids (ou o filtro inteiro)
+        vira um unico ``UPDATE ... WHERE``. Exige ids ou um filtro com ao
+        menos uma condicao para nunca atualizar a tabela toda por engano.
+        """
+        if ids is not None and not ids:
+            raise ValueError("Informe ao menos um id de tarefa.")
+        filter_conditions = self.task_conditions(filters) if filters is not None else []
+        if ids is None and not filter_conditions:
+            raise ValueError("Informe os ids ou um filtro das tarefas.")
+
+        conditions = [changed, *filter_conditions]
+        values = {**values, "updated_at": datetime.now()}
+        chunks = (
+            [ids[start:start + BULK_UPDATE_CHUNK] for start in range(0, len(ids), BULK_UPDATE_CHUNK)]
+            if ids is not None else [None]
+        )
+
+        updated = 0
+        try:
+            for chunk in chunks:
+                statement = update(Task).where(*conditions).values(**values)
+                if chunk is not None:
+                    statement = statement.where(Task.id.in_(chunk))
+                result = self.session.exec(statement, execution_options={"synchronize_session": False})
+                updated += result.rowcount
+            self.session.commit()
+        except BaseException:
+            self.session.rollback()
+            raise
+        invalidate_model(self.session, Task)
+        return updated
+
     def delete_task(self, task_id: int) -> bool:
         task = self.get_task_by_id(task_id)
         if not task:
             return False
         self.session.delete(task)
         self.session.commit()
+        invalidate_entities(self.session, Task, task_id)
         return True
     
     def get_task_statistics(self) -> Dict[str, Any]:
-        tasks = self.get_all_tasks() or []
-        stats = {
-            "Baixa": 0,
-            "Media": 0,
-            "Alta": 0,
-            "total": len(tasks)
+        rows = self.session.exec(
+            select(Task.priority, func.count(Task.id)).group_by(Task.priority)
+        ).all()
+
+        stats = {str(priority): 0 for priority in TaskPriority}
+        for priority, total in rows:
+            if priority is not None:
+                stats[str(priority)] = total
+        stats["total"] = sum(total for _, total in rows)
+        return stats
+
+    def get_task_breakdown(self, dimensions: List[TaskDimension]) -> List[Dict[str, Any]]:
+        """Conta tarefas agrupadas pelas dimensoes informadas em um unico GROUP BY.
+
+        Cada linha retornada traz as colunas das dimensoes (``priority``,
+        ``status``, ``team_id``/``team_name``, ``owner_id``/``owner_name``)
+        e o total de tarefas em ``total``.
+        """
+        columns = {
+            TaskDimension.PRIORITY: [Task.priority],
+            TaskDimension.STATUS: [Task.status],
+            TaskDimension.TEAM: [Task.team_id, Team.name.label("team_name")],
+            TaskDimension.OWNER: [Task.owner_id, Employee.name.label("owner_name")],
         }
-        for task in tasks:
-            if task.priority is not None:
-                prio = str(task.priority)
-                stats[prio] = stats.get(prio, 0) + 1
-        print(stats)
-        return stats
\ No newline at end of file
+        dimensions = list(dict.fromkeys(dimensions))
+        grouping = [column for dimension in dimensions for column in columns[dimension]]
+
+        statement = select(*grouping, func.count(Task.id).label("total")).select_from(Task)
+        if TaskDimension.TEAM in dimensions:
+            statement = statement.outerjoin(Team, Team.id == Task.team_id)
+        if TaskDimension.OWNER in dimensions:
+            statement = statement.outerjoin(Employee, Employee.id == Task.owner_id)
+        if grouping:
+            statement = statement.group_by(*grouping).order_by(*grouping)
+
+        return [dict(row._mapping) for row in self.session.exec(statement)]
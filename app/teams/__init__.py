@@ -1 +1 @@
-from . import cli, models, schemas, services
\ No newline at end of file
+from . import models, schemas
\ No newline at end of file
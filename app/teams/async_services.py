@@ -0,0 +1,37 @@
+from typing import AsyncIterator, List, Optional
+
+from app.async_services import AsyncService
+from app.pagination import DEFAULT_PAGE_SIZE, paginate
+from app.teams.models import Team
+from app.teams.schemas import TeamCreate, TeamResponse, TeamRow
+from app.teams.services import TeamService
+
+
+class AsyncTeamService(AsyncService[TeamService]):
+    """``TeamService`` para uso com asyncio, sobre uma ``AsyncSession``."""
+
+    sync_class = TeamService
+
+    async def create(self, schema: TeamCreate) -> Team:
+        return await self._run(self.sync.create, schema)
+
+    async def get_by_id(self, id: int) -> Team:
+        # Os contadores voltam expirados do cache e sao carregados aqui.
+        return await self._load(self.sync.get_by_id, id)
+
+    async def get_all(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[TeamResponse]:
+        return await self._run(self.sync.get_all, limit, after_id)
+
+    async def get_team_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[TeamRow]:
+        return await self._run(self.sync.get_team_rows, limit, after_id)
+
+    async def iter_team_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[List[tuple]]:
+        """Versao assincrona de ``TeamService.iter_team_rows``."""
+        statement = paginate(self.sync._list_statement(), Team.id, limit, after_id)
+        async for rows in self._stream(statement, chunk_size):
+            yield rows
@@ -1,12 +1,16 @@
+from typing import Optional
+
 import typer
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from app.database import get_session
+from app.database import session_scope
+from app.output import OutputFormat, write_rows
+from app.pagination import DEFAULT_PAGE_SIZE, iter_pages
 from app.teams.schemas import TeamCreate, TeamResponse
-from app.teams.services import TeamService
+from app.teams.services import TEAM_ROW_COLUMNS, TeamService
 
 console = Console()
 
@@ -17,52 +21,77 @@ def create(
     name: str = typer.Option(..., "--name",help="Nome do time"),
     description: str = typer.Option(None, "--description", help="Descrição do time")
 ):
-    service = TeamService(get_session())
-
-    try:
-        schema = TeamCreate(name=name, description=description)
-        team = service.create(schema)
-
-        console.print(
-            Panel(
-                f"[green]Time criado com sucesso![/green]\n"
-                f"ID: {team.id}\n"
-                f"Nome: {team.name}\n"
-                f"Descrição: {team.description or 'N/A'}",
-                title="✅ Sucesso",
-                border_style="green"
+    with session_scope() as session:
+        service = TeamService(session)
+
+        try:
+            schema = TeamCreate(name=name, description=description)
+            team = service.create(schema)
+
+            console.print(
+                Panel(
+                    f"[green]Time criado com sucesso![/green]\n"
+                    f"ID: {team.id}\n"
+                    f"Nome: {team.name}\n"
+                    f"Descrição: {team.description or 'N/A'}",
+                    title="✅ Sucesso",
+                    border_style="green"
+                )
             )
-        )
-    except Exception as e:
-        console.print(f"[red]Erro ao criar time: {e}[/red]")
+        except Exception as e:
+            console.print(f"[red]Erro ao criar time: {e}[/red]")
+
+
+def build_teams_table(title: Optional[str] = None) -> Table:
+    table = Table(title=title)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Nome", style="magenta")
+    table.add_column("Descrição")
+    table.add_column("Funcionários", justify="center")
+    table.add_column("Tarefas", justify="center")
+    table.add_column("Abertas", justify="center")
+    return table
 
 
 @app.command("list")
-def list_teams():
-    service = TeamService(get_session())
-    try:
-        teams = service.get_all()
-
-        if len(teams) == 0:
-            console.print("[yellow]Nenhum time encontrado.[/yellow]")
-            return
-
-        table = Table(title="📋 Lista de Times")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nome", style="magenta")
-        table.add_column("Descrição")
-        table.add_column("Funcionários", justify="center")
-        table.add_column("Tarefas", justify="center")
-        
-        for team in teams:
-            table.add_row(
-                str(team.id),
-                team.name,
-                team.description or "N/A",
-                str(team.employees_count),
-                str(team.tasks_count)
-            )
-        
-        console.print(table)
-    except Exception as e:
-        console.print(f"[red]Erro ao criar time: {e}[/red]")
\ No newline at end of file
+def list_teams(
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Número máximo de times listados"),
+    after_id: Optional[int] = typer.Option(None, "--after-id", help="Lista apenas times com ID maior que este"),
+    page_size: int = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", min=1, help="Times buscados por consulta"),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", "-f", help="Formato da saída")
+):
+    with session_scope() as session:
+        service = TeamService(session)
+        try:
+            if format != OutputFormat.TABLE:
+                write_rows(format, TEAM_ROW_COLUMNS, service.iter_team_rows(limit, after_id, page_size))
+                return
+
+            shown = 0
+            last_id = None
+
+            for teams in iter_pages(service.get_team_rows, page_size, limit, after_id):
+                table = build_teams_table("📋 Lista de Times" if shown == 0 else None)
+
+                for team in teams:
+                    table.add_row(
+                        str(team.id),
+                        team.name,
+                        team.description or "N/A",
+                        str(team.employees_count),
+                        str(team.tasks_count),
+                        str(team.open_tasks_count)
+                    )
+
+                console.print(table)
+                shown += len(teams)
+                last_id = teams[-1].id
+
+            if shown == 0:
+                console.print("[yellow]Nenhum time encontrado.[/yellow]")
+                return
+
+            if limit is not None and shown == limit:
+                console.print(f"[dim]Próxima página: --after-id {last_id}[/dim]")
+        except Exception as e:
+            console.print(f"[red]Erro ao criar time: {e}[/red]")
\ No newline at end of file
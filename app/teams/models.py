@@ -2,6 +2,12 @@ from datetime import datetime
 from typing import List, Optional
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.schema_sql import TASK_COUNTERS
+
+
+# Colunas mantidas por triggers, que um cache da aplicacao nao acompanha.
+COUNTER_FIELDS = ("employees_count", *TASK_COUNTERS)
+
 
 class Team(SQLModel, table=True):
     __tablename__ = "teams"
@@ -11,5 +17,14 @@ class Team(SQLModel, table=True):
     description: str = Field(min_length=1, max_length=500)
     employees: List["Employee"] = Relationship(back_populates="team")
     tasks: List["Task"] = Relationship(back_populates="team")
+
+    # Contadores mantidos por triggers (app.schema_sql); nao grave direto.
+    employees_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    open_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    pending_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    in_progress_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    completed_tasks_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = Field(default=None)
\ No newline at end of file
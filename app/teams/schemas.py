@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import NamedTuple, Optional
 from pydantic import BaseModel, Field
 
 
@@ -11,4 +11,15 @@ class TeamResponse(BaseModel):
     name: str
     description: str
     employees_count: int
-    tasks_count: int
\ No newline at end of file
+    tasks_count: int
+    open_tasks_count: int
+
+
+class TeamRow(NamedTuple):
+    """Linha somente leitura da listagem de times."""
+    id: int
+    name: str
+    description: Optional[str]
+    employees_count: int
+    tasks_count: int
+    open_tasks_count: int
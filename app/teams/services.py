@@ -1,8 +1,14 @@
-from typing import List
+from typing import Iterator, List, Optional
 from sqlmodel import Session, select
 
-from app.teams.models import Team
-from app.teams.schemas import TeamCreate, TeamResponse
+from app.cache import load_entity
+from app.pagination import DEFAULT_PAGE_SIZE, paginate
+from app.teams.models import COUNTER_FIELDS, Team
+from app.teams.schemas import TeamCreate, TeamResponse, TeamRow
+
+
+# Colunas das linhas produzidas por ``TeamService.iter_team_rows``.
+TEAM_ROW_COLUMNS = ("id", "name", "description", "employees_count", "tasks_count", "open_tasks_count")
 
 
 class TeamService:
@@ -17,15 +23,52 @@ class TeamService:
 
         self.session.add(team)
         self.session.commit()
-        self.session.refresh(team)
 
         return team
 
-    def get_all(self) -> List[TeamResponse]:
+    def get_by_id(self, id: int) -> Team:
+        team = load_entity(self.session, Team, id, expire=COUNTER_FIELDS)
+
+        if not team:
+            raise Exception("Time nao encontrado")
+
+        return team
+
+    def _list_statement(self):
+        # Os contadores sao mantidos por triggers: a listagem so le ``teams``.
+        return select(
+            Team.id,
+            Team.name,
+            Team.description,
+            Team.employees_count,
+            Team.tasks_count,
+            Team.open_tasks_count,
+        )
+
+    def get_all(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[TeamResponse]:
+        statement = paginate(self._list_statement(), Team.id, limit, after_id)
+
         return [TeamResponse(
-            id=t.id,
-            name=t.name,
-            description=t.description,
-            employees_count=len(t.employees),
-            tasks_count=len(t.tasks)
-        ) for t in self.session.exec(select(Team)).all()]
\ No newline at end of file
+            id=id,
+            name=name,
+            description=description,
+            employees_count=employees_count,
+            tasks_count=tasks_count,
+            open_tasks_count=open_tasks_count
+        ) for id, name, description, employees_count, tasks_count, open_tasks_count in self.session.exec(statement).all()]
+
+    def get_team_rows(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[TeamRow]:
+        """Mesma pagina de ``get_all`` como tuplas, sem validacao do Pydantic."""
+        statement = paginate(self._list_statement(), Team.id, limit, after_id)
+        return list(map(TeamRow._make, self.session.connection().execute(statement)))
+
+    def iter_team_rows(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[tuple]]:
+        """Percorre os times como tuplas (``TEAM_ROW_COLUMNS``), em blocos, sem o ORM."""
+        statement = paginate(self._list_statement(), Team.id, limit, after_id)
+        connection = self.session.connection().execution_options(yield_per=chunk_size)
+        yield from connection.execute(statement).partitions()
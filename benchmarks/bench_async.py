@@ -0,0 +1,218 @@
+"""Vazao de requisicoes concorrentes: servicos assincronos contra sincronos.
+
+Cada requisicao abre uma sessao e chama os servicos como um worker de
+ingestao faria. Os servicos sincronos sao chamados direto no event loop
+(bloqueando-o) ou por ``run_in_executor`` em um thread pool. Os assincronos
+rodam sobre o aiosqlite. Um ticker mede o maior atraso do event loop.
+
+Uso:
+    python -m benchmarks.bench_async --tier 1k
+    python -m benchmarks.bench_async --tier 100k --concurrency 1 8 32 --requests 400 --data-dir /tmp/bench
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from rich.table import Table
+from sqlalchemy import delete
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import build_async_engine, build_engine
+from app.tasks.async_services import AsyncTaskService
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate
+from app.tasks.services import TaskService
+from benchmarks.run import TIERS, console, prepare_engine
+from benchmarks.seed import default_teams
+
+ROWS_PAGE = 50
+# Intervalo do ticker que mede o atraso do event loop.
+TICK_SECONDS = 0.001
+
+
+@dataclass
+class Throughput:
+    seconds: float
+    latencies_ms: List[float]
+    loop_lag_ms: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies_ms) / self.seconds
+
+    def percentile(self, fraction: float) -> float:
+        return statistics.quantiles(self.latencies_ms, n=100)[int(fraction * 100) - 1]
+
+
+# Cada cenario tem uma versao sincrona e uma assincrona da mesma requisicao,
+# recebendo a sessao e um gerador de numeros aleatorios.
+def read_sync(session: Session, rng: random.Random, tasks: int):
+    service = TaskService(session)
+    service.get_task_by_id(rng.randint(1, tasks))
+    service.get_task_rows(limit=ROWS_PAGE, after_id=rng.randint(0, tasks))
+
+
+async def read_async(session: AsyncSession, rng: random.Random, tasks: int):
+    service = AsyncTaskService(session)
+    await service.get_task_by_id(rng.randint(1, tasks))
+    await service.get_task_rows(limit=ROWS_PAGE, after_id=rng.randint(0, tasks))
+
+
+def new_task(rng: random.Random, tasks: int) -> TaskCreate:
+    return TaskCreate(
+        title=f"bench-async-{rng.random()}", description="Escrita concorrente",
+        team_id=rng.randint(1, default_teams(tasks)), priority=TaskPriority.MEDIUM
+    )
+
+
+def write_sync(session: Session, rng: random.Random, tasks: int):
+    service = TaskService(session)
+    task = service.create_task(new_task(rng, tasks))
+    service.update_task_status(task.id, TaskStatus.IN_PROGESS)
+
+
+async def write_async(session: AsyncSession, rng: random.Random, tasks: int):
+    service = AsyncTaskService(session)
+    task = await service.create_task(new_task(rng, tasks))
+    await service.update_task_status(task.id, TaskStatus.IN_PROGESS)
+
+
+SCENARIOS = {
+    "leitura": (read_sync, read_async),
+    "escrita": (write_sync, write_async),
+}
+
+
+async def measure(
+    request: Callable[[random.Random], Awaitable[None]],
+    requests: int,
+    concurrency: int
+) -> Throughput:
+    """Dispara ``requests`` requisicoes, no maximo ``concurrency`` ao mesmo tempo."""
+    rng = random.Random(0)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal lag
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lag = max(lag, time.perf_counter() - expected)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await request(rng)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    ticking = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    seconds = time.perf_counter() - started
+    done.set()
+    await ticking
+    return Throughput(seconds, latencies, lag * 1000)
+
+
+async def run_scenario(
+    path: Path,
+    tasks: int,
+    scenario: str,
+    requests: int,
+    concurrency: int
+) -> Dict[str, Throughput]:
+    sync_request, async_request = SCENARIOS[scenario]
+    url = f"sqlite:///{path}"
+    pool = dict(pool="queue", pool_size=concurrency, max_overflow=0)
+    engine = build_engine(url, "performance", **pool)
+    async_engine = build_async_engine(url, "performance", **pool)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    loop = asyncio.get_running_loop()
+
+    def in_thread(rng):
+        with Session(engine, expire_on_commit=False) as session:
+            sync_request(session, rng, tasks)
+
+    async def blocking(rng):
+        in_thread(rng)
+
+    async def threaded(rng):
+        await loop.run_in_executor(executor, in_thread, rng)
+
+    async def native(rng):
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            await async_request(session, rng, tasks)
+
+    try:
+        return {
+            "sync (bloqueando o loop)": await measure(blocking, requests, concurrency),
+            "sync (thread pool)": await measure(threaded, requests, concurrency),
+            "async (aiosqlite)": await measure(native, requests, concurrency),
+        }
+    finally:
+        executor.shutdown()
+        await async_engine.dispose()
+        with engine.begin() as connection:
+            connection.execute(delete(Task).where(Task.title.like("bench-async-%")))
+        engine.dispose()
+
+
+def print_results(tier: str, scenario: str, results: Dict[int, Dict[str, Throughput]]):
+    table = Table(title=f"Requisições concorrentes ({scenario}) - {tier} tarefas")
+    table.add_column("Modo", style="cyan", no_wrap=True)
+    table.add_column("Concorrência", justify="right")
+    table.add_column("req/s", justify="right", style="green")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("atraso máx. do loop ms", justify="right", style="red")
+
+    for concurrency, modes in results.items():
+        for mode, result in modes.items():
+            table.add_row(
+                mode,
+                str(concurrency),
+                f"{result.requests_per_second:,.0f}",
+                f"{result.percentile(0.5):.2f}",
+                f"{result.percentile(0.95):.2f}",
+                f"{result.loop_lag_ms:.1f}",
+            )
+    console.print(table)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tier", nargs="+", choices=TIERS, default=["1k"])
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=400, help="requisicoes por modo e concorrencia")
+    parser.add_argument("--data-dir", type=Path, help="diretorio onde as bases geradas sao reaproveitadas")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or Path(tmp)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        for tier in args.tier:
+            prepare_engine(tier, data_dir).dispose()
+            path = data_dir / f"bench-{tier}.db"
+            for scenario in args.scenario:
+                results = {
+                    concurrency: asyncio.run(run_scenario(path, TIERS[tier], scenario, args.requests, concurrency))
+                    for concurrency in args.concurrency
+                }
+                print_results(tier, scenario, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compara consultas filtradas de tarefas com e sem os indices secundarios.
+
+As consultas buscam um time e um funcionario com um numero fixo de tarefas,
+de forma que o tempo medido reflete o custo de localizar as linhas (varredura
+O(n) contra busca O(log n) no indice) e nao o tamanho do resultado.
+
+Uso: python -m benchmarks.bench_indexes [--sizes 1000 10000 100000]
+"""
+import argparse
+import time
+from datetime import datetime
+
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import insert, text
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.employees.models import Employee
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.services import TaskService
+from app.teams.models import Team
+from benchmarks.seed import seed_database
+
+TEAMS = 200
+EMPLOYEES = 2000
+PROBE_TASKS = 10
+REPEAT = 50
+
+console = Console()
+
+
+def seed(engine, size: int):
+    seed_database(engine, size, teams=TEAMS, employees=EMPLOYEES)
+
+    # Time e funcionario "sonda", com poucas tarefas no fim da tabela.
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [{"id": TEAMS + 1, "name": "Probe", "description": "bench", "created_at": now}])
+        connection.execute(insert(Employee), [{
+            "id": EMPLOYEES + 1, "name": "Probe", "email": "probe@bench.com", "team_id": TEAMS + 1, "created_at": now
+        }])
+        connection.execute(insert(Task), [
+            {
+                "title": f"Probe {i}",
+                "description": "bench",
+                "team_id": TEAMS + 1,
+                "owner_id": EMPLOYEES + 1,
+                "status": TaskStatus.PENDING,
+                "priority": TaskPriority.HIGH,
+                "created_at": now,
+            }
+            for i in range(PROBE_TASKS)
+        ])
+
+
+def measure(engine) -> float:
+    with Session(engine) as session:
+        service = TaskService(session)
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            service.get_tasks_by_team(TEAMS + 1)
+            service.get_tasks_by_employee(EMPLOYEES + 1)
+        return (time.perf_counter() - started) / (2 * REPEAT) * 1000
+
+
+def drop_indexes(engine):
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX {index.name}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    table = Table(title="Consultas por time/responsável (ms por consulta)")
+    table.add_column("Tarefas", justify="right")
+    table.add_column("Sem índice", justify="right")
+    table.add_column("Com índice", justify="right")
+    table.add_column("Ganho", justify="right")
+
+    for size in args.sizes:
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        seed(engine, size)
+
+        indexed = measure(engine)
+        drop_indexes(engine)
+        scan = measure(engine)
+
+        table.add_row(f"{size:,}", f"{scan:.2f}", f"{indexed:.2f}", f"{scan / indexed:.1f}x")
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""Benchmarks dos servicos e comandos da CLI sobre bases sinteticas.
+
+Mede latencia (mediana), pico de memoria (tracemalloc) e numero de
+statements SQL de cada caso. Os resultados podem ser salvos como baseline
+(``--save``) e comparados com ela (``--check``), falhando com codigo 1 se
+algum caso regredir.
+
+Uso:
+    python -m benchmarks.run --tier 1k
+    python -m benchmarks.run --tier 1k 100k --save
+    python -m benchmarks.run --tier 1k --check --tolerance 3
+"""
+import argparse
+import itertools
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from sqlalchemy import Engine, delete, update
+from sqlmodel import Session, SQLModel
+from typer.testing import CliRunner
+
+from app import database
+from app.database import QueryStats
+from app.migrations import upgrade
+from app.employees.models import Employee
+from app.employees.schemas import EmployeeCreate
+from app.employees.services import EmployeeService
+from app.reports.services import ReportService
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate, TaskDimension, TaskFilter, TaskSort
+from app.tasks.services import TaskService
+from app.teams.services import TeamService
+from benchmarks.seed import STATUSES, default_employees, default_teams, seed_database
+
+TIERS = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+PAGE_SIZE = 500
+NEW_EMPLOYEES = 1_000
+# Escritas individuais (uma transacao cada) por execucao dos casos de escrita.
+WRITES = 200
+
+# Diferencas de memoria abaixo disso sao ruido do tracemalloc.
+MEMORY_NOISE_KB = 64
+
+console = Console()
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[Engine, int], object]
+    cleanup: Optional[Callable[[Engine], None]] = None
+    # Operacoes por execucao, para exibir operacoes/s.
+    operations: int = 1
+    # Preparacao fora da medicao (ex.: construir os relatorios antes de medir o refresh).
+    setup: Optional[Callable[[Engine], None]] = None
+
+
+@dataclass
+class Result:
+    latency_ms: float
+    peak_kb: float
+    statements: int
+
+
+def with_session(function: Callable[[Session, int], object]) -> Callable[[Engine, int], object]:
+    def run(engine: Engine, tasks: int):
+        with Session(engine, expire_on_commit=False) as session:
+            return function(session, tasks)
+    return run
+
+
+def run_cli(*args: str) -> Callable[[Engine, int], object]:
+    from main import app
+
+    runner = CliRunner()
+
+    def run(engine: Engine, tasks: int):
+        result = runner.invoke(app, list(args))
+        if result.exit_code != 0:
+            raise RuntimeError(f"{' '.join(args)} falhou: {result.output}")
+    return run
+
+
+_new_employee_ids = itertools.count()
+
+
+def create_employees(session: Session, tasks: int):
+    batch = next(_new_employee_ids)
+    teams = default_teams(tasks)
+    EmployeeService(session).create_employees([
+        EmployeeCreate(name=f"bench-new-{batch}-{i}", email=f"new{batch}.{i}@bench.com", team_id=i % teams + 1)
+        for i in range(NEW_EMPLOYEES)
+    ])
+
+
+def delete_new_employees(engine: Engine):
+    with engine.begin() as connection:
+        connection.execute(delete(Employee).where(Employee.name.like("bench-new-%")))
+
+
+def create_tasks(session: Session, tasks: int):
+    service = TaskService(session)
+    teams = default_teams(tasks)
+    for i in range(WRITES):
+        service.create_task(TaskCreate(
+            title=f"bench-write-{i}", description="Escrita de benchmark",
+            team_id=i % teams + 1, priority=TaskPriority.MEDIUM
+        ))
+
+
+def delete_written_tasks(engine: Engine):
+    with engine.begin() as connection:
+        connection.execute(delete(Task).where(Task.title.like("bench-write-%")))
+
+
+# As atualizacoes regravam os valores gerados pelo seed, entao a base nao
+# muda entre execucoes e tiers.
+def update_statuses(session: Session, tasks: int):
+    service = TaskService(session)
+    for i in range(1, WRITES + 1):
+        service.update_task_status(i, STATUSES[i % len(STATUSES)])
+
+
+def assign_tasks(session: Session, tasks: int):
+    service = TaskService(session)
+    employees = default_employees(tasks)
+    for i in range(1, WRITES + 1):
+        if i % 10:
+            service.assign_task(i, i % employees + 1)
+
+
+# Consultas por id repetidas, como nas validacoes de uma importacao: a
+# partir da segunda execucao, todas saem do cache do engine.
+def lookup_repeated(session: Session, tasks: int):
+    task_service, employee_service = TaskService(session), EmployeeService(session)
+    employees = default_employees(tasks)
+    for i in range(WRITES):
+        task_service.get_task_by_id(i % 20 + 1)
+        employee_service.get_employee_by_id(i % min(employees, 20) + 1)
+        session.expunge_all()
+
+
+def build_reports(engine: Engine):
+    with Session(engine, expire_on_commit=False) as session:
+        ReportService(session).refresh(full=True)
+
+
+def touch_and_refresh(session: Session, tasks: int):
+    # Marca WRITES tarefas como alteradas, sem mudar seus valores, e atualiza.
+    session.exec(update(Task).where(Task.id <= WRITES).values(updated_at=datetime.now()))
+    session.commit()
+    ReportService(session).refresh()
+
+
+CASES = [
+    Case("tasks.get_all_tasks[page]", with_session(
+        lambda s, n: TaskService(s).get_all_tasks(limit=PAGE_SIZE, after_id=n // 2))),
+    Case("tasks.get_task_rows[page]", with_session(
+        lambda s, n: TaskService(s).get_task_rows(limit=PAGE_SIZE, after_id=n // 2))),
+    Case("tasks.get_task_rows[team+status, -created_at]", with_session(
+        lambda s, n: TaskService(s).get_task_rows(limit=PAGE_SIZE, filters=TaskFilter(
+            team_id=1, statuses=[TaskStatus.PENDING], sort=TaskSort.CREATED_AT_DESC)))),
+    Case("tasks.search_tasks[term]", with_session(
+        lambda s, n: TaskService(s).search_tasks(f"tarefa {n // 2}"))),
+    Case("tasks.search_tasks[prefix]", with_session(
+        lambda s, n: TaskService(s).search_tasks("sintet*"))),
+    Case("tasks.get_tasks_by_team", with_session(
+        lambda s, n: TaskService(s).get_tasks_by_team(1))),
+    Case("tasks.get_tasks_by_employee", with_session(
+        lambda s, n: TaskService(s).get_tasks_by_employee(1))),
+    Case("tasks.get_task_statistics", with_session(
+        lambda s, n: TaskService(s).get_task_statistics())),
+    Case("tasks.get_task_breakdown[team,status]", with_session(
+        lambda s, n: TaskService(s).get_task_breakdown([TaskDimension.TEAM, TaskDimension.STATUS]))),
+    Case("reports.refresh[sem alteracoes]", with_session(
+        lambda s, n: ReportService(s).refresh()), setup=build_reports),
+    Case(f"reports.refresh[{WRITES} alteradas]", with_session(touch_and_refresh), setup=build_reports),
+    Case("reports.get_team_report", with_session(
+        lambda s, n: ReportService(s).get_team_report()), setup=build_reports),
+    Case("employees.list_employees[page]", with_session(
+        lambda s, n: EmployeeService(s).list_employees(limit=PAGE_SIZE, after_id=default_employees(n) // 2))),
+    Case("employees.get_employee_rows[page]", with_session(
+        lambda s, n: EmployeeService(s).get_employee_rows(limit=PAGE_SIZE, after_id=default_employees(n) // 2))),
+    Case("employees.get_employee_by_id", with_session(
+        lambda s, n: EmployeeService(s).get_employee_by_id(1))),
+    Case(f"cache: get_task_by_id + get_employee_by_id[x{WRITES}]", with_session(lookup_repeated), operations=WRITES),
+    Case("teams.get_all[page]", with_session(
+        lambda s, n: TeamService(s).get_all(limit=PAGE_SIZE))),
+    Case("teams.get_team_rows[page]", with_session(
+        lambda s, n: TeamService(s).get_team_rows(limit=PAGE_SIZE))),
+    Case("cli: tasks list --limit 500", run_cli("tasks", "list", "--limit", str(PAGE_SIZE))),
+    Case("cli: tasks list --stream --limit 10000", run_cli("tasks", "list", "--stream", "--limit", "10000")),
+    Case("cli: teams list --limit 500", run_cli("teams", "list", "--limit", str(PAGE_SIZE))),
+    Case("employees.create_employees[1000]", with_session(create_employees), delete_new_employees),
+    Case(f"tasks.create_task[x{WRITES}]", with_session(create_tasks), delete_written_tasks, WRITES),
+    Case(f"tasks.update_task_status[x{WRITES}]", with_session(update_statuses), operations=WRITES),
+    Case(f"tasks.assign_task[x{WRITES}]", with_session(assign_tasks), operations=WRITES - WRITES // 10),
+]
+CASE_OPERATIONS = {case.name: case.operations for case in CASES}
+
+
+def prepare_engine(tier: str, data_dir: Path) -> Engine:
+    """Abre (ou cria e popula) a base do tier em ``data_dir``."""
+    tasks = TIERS[tier]
+    path = data_dir / f"bench-{tier}.db"
+    exists = path.exists()
+
+    engine = database.build_engine(f"sqlite:///{path}", "performance")
+    if not exists:
+        console.print(f"[dim]Gerando base {tier} ({tasks:,} tarefas) em {path}...[/dim]")
+        started = time.perf_counter()
+        SQLModel.metadata.create_all(engine)
+        try:
+            seed_database(engine, tasks)
+        except BaseException:
+            engine.dispose()
+            path.unlink(missing_ok=True)
+            raise
+        console.print(f"[dim]Base gerada em {time.perf_counter() - started:.1f}s[/dim]")
+    else:
+        # Bases reaproveitadas de --data-dir recebem tabelas, colunas e indices novos.
+        SQLModel.metadata.create_all(engine)
+        upgrade(engine)
+    return engine
+
+
+def measure(case: Case, engine: Engine, tasks: int, repeat: int) -> Result:
+    if case.setup:
+        case.setup(engine)
+
+    # Memoria e statements em uma execucao instrumentada; latencia em
+    # execucoes separadas, sem o custo do tracemalloc.
+    with QueryStats(slow_query_ms=float("inf")).attach(engine) as counter:
+        tracemalloc.start()
+        try:
+            case.run(engine, tasks)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        case.run(engine, tasks)
+        timings.append(time.perf_counter() - started)
+
+    if case.cleanup:
+        case.cleanup(engine)
+
+    return Result(
+        latency_ms=round(statistics.median(timings) * 1000, 3),
+        peak_kb=round(peak / 1024, 1),
+        statements=len(counter),
+    )
+
+
+def run_tier(tier: str, data_dir: Path, repeat: int, only: Optional[str] = None) -> Dict[str, Result]:
+    engine = prepare_engine(tier, data_dir)
+    previous_engine = database._engine
+    database._engine = engine
+
+    try:
+        return {
+            case.name: measure(case, engine, TIERS[tier], repeat)
+            for case in CASES
+            if only is None or only in case.name
+        }
+    finally:
+        database._engine = previous_engine
+        engine.dispose()
+
+
+def compare(results: Dict[str, Result], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Lista as regressoes de ``results`` em relacao a ``baseline``.
+
+    Statements nao podem aumentar; latencia e memoria podem crescer ate
+    ``tolerance`` vezes o valor da baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = Result(**baseline[name])
+
+        if result.statements > base.statements:
+            regressions.append(f"{name}: statements {base.statements} -> {result.statements}")
+        if result.latency_ms > base.latency_ms * tolerance:
+            regressions.append(f"{name}: latencia {base.latency_ms:.2f}ms -> {result.latency_ms:.2f}ms")
+        if result.peak_kb > base.peak_kb * tolerance and result.peak_kb - base.peak_kb > MEMORY_NOISE_KB:
+            regressions.append(f"{name}: memoria {base.peak_kb:.0f}KB -> {result.peak_kb:.0f}KB")
+    return regressions
+
+
+def load_baselines() -> Dict[str, Dict[str, dict]]:
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+
+
+def save_baselines(baselines: Dict[str, Dict[str, dict]]):
+    BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def print_results(tier: str, results: Dict[str, Result], baseline: Dict[str, dict]):
+    table = Table(title=f"Benchmarks - {tier} tarefas")
+    table.add_column("Caso", style="cyan", no_wrap=True)
+    table.add_column("ms", justify="right")
+    table.add_column("baseline ms", justify="right", style="dim")
+    table.add_column("pico KB", justify="right")
+    table.add_column("SQL", justify="right")
+    table.add_column("ops/s", justify="right")
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        operations = CASE_OPERATIONS.get(name, 1)
+        table.add_row(
+            escape(name),
+            f"{result.latency_ms:.2f}",
+            f"{base['latency_ms']:.2f}" if base else "-",
+            f"{result.peak_kb:,.0f}",
+            str(result.statements),
+            f"{operations / result.latency_ms * 1000:,.0f}" if operations > 1 and result.latency_ms else "-",
+        )
+    console.print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tier", nargs="+", choices=TIERS, default=["1k"])
+    parser.add_argument("--repeat", type=int, default=5, help="execucoes cronometradas por caso")
+    parser.add_argument("--case", help="executa apenas casos cujo nome contem este texto")
+    parser.add_argument("--data-dir", type=Path, help="diretorio onde as bases geradas sao reaproveitadas")
+    parser.add_argument("--save", action="store_true", help="grava os resultados como baseline")
+    parser.add_argument("--check", action="store_true", help="falha se algum caso regredir em relacao a baseline")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="fator maximo de latencia/memoria no --check")
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines()
+    regressions = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or Path(tmp)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        for tier in args.tier:
+            results = run_tier(tier, data_dir, args.repeat, args.case)
+            print_results(tier, results, baselines.get(tier, {}))
+
+            if args.check:
+                regressions += [f"[{tier}] {r}" for r in compare(results, baselines.get(tier, {}), args.tolerance)]
+            if args.save:
+                baselines.setdefault(tier, {}).update({name: asdict(r) for name, r in results.items()})
+
+    if args.save:
+        save_baselines(baselines)
+        console.print(f"[green]Baseline gravada em {BASELINES_PATH}[/green]")
+
+    if regressions:
+        console.print("[red]Regressões de desempenho:[/red]")
+        for regression in regressions:
+            console.print(f"  [red]- {escape(regression)}[/red]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
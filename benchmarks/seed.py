@@ -0,0 +1,66 @@
+"""Geracao de bases sinteticas para os benchmarks."""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import Engine, insert
+
+from app.employees.models import Employee
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.teams.models import Team
+
+BATCH_SIZE = 50_000
+
+STATUSES = list(TaskStatus)
+PRIORITIES = list(TaskPriority)
+
+
+def default_teams(tasks: int) -> int:
+    return max(10, tasks // 1000)
+
+
+def default_employees(tasks: int) -> int:
+    return max(50, tasks // 20)
+
+
+def seed_database(engine: Engine, tasks: int, teams: Optional[int] = None, employees: Optional[int] = None):
+    """Insere ``teams`` times, ``employees`` funcionarios e ``tasks`` tarefas.
+
+    Ids sao sequenciais a partir de 1. Uma em cada dez tarefas fica sem
+    responsavel; status e prioridade se alternam de forma deterministica.
+    """
+    teams = teams or default_teams(tasks)
+    employees = employees or default_employees(tasks)
+    start = datetime(2025, 1, 1)
+
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [
+            {"id": i, "name": f"Team {i}", "description": f"Time sintetico {i}", "created_at": start}
+            for i in range(1, teams + 1)
+        ])
+
+        for offset in range(0, employees, BATCH_SIZE):
+            connection.execute(insert(Employee), [
+                {
+                    "id": i,
+                    "name": f"Employee {i}",
+                    "email": f"employee{i}@bench.com",
+                    "team_id": i % teams + 1,
+                    "created_at": start,
+                }
+                for i in range(offset + 1, min(offset + BATCH_SIZE, employees) + 1)
+            ])
+
+        for offset in range(0, tasks, BATCH_SIZE):
+            connection.execute(insert(Task), [
+                {
+                    "id": i,
+                    "title": f"Task {i}",
+                    "description": f"Descricao sintetica da tarefa {i} para benchmark",
+                    "team_id": i % teams + 1,
+                    "owner_id": None if i % 10 == 0 else i % employees + 1,
+                    "status": STATUSES[i % len(STATUSES)],
+                    "priority": PRIORITIES[(i // 3) % len(PRIORITIES)],
+                    "created_at": start + timedelta(seconds=i),
+                }
+                for i in range(offset + 1, min(offset + BATCH_SIZE, tasks) + 1)
+            ])
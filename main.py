@@ -1,38 +1,165 @@
+import importlib
+from pathlib import Path
+from typing import List, Optional
+
+import click
 import typer
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
+from rich.table import Table
+from typer.core import TyperGroup
 
-from app import employees, tasks, teams
-from app.config import set_db_url
-from app.database import create_db_and_tables
+from app.config import set_db_profile, set_db_url
 
 console = Console()
+# O resumo do --profile vai para stderr para nao misturar com saidas como --stream.
+profile_console = Console(stderr=True)
+
+# Statements mais caros mostrados pelo --profile.
+PROFILE_TOP_STATEMENTS = 10
+
+# Subcomandos carregados sob demanda: (modulo com o Typer ``app``, ajuda curta).
+# ``modulo:comando`` usa apenas um comando do Typer do modulo.
+# Importar os modulos de CLI traz SQLModel, SQLAlchemy e Pydantic, o que so e
+# necessario quando o subcomando e de fato executado.
+LAZY_SUBCOMMANDS = {
+    "employees": ("app.employees.cli", "Gerenciamento de funcionários"),
+    "teams": ("app.teams.cli", "Gerenciamento de times"),
+    "tasks": ("app.tasks.cli", "Gerenciamento de tarefas"),
+    "import": ("app.imports.cli", "Importação em lote a partir de arquivos CSV ou JSONL"),
+    "export": ("app.exports.cli", "Exportação paralela em shards por faixa de ids"),
+    "reports": ("app.reports.cli", "Relatórios por time e por funcionário"),
+    "recount": ("app.counters.cli", "Recalcula os contadores de times e funcionários"),
+    "shell": ("app.server.cli:shell", "Modo interativo que mantém o banco aberto entre comandos"),
+    "serve": ("app.server.cli:serve", "Servidor local que executa comandos recebidos por socket Unix"),
+    "client": ("app.server.cli:client", "Envia um comando para o servidor iniciado com serve"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Grupo raiz que importa o modulo de cada subcomando apenas ao usa-lo."""
+
+    _formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return [*super().list_commands(ctx), *LAZY_SUBCOMMANDS]
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        if name not in LAZY_SUBCOMMANDS:
+            return super().get_command(ctx, name)
+
+        target, help = LAZY_SUBCOMMANDS[name]
+        if self._formatting_help:
+            # A listagem do --help so precisa do nome e da ajuda curta.
+            return click.Command(name, help=help)
+
+        if name not in self.commands:
+            # Os modulos de CLI importam apenas os modelos que usam; o mapper
+            # precisa de todos para configurar os relacionamentos.
+            importlib.import_module("app.models")
+            module_name, _, command_name = target.partition(":")
+            command = typer.main.get_command(importlib.import_module(module_name).app)
+            if command_name:
+                command = command.commands[command_name]
+            command.name = name
+            command.help = command.help or help
+            self.add_command(command, name)
+        return self.commands[name]
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+
+def print_query_profile(stats) -> None:
+    """Resumo dos statements SQL executados pelo comando."""
+    table = Table(title="🔍 Consultas SQL", caption=(
+        f"{len(stats)} statements, {stats.total_ms:.1f}ms, {stats.rows} linhas"
+    ))
+    table.add_column("Statement", style="magenta", overflow="fold")
+    table.add_column("Vezes", justify="right", style="cyan")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Média ms", justify="right")
+    table.add_column("Linhas", justify="right")
+
+    for group in stats.summary()[:PROFILE_TOP_STATEMENTS]:
+        table.add_row(
+            escape(group["statement"]),
+            str(group["count"]),
+            f"{group['total_ms']:.2f}",
+            f"{group['total_ms'] / group['count']:.2f}",
+            str(group["rows"])
+        )
+    profile_console.print(table)
+
+    slow_queries = stats.slow_queries
+    if slow_queries:
+        profile_console.print(f"[yellow]{len(slow_queries)} consulta(s) acima de {stats.slow_query_ms:.0f}ms[/yellow]")
+
 
 app = typer.Typer(
     name="TODO CLI",
     help="Sistema de Gerenciamento de Tarefas",
-    rich_markup_mode="rich"
+    rich_markup_mode="rich",
+    cls=LazyGroup
 )
 
-app.add_typer(employees.cli.app, name="employees")
-app.add_typer(teams.cli.app, name="teams")
-app.add_typer(tasks.cli.app, name="tasks")
-
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Mostrar versão"),
-    db_url: str = typer.Option(None, "--db-url", help="URL do banco de dados a ser usado")
+    db_url: str = typer.Option(None, "--db-url", help="URL do banco de dados a ser usado"),
+    db_profile: str = typer.Option(None, "--db-profile", help="Perfil de desempenho do SQLite (default, performance)"),
+    profile: bool = typer.Option(False, "--profile", help="Mostra as consultas SQL executadas pelo comando"),
+    profile_out: Optional[Path] = typer.Option(
+        None, "--profile-out", dir_okay=False, help="Perfila o comando com cProfile e grava o resultado (.prof)"
+    ),
+    profile_sample: bool = typer.Option(
+        False, "--profile-sample", help="Perfila o comando por amostragem, com menor overhead"
+    )
 ):
     if db_url:
         set_db_url(db_url)
 
+    if db_profile:
+        set_db_profile(db_profile)
+
     if version:
         console.print("TODO CLI v1.0.0")
         return
+
+    if profile:
+        from app.database import QueryStats, get_engine
+
+        stats = QueryStats().attach(get_engine())
+
+        @ctx.call_on_close
+        def report_queries():
+            stats.detach()
+            print_query_profile(stats)
+
+    if profile_out or profile_sample:
+        from app.profiling import CommandProfiler
+
+        profiler = CommandProfiler(
+            "sample" if profile_sample else "cprofile",
+            str(profile_out) if profile_out else None
+        ).start()
+
+        @ctx.call_on_close
+        def report_profile():
+            profiler.stop().print(profile_console)
+            if profile_out:
+                profile_console.print(f"[dim]Perfil gravado em {profile_out}[/dim]")
     
     if ctx.invoked_subcommand is None:
+        from app.database import create_db_and_tables
+
         create_db_and_tables()
         
         console.print(
@@ -46,4 +173,4 @@ def main(
         )
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
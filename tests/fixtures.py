@@ -1,7 +1,12 @@
+from contextlib import contextmanager
+
 import pytest
 from sqlmodel import SQLModel, Session, create_engine
 
+from app.database import QueryStats
+
 from app.employees import models
+from app.reports import models
 from app.tasks import models
 from app.teams import models
 
@@ -11,5 +16,29 @@ def session():
     engine = create_engine("sqlite://")
     SQLModel.metadata.create_all(engine)
 
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture(name="query_counter")
+def query_counter(session):
+    """``QueryStats`` com os statements emitidos pelo engine da sessao de teste."""
+    with QueryStats().attach(session.get_bind()) as stats:
+        yield stats
+
+
+@pytest.fixture(name="query_budget")
+def query_budget(query_counter):
+    """Falha se o bloco executar mais statements do que o orcamento.
+
+    Uso: ``with query_budget(2): service.get_all()``.
+    """
+    @contextmanager
+    def budget(max_statements: int):
+        start = len(query_counter)
+        yield query_counter
+        executed = query_counter.statements[start:]
+        assert len(executed) <= max_statements, (
+            f"{len(executed)} statements executados (orcamento {max_statements}):\n" + "\n".join(executed)
+        )
+    return budget
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import database
+from app.database import async_session_scope, build_async_engine, create_db_and_tables
+from app.employees.async_services import AsyncEmployeeService
+from app.employees.schemas import EmployeeCreate
+from app.tasks.async_services import AsyncTaskService
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate, TaskFilter
+from app.teams.async_services import AsyncTeamService
+from app.teams.schemas import TeamCreate
+
+from tests.fixtures import session
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'async.db'}"
+
+
+def run(url, scenario):
+    """Roda ``scenario(engine)`` em um event loop novo, sobre um banco com o schema criado."""
+    async def main():
+        engine = build_async_engine(url, "performance")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        try:
+            return await scenario(engine)
+        finally:
+            await engine.dispose()
+    return asyncio.run(main())
+
+
+async def seed(session):
+    team = await AsyncTeamService(session).create(TeamCreate(name="Team A", description="A"))
+    employee = await AsyncEmployeeService(session).create_employee(
+        EmployeeCreate(name="Ana", email="ana@email.com", team_id=team.id)
+    )
+    return team, employee
+
+
+def test_build_async_engine(db_url):
+    async def scenario(engine):
+        async with engine.connect() as connection:
+            journal = (await connection.exec_driver_sql("PRAGMA journal_mode")).scalar()
+        return engine.url.drivername, journal
+
+    assert run(db_url, scenario) == ("sqlite+aiosqlite", "wal")
+    assert build_async_engine(db_url, pool="queue").pool.__class__ is AsyncAdaptedQueuePool
+    with pytest.raises(ValueError, match="singleton"):
+        build_async_engine(db_url, pool="singleton")
+
+
+def test_async_task_service(db_url):
+    async def scenario(engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            team, employee = await seed(session)
+            service = AsyncTaskService(session)
+            task = await service.create_task(TaskCreate(
+                title="Corrigir bug", description="Falha no login", team_id=team.id, priority=TaskPriority.HIGH
+            ))
+
+            assert (await service.get_task_by_id(task.id)).title == "Corrigir bug"
+            assert (await service.update_task_status(task.id, TaskStatus.IN_PROGESS)).status == TaskStatus.IN_PROGESS
+            assert (await service.assign_task(task.id, employee.id)).owner_id == employee.id
+            assert await service.update_task_status(task.id + 100, TaskStatus.COMPLETED) is None
+
+            rows = await service.get_task_rows(filters=TaskFilter(team_id=team.id))
+            assert [(row.title, row.team_name, row.owner_name) for row in rows] == [("Corrigir bug", "Team A", "Ana")]
+            assert [result.id for result in await service.search_tasks("login")] == [task.id]
+            assert (await service.get_task_statistics())["total"] == 1
+            assert await service.bulk_update_status(TaskStatus.COMPLETED, ids=[task.id]) == 1
+
+            assert await service.delete_task(task.id)
+            with pytest.raises(Exception, match="Tarefa"):
+                await service.get_task_by_id(task.id)
+
+    run(db_url, scenario)
+
+
+def test_async_iter_task_rows_streams_chunks(db_url):
+    async def scenario(engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            team, _ = await seed(session)
+            service = AsyncTaskService(session)
+            for i in range(5):
+                await service.create_task(TaskCreate(title=f"T{i}", description="D", team_id=team.id))
+
+            chunks = [rows async for rows in service.iter_task_rows(chunk_size=2)]
+            records = [rows async for rows in service.iter_task_rows(limit=1, as_records=True)]
+            return chunks, records
+
+    chunks, records = run(db_url, scenario)
+
+    assert [len(rows) for rows in chunks] == [2, 2, 1]
+    assert chunks[0][0][2] == "PENDING"
+    assert records[0][0].status == TaskStatus.PENDING
+
+
+def test_async_employee_and_team_services(db_url):
+    async def scenario(engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            team, employee = await seed(session)
+            await AsyncTaskService(session).create_task(
+                TaskCreate(title="T1", description="D", team_id=team.id, owner_id=employee.id)
+            )
+            employees, teams = AsyncEmployeeService(session), AsyncTeamService(session)
+
+            assert await employees.exists_by_email("ana@email.com")
+            assert not await employees.exists_by_name("Bia")
+            results = await employees.create_employees([EmployeeCreate(name="Bia", email="bia@email.com", team_id=team.id)])
+            assert results[0].employee_id is not None
+
+            # A segunda busca vem do cache, com os contadores expirados:
+            # precisam estar carregados para serem lidos fora do greenlet.
+            await employees.get_employee_by_id(employee.id)
+            session.expunge_all()
+            cached = await employees.get_employee_by_id(employee.id)
+            assert (cached.name, cached.tasks_count, cached.open_tasks_count) == ("Ana", 1, 1)
+
+            session.expunge_all()
+            await teams.get_by_id(team.id)
+            session.expunge_all()
+            assert (await teams.get_by_id(team.id)).employees_count == 2
+
+            assert [row.task_count for row in await employees.get_employee_rows()] == [1, 0]
+            assert [row.name for row in await teams.get_team_rows()] == ["Team A"]
+            assert [rows async for rows in teams.iter_team_rows()][0][0][1] == "Team A"
+
+    run(db_url, scenario)
+
+
+def test_async_services_run_concurrently(db_url):
+    async def scenario(engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            team, _ = await seed(session)
+
+        async def worker(worker_id):
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service = AsyncTaskService(session)
+                for i in range(5):
+                    await service.create_task(TaskCreate(title=f"W{worker_id}-{i}", description="D", team_id=team.id))
+
+        await asyncio.gather(*(worker(worker_id) for worker_id in range(4)))
+        async with AsyncSession(engine) as session:
+            return len((await session.exec(select(Task))).all())
+
+    assert run(db_url, scenario) == 20
+
+
+def test_async_session_scope_rolls_back(db_url, monkeypatch):
+    async def scenario(engine):
+        monkeypatch.setattr(database, "_async_engine", engine)
+        with pytest.raises(RuntimeError):
+            async with async_session_scope() as session:
+                session.add(Task(title="Descartada", description="D", team_id=1, status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+                await session.flush()
+                raise RuntimeError()
+        async with async_session_scope() as session:
+            return (await session.exec(select(Task))).all()
+
+    assert run(db_url, scenario) == []
@@ -0,0 +1,47 @@
+import asyncio
+
+from sqlmodel import Session, select
+
+from app.tasks.models import Task
+from benchmarks import bench_async, run
+from benchmarks.run import Result, compare
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "a": {"latency_ms": 10.0, "peak_kb": 1000.0, "statements": 1},
+        "b": {"latency_ms": 10.0, "peak_kb": 10.0, "statements": 2},
+    }
+    results = {
+        "a": Result(latency_ms=25.0, peak_kb=3000.0, statements=2),
+        "b": Result(latency_ms=19.0, peak_kb=60.0, statements=2),
+        "novo": Result(latency_ms=1.0, peak_kb=1.0, statements=100),
+    }
+
+    regressions = compare(results, baseline, tolerance=2.0)
+
+    assert len(regressions) == 3
+    assert all(r.startswith("a:") for r in regressions)
+
+
+def test_run_tier_measures_every_case(tmp_path, monkeypatch):
+    monkeypatch.setitem(run.TIERS, "tiny", 200)
+
+    results = run.run_tier("tiny", tmp_path, repeat=1)
+
+    assert set(results) == {case.name for case in run.CASES}
+    assert all(r.statements >= 1 and r.latency_ms > 0 for r in results.values())
+    assert results["tasks.get_all_tasks[page]"].statements == 1
+
+
+def test_bench_async_measures_every_mode(tmp_path, monkeypatch):
+    monkeypatch.setitem(run.TIERS, "tiny", 200)
+    engine = run.prepare_engine("tiny", tmp_path)
+
+    results = asyncio.run(bench_async.run_scenario(tmp_path / "bench-tiny.db", 200, "escrita", 10, 2))
+
+    assert len(results) == 3
+    assert all(len(result.latencies_ms) == 10 and result.requests_per_second > 0 for result in results.values())
+    with Session(engine) as session:
+        assert session.exec(select(Task).where(Task.title.like("bench-async-%"))).all() == []
+    engine.dispose()
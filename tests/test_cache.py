@@ -0,0 +1,175 @@
+import pytest
+from sqlmodel import Session, create_engine
+
+from app.cache import LRUCache, get_cache
+from app.config import CACHE_SIZE_ENV
+from app.database import create_db_and_tables
+from app.employees.models import Employee
+from app.employees.services import EmployeeService
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.schemas import TaskCreate
+from app.tasks.services import TaskService
+from app.teams.models import Team
+from app.teams.services import TeamService
+
+from tests.fixtures import query_budget, query_counter, session
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def data(session):
+    team = Team(name="Team A", description="A")
+    session.add(team)
+    session.commit()
+    employee = Employee(name="Ana", email="ana@email.com", team_id=team.id)
+    session.add(employee)
+    session.commit()
+    task = Task(title="T1", description="D", team_id=team.id, owner_id=employee.id, status=TaskStatus.PENDING, priority=TaskPriority.MEDIUM)
+    session.add(task)
+    session.commit()
+    session.expunge_all()
+    return team, employee, task
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set(("a", 1), "A")
+    cache.set(("b", 2), "B")
+    assert cache.get(("a", 1)) == "A"
+
+    cache.set(("c", 3), "C")
+
+    assert ("a", 1) in cache and ("c", 3) in cache
+    assert ("b", 2) not in cache
+    assert cache.get(("b", 2)) is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 1, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_lru_ttl_expires_entries():
+    clock = FakeClock()
+    cache = LRUCache(maxsize=10, ttl=5, clock=clock)
+    cache.set(("a", 1), "A")
+
+    clock.now = 4.9
+    assert cache.get(("a", 1)) == "A"
+    clock.now = 5.0
+    assert cache.get(("a", 1)) is None
+    assert len(cache) == 0
+
+
+def test_lru_invalidate_namespace():
+    cache = LRUCache()
+    cache.set(("tasks", 1), "T")
+    cache.set(("tasks:exists", 1), True)
+    cache.set(("teams", 1), "X")
+
+    cache.invalidate_namespace("tasks", "tasks:exists")
+
+    assert len(cache) == 1 and ("teams", 1) in cache
+
+
+def test_cache_size_from_env(monkeypatch):
+    monkeypatch.setenv(CACHE_SIZE_ENV, "0")
+    cache = get_cache(Session(create_engine("sqlite://")))
+
+    cache.set(("tasks", 1), {})
+
+    assert cache.maxsize == 0 and len(cache) == 0
+
+
+def test_get_task_by_id_hits_cache(session, data, query_budget):
+    _, _, task = data
+    service = TaskService(session)
+    service.get_task_by_id(task.id)
+    session.expunge_all()
+
+    with query_budget(0):
+        cached = service.get_task_by_id(task.id)
+
+    assert cached.title == "T1" and cached in session
+    assert get_cache(session).stats().hits == 1
+
+
+def test_task_writes_invalidate_cache(session, data):
+    _, employee, task = data
+    service = TaskService(session)
+    service.get_task_by_id(task.id)
+
+    service.update_task_status(task.id, TaskStatus.COMPLETED)
+    session.expunge_all()
+    assert service.get_task_by_id(task.id).status == TaskStatus.COMPLETED
+
+    service.bulk_update_status(TaskStatus.PENDING, filters=None, ids=[task.id])
+    session.expunge_all()
+    assert service.get_task_by_id(task.id).status == TaskStatus.PENDING
+
+    assert service.delete_task(task.id)
+    session.expunge_all()
+    with pytest.raises(Exception, match="Tarefa"):
+        service.get_task_by_id(task.id)
+
+
+def test_cached_employee_reloads_counters(session, data):
+    team, employee, _ = data
+    service = EmployeeService(session)
+    assert service.get_employee_by_id(employee.id).tasks_count == 1
+
+    TaskService(session).create_task(TaskCreate(title="T2", description="D", team_id=team.id, owner_id=employee.id))
+    session.expunge_all()
+
+    cached = service.get_employee_by_id(employee.id)
+    assert cached.name == "Ana"
+    assert cached.tasks_count == 2 and cached.open_tasks_count == 2
+
+
+def test_session_team_reloads_counters(session, data):
+    team, employee, _ = data
+    loaded_team = TeamService(session).get_by_id(team.id)
+    loaded_employee = EmployeeService(session).get_employee_by_id(employee.id)
+    assert (loaded_team.tasks_count, loaded_employee.tasks_count) == (1, 1)
+
+    # Sem expunge: as instancias continuam no identity map da sessao.
+    TaskService(session).create_task(TaskCreate(title="T2", description="D", team_id=team.id, owner_id=employee.id))
+
+    assert TeamService(session).get_by_id(team.id) is loaded_team
+    assert loaded_team.tasks_count == 2
+    assert EmployeeService(session).get_employee_by_id(employee.id).tasks_count == 2
+
+
+def test_get_team_by_id(session, data, query_budget):
+    team, _, _ = data
+    service = TeamService(session)
+    service.get_by_id(team.id)
+    session.expunge_all()
+
+    with query_budget(0):
+        assert service.get_by_id(team.id).name == "Team A"
+    with pytest.raises(Exception, match="Time nao encontrado"):
+        service.get_by_id(team.id + 100)
+
+
+def test_exists_caches_only_positive_results(session, data, query_budget):
+    service = EmployeeService(session)
+    assert service.exists_by_email("ana@email.com")
+    with query_budget(0):
+        assert service.exists_by_email("ana@email.com")
+
+    assert not service.exists_by_name("Bia")
+    session.add(Employee(name="Bia", email="bia@email.com", team_id=data[0].id))
+    session.commit()
+    assert service.exists_by_name("Bia")
+
@@ -0,0 +1,159 @@
+import pytest
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine, delete, select, update
+from typer.testing import CliRunner
+
+from app.counters.services import CounterService
+from app.database import create_db_and_tables
+from app.employees.models import Employee
+from app.migrations import upgrade
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.teams.models import Team
+from main import app
+
+from tests.fixtures import session
+
+runner = CliRunner()
+
+TEAM_COUNTERS = (
+    Team.employees_count, Team.tasks_count, Team.open_tasks_count,
+    Team.pending_tasks_count, Team.in_progress_tasks_count, Team.completed_tasks_count,
+)
+EMPLOYEE_COUNTERS = (
+    Employee.tasks_count, Employee.open_tasks_count,
+    Employee.pending_tasks_count, Employee.in_progress_tasks_count, Employee.completed_tasks_count,
+)
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def teams(session):
+    alpha, beta = Team(name="Alpha", description="A"), Team(name="Beta", description="B")
+    session.add_all([alpha, beta])
+    session.commit()
+    return alpha, beta
+
+
+@pytest.fixture
+def employees(session, teams):
+    ana = Employee(name="Ana", email="ana@email.com", team_id=teams[0].id)
+    bia = Employee(name="Bia", email="bia@email.com", team_id=teams[1].id)
+    session.add_all([ana, bia])
+    session.commit()
+    return ana, bia
+
+
+def team_counters(session, team_id):
+    return tuple(session.exec(select(*TEAM_COUNTERS).where(Team.id == team_id)).one())
+
+
+def employee_counters(session, employee_id):
+    return tuple(session.exec(select(*EMPLOYEE_COUNTERS).where(Employee.id == employee_id)).one())
+
+
+def add_task(session, team_id, owner_id=None, status=TaskStatus.PENDING):
+    task = Task(title="T", description="D", team_id=team_id, owner_id=owner_id, status=status, priority=TaskPriority.LOW)
+    session.add(task)
+    session.commit()
+    return task
+
+
+def test_task_inserts_update_counters(session, teams, employees):
+    alpha, _ = teams
+    ana, _ = employees
+    add_task(session, alpha.id, ana.id)
+    add_task(session, alpha.id, ana.id, TaskStatus.COMPLETED)
+    add_task(session, alpha.id, status=TaskStatus.IN_PROGESS)
+
+    assert team_counters(session, alpha.id) == (1, 3, 2, 1, 1, 1)
+    assert employee_counters(session, ana.id) == (2, 1, 1, 0, 1)
+
+
+def test_status_change_and_moves_update_counters(session, teams, employees):
+    alpha, beta = teams
+    ana, bia = employees
+    task = add_task(session, alpha.id, ana.id)
+
+    session.exec(update(Task).where(Task.id == task.id).values(status=TaskStatus.COMPLETED))
+    session.commit()
+    assert team_counters(session, alpha.id) == (1, 1, 0, 0, 0, 1)
+    assert employee_counters(session, ana.id) == (1, 0, 0, 0, 1)
+
+    session.exec(update(Task).where(Task.id == task.id).values(
+        team_id=beta.id, owner_id=bia.id, status=TaskStatus.IN_PROGESS
+    ))
+    session.commit()
+    assert team_counters(session, alpha.id) == (1, 0, 0, 0, 0, 0)
+    assert team_counters(session, beta.id) == (1, 1, 1, 0, 1, 0)
+    assert employee_counters(session, ana.id) == (0, 0, 0, 0, 0)
+    assert employee_counters(session, bia.id) == (1, 1, 0, 1, 0)
+
+    session.exec(update(Task).where(Task.id == task.id).values(owner_id=None))
+    session.exec(delete(Task).where(Task.id == task.id))
+    session.commit()
+    assert team_counters(session, beta.id) == (1, 0, 0, 0, 0, 0)
+    assert employee_counters(session, bia.id) == (0, 0, 0, 0, 0)
+
+
+def test_employee_changes_update_team_counter(session, teams, employees):
+    alpha, beta = teams
+    ana, _ = employees
+
+    session.exec(update(Employee).where(Employee.id == ana.id).values(team_id=beta.id))
+    session.commit()
+    assert team_counters(session, alpha.id)[0] == 0
+    assert team_counters(session, beta.id)[0] == 2
+
+    session.exec(delete(Employee).where(Employee.id == ana.id))
+    session.commit()
+    assert team_counters(session, beta.id)[0] == 1
+
+
+def test_recount_fixes_drift(session, teams, employees):
+    alpha, _ = teams
+    ana, _ = employees
+    add_task(session, alpha.id, ana.id, TaskStatus.IN_PROGESS)
+    session.exec(update(Team).values(employees_count=99, tasks_count=99))
+    session.exec(update(Employee).values(open_tasks_count=99))
+    session.commit()
+
+    assert CounterService(session).recount() == (2, 2)
+    assert team_counters(session, alpha.id) == (1, 1, 1, 0, 1, 0)
+    assert team_counters(session, teams[1].id) == (1, 0, 0, 0, 0, 0)
+    assert employee_counters(session, ana.id) == (1, 1, 0, 1, 0)
+
+
+def test_upgrade_adds_counter_columns_to_existing_tables():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Banco anterior aos contadores: sem triggers nem colunas.
+        triggers = connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'counters_%'"
+        )).scalars().all()
+        for trigger in triggers:
+            connection.execute(text(f"DROP TRIGGER {trigger}"))
+        for column in TEAM_COUNTERS + EMPLOYEE_COUNTERS:
+            connection.execute(text(f"ALTER TABLE {column.table.name} DROP COLUMN {column.name}"))
+        connection.execute(text("INSERT INTO teams (id, name, description, created_at) VALUES (1, 'Legado', 'L', '2024-01-01')"))
+        connection.execute(text(
+            "INSERT INTO tasks (title, description, team_id, status, priority, created_at) "
+            "VALUES ('Antiga', 'D', 1, 'PENDING', 'LOW', '2024-01-01')"
+        ))
+
+    upgrade(engine)
+    upgrade(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT tasks_count, open_tasks_count FROM teams")).one() == (1, 1)
+        assert len(triggers) == 11
+
+
+def test_e2e_recount():
+    result = runner.invoke(app, ["recount"])
+    assert result.exit_code == 0
+    assert "Contadores recalculados" in result.output
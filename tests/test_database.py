@@ -0,0 +1,208 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import SQLModel, create_engine, select
+
+from app import database
+from app.database import QueryStats, build_engine, create_db_and_tables, get_pool_status, session_scope
+from app.migrations import upgrade
+from app.tasks.models import Task, TaskStatus
+from app.teams.models import Team
+
+from tests.fixtures import query_budget, query_counter, session
+
+
+@pytest.fixture(autouse= True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+def query_plan(session, statement) -> str:
+    compiled = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = session.connection().execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_task_filters_use_indexes(session):
+    assert "USING INDEX ix_tasks_team_id_status" in query_plan(session, select(Task).where(Task.team_id == 1))
+    assert "USING INDEX ix_tasks_owner_id_status" in query_plan(session, select(Task).where(Task.owner_id == 1))
+    assert "USING INDEX ix_tasks_team_id_status" in query_plan(
+        session, select(Task).where(Task.team_id == 1, Task.status == TaskStatus.PENDING)
+    )
+    assert "USING INDEX ix_tasks_status" in query_plan(session, select(Task).where(Task.status == TaskStatus.PENDING))
+
+
+def test_upgrade_adds_missing_indexes():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in ("ix_tasks_team_id_status", "ix_tasks_status", "ix_employees_team_id"):
+            connection.execute(text(f"DROP INDEX {index}"))
+
+    upgrade(engine)
+    upgrade(engine)
+
+    with engine.connect() as connection:
+        indexes = {row[0] for row in connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    assert {"ix_tasks_team_id_status", "ix_tasks_owner_id_status", "ix_tasks_status",
+            "ix_tasks_priority", "ix_employees_team_id"} <= indexes
+
+
+def test_upgrade_builds_task_search_for_existing_tasks():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE tasks_fts"))
+        for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text(
+            "INSERT INTO tasks (title, description, team_id, status, priority, created_at) "
+            "VALUES ('Migrar banco', 'Legado', 1, 'PENDING', 'LOW', '2024-01-01')"
+        ))
+
+    upgrade(engine)
+    upgrade(engine)
+
+    with engine.connect() as connection:
+        found = connection.execute(text("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'legado'")).all()
+    assert found == [(1,)]
+
+
+def test_create_all_installs_triggers_without_upgrade():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        names = {row[0] for row in connection.execute(text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"))}
+    assert {"tasks_fts", "tasks_fts_insert", "counters_tasks_teams_insert", "report_queue_tasks_update"} <= names
+
+
+def test_models_do_not_import_migrations():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.models; print('app.migrations' in sys.modules)"],
+        cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def read_pragmas(engine, *names):
+    with engine.connect() as connection:
+        return [connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names]
+
+
+def test_performance_profile_pragmas(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'perf.db'}", "performance")
+
+    assert read_pragmas(engine, "journal_mode", "synchronous", "cache_size", "temp_store", "busy_timeout") == [
+        "wal", 1, -64000, 2, 5000
+    ]
+
+
+def test_default_profile_keeps_sqlite_defaults(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'default.db'}", "default")
+
+    assert read_pragmas(engine, "journal_mode", "synchronous") == ["delete", 2]
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError, match="Perfil de banco desconhecido"):
+        build_engine("sqlite://", "turbo")
+
+
+def test_unknown_pool():
+    with pytest.raises(ValueError, match="Pool de conexoes desconhecido"):
+        build_engine("sqlite://", pool="infinite")
+
+
+def test_session_scope_rolls_back_on_error():
+    with pytest.raises(RuntimeError):
+        with session_scope() as session:
+            session.add(Team(name="Rollback", description="D"))
+            session.flush()
+            raise RuntimeError("falha")
+
+    with session_scope() as session:
+        assert session.exec(select(Team).where(Team.name == "Rollback")).first() is None
+
+
+def test_session_scope_shares_bounded_pool_across_threads(tmp_path, monkeypatch):
+    engine = build_engine(f"sqlite:///{tmp_path / 'pool.db'}", "performance", "queue", pool_size=2, max_overflow=1)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(database, "_engine", engine)
+
+    def work(i):
+        with session_scope() as session:
+            return session.exec(select(Team).where(Team.id == i)).first()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(50)))
+
+    status = get_pool_status()
+    assert status["class"] == "QueuePool"
+    assert status["size"] == 2
+    assert status["checked_out"] == 0
+    assert status["checked_in"] <= 3
+    engine.dispose()
+
+
+
+def test_dispose_engine_discards_global_engine(tmp_path, monkeypatch):
+    old = build_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    monkeypatch.setattr(database, "_engine", old)
+    monkeypatch.setenv("TODO_CLI_DB_URL", f"sqlite:///{tmp_path / 'new.db'}")
+
+    database.dispose_engine()
+
+    assert database._engine is None
+    engine = database.get_engine()
+    assert engine is not old
+    assert engine.url.database == str(tmp_path / "new.db")
+    database.dispose_engine()
+
+def test_query_stats_records_rows_and_timing(session, query_counter):
+    session.add_all([Team(name=f"Stats {i}", description="D") for i in range(3)])
+    session.commit()
+    query_counter.clear()
+
+    assert len(session.exec(select(Team)).all()) == 3
+    session.connection().execute(text("UPDATE teams SET description = 'X'"))
+
+    select_query, update_query = query_counter.queries
+    assert select_query.rows == 3
+    assert update_query.rows == 3
+    assert query_counter.rows == 6
+    assert query_counter.total_ms > 0
+
+
+def test_query_stats_summary_groups_statements(session, query_counter):
+    for i in range(3):
+        session.exec(select(Team).where(Team.id == i)).first()
+
+    summary = query_counter.summary()
+    assert len(summary) == 1
+    assert summary[0]["count"] == 3
+
+
+def test_query_stats_logs_slow_queries(session, caplog):
+    with QueryStats(slow_query_ms=0).attach(session.get_bind()) as stats:
+        session.exec(select(Team)).all()
+
+    assert len(stats.slow_queries) == 1
+    assert "Consulta lenta" in caplog.text
+
+    session.exec(select(Team)).all()
+    assert len(stats) == 1
+
+
+def test_query_budget_fails_when_exceeded(session, query_budget):
+    with query_budget(1):
+        session.exec(select(Team)).all()
+
+    with pytest.raises(AssertionError, match="orcamento 1"):
+        with query_budget(1):
+            session.exec(select(Team)).all()
+            session.exec(select(Task)).all()
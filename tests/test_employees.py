@@ -1,9 +1,12 @@
 import pytest
 
 from app.employees.models import Employee
-from app.employees.schemas import EmployeeCreate
+from app.employees.schemas import EmployeeCreate, EmployeeCreateResult, EmployeeRow
 from app.employees.services import EmployeeService
 
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.teams.models import Team
+
 from app.database import create_db_and_tables
 
 from unittest.mock import patch
@@ -11,7 +14,7 @@ from unittest.mock import patch
 from typer.testing import CliRunner
 from main import app
 
-from tests.fixtures import session
+from tests.fixtures import query_budget, query_counter, session
 
 
 runner = CliRunner()
@@ -36,6 +39,14 @@ def test_create_employee_success(mock_validate_email, service: EmployeeService):
     assert employee.email == "jalmir@email.com"
 
 
+@patch("app.employees.utils.validate_email", return_value=True)
+def test_create_employee_skips_refresh(mock_validate_email, service: EmployeeService, query_budget):
+    # Uma consulta de duplicados e o INSERT; nenhum SELECT apos o commit.
+    with query_budget(2):
+        employee = service.create_employee(EmployeeCreate(name="Ana", email="ana@email.com", team_id=1))
+    assert employee.id is not None and employee.created_at is not None
+
+
 @patch("app.employees.utils.validate_email", return_value=False)
 def test_create_employee_invalid_email(mock_validate_email, service: EmployeeService):
     schema = EmployeeCreate(name="Fulano", email="invalido", team_id=2)
@@ -63,6 +74,36 @@ def test_create_employee_duplicate_email(mock_validate_email, service: EmployeeS
         service.create_employee(schema_dup_email)
 
 
+def test_create_employees_batch(service: EmployeeService):
+    service.session.add(Employee(name="Ana", email="ana@email.com", team_id=1))
+    service.session.commit()
+
+    results = service.create_employees([
+        EmployeeCreate(name="Bia", email="bia@email.com", team_id=1),
+        EmployeeCreate(name="Ana", email="nova@email.com", team_id=1),
+        EmployeeCreate(name="Caio", email="invalido", team_id=1),
+        EmployeeCreate(name="Duda", email="bia@email.com", team_id=1),
+        EmployeeCreate(name="Eva", email="eva@email.com", team_id=2),
+    ])
+
+    assert [r.error for r in results] == [None, "Funcionario ja cadastrado.", "Email invalido.",
+                                          "Funcionario ja cadastrado.", None]
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    created = {e.id: e.name for e in service.get_all_employees()}
+    assert created[results[0].employee_id] == "Bia"
+    assert created[results[4].employee_id] == "Eva"
+    assert len(created) == 3
+
+
+def test_create_employees_statement_count(service: EmployeeService, query_counter):
+    schemas = [EmployeeCreate(name=f"E{i}", email=f"e{i}@email.com", team_id=1) for i in range(2000)]
+
+    results = service.create_employees(schemas)
+
+    assert all(r.employee_id is not None for r in results)
+    assert len(query_counter) <= 6
+
+
 def test_get_all_employees(service: EmployeeService):
     assert service.get_all_employees() == []
 
@@ -74,6 +115,64 @@ def test_get_all_employees(service: EmployeeService):
     assert employees[0].name == "Ana"
 
 
+def test_list_employees(service: EmployeeService):
+    team = Team(name="Alpha", description="Time")
+    service.session.add(team)
+    service.session.commit()
+    ana = Employee(name="Ana", email="ana@email.com", team_id=team.id)
+    bia = Employee(name="Bia", email="bia@email.com", team_id=999)
+    service.session.add_all([ana, bia])
+    service.session.commit()
+    for title in ("T1", "T2"):
+        service.session.add(Task(title=title, description="D", team_id=team.id, owner_id=ana.id,
+                                 status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+    service.session.commit()
+
+    employees = service.list_employees()
+
+    assert [(e.name, e.team_name, e.task_count) for e in employees] == [("Ana", "Alpha", 2), ("Bia", "", 0)]
+    assert service.get_employee_rows() == [
+        EmployeeRow(ana.id, "Ana", "ana@email.com", "Alpha", 2, 2),
+        EmployeeRow(bia.id, "Bia", "bia@email.com", None, 0, 0),
+    ]
+
+
+def test_list_employees_query_count_constant(service: EmployeeService, query_counter):
+    team = Team(name="Alpha", description="Time")
+    service.session.add(team)
+    service.session.commit()
+    service.session.add(Employee(name="E0", email="e0@email.com", team_id=team.id))
+    service.session.commit()
+    query_counter.clear()
+    service.list_employees()
+    single = len(query_counter)
+
+    for i in range(1, 30):
+        employee = Employee(name=f"E{i}", email=f"e{i}@email.com", team_id=team.id)
+        service.session.add(employee)
+        service.session.flush()
+        service.session.add(Task(title="T", description="D", team_id=team.id, owner_id=employee.id,
+                                 status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+    service.session.commit()
+    query_counter.clear()
+
+    assert len(service.list_employees()) == 30
+    assert len(query_counter) == single
+
+
+def test_list_employees_keyset_pagination(service: EmployeeService):
+    for name in ("A", "B", "C"):
+        service.session.add(Employee(name=name, email=f"{name}@email.com", team_id=1))
+    service.session.commit()
+
+    first = service.list_employees(limit=2)
+    rest = service.list_employees(limit=2, after_id=first[-1].id)
+
+    assert [e.name for e in first] == ["A", "B"]
+    assert [e.name for e in rest] == ["C"]
+    assert [e.name for e in service.get_all_employees(after_id=first[0].id)] == ["B", "C"]
+
+
 def test_get_employee_by_id(service: EmployeeService):
     employee = Employee(name="Carlos", email="carlos@email.com", team_id=3)
     service.session.add(employee)
@@ -144,3 +243,12 @@ def teste_e2e_list_employee_success():
    result = runner.invoke(app, ["employees", "list"])
    assert "Test1" in result.output
     
+
+def teste_e2e_list_employee_csv():
+   runner.invoke(app, ["teams", "create", "--name", "Teste1", "--description", "Time de teste1"])
+   runner.invoke(app, ["employees", "create", "--name", "Test1", "--email", "test@test.com", "--team", "1"])
+   result = runner.invoke(app, ["employees", "list", "--format", "csv"])
+   assert result.exit_code == 0
+   lines = result.output.splitlines()
+   assert lines[0] == "id,name,email,team,task_count,open_task_count"
+   assert any(line.endswith(",Test1,test@test.com,Teste1,0,0") for line in lines[1:])
@@ -0,0 +1,134 @@
+import csv
+import json
+
+import pytest
+from sqlalchemy import delete
+from sqlmodel import Session, SQLModel
+from typer.testing import CliRunner
+
+from app.database import build_engine, create_db_and_tables
+from app.employees.models import Employee
+from app.exports.schemas import ExportEntity, ExportFormat
+from app.exports.services import MANIFEST_NAME, ExportService, export_columns
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.teams.models import Team
+from main import app
+
+from tests.fixtures import session
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def file_session(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'export.db'}", "performance")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine, expire_on_commit=False) as session:
+        team = Team(name="Alpha", description="Time, com virgula")
+        session.add(team)
+        session.commit()
+        session.add(Employee(name="Ana", email="ana@email.com", team_id=team.id))
+        session.add_all([
+            Task(title=f"T{i}", description="D", team_id=team.id, status=TaskStatus.PENDING, priority=TaskPriority.HIGH)
+            for i in range(10)
+        ])
+        session.commit()
+        # Buraco na sequencia de ids: as faixas seguem as linhas, nao os ids.
+        session.exec(delete(Task).where(Task.id.in_([2, 3, 4])))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_plan_ranges_balances_rows(file_session):
+    service = ExportService(file_session)
+
+    assert service.plan_ranges(ExportEntity.TASKS, 3) == [(1, 5), (6, 7), (8, 10)]
+    assert service.plan_ranges(ExportEntity.TASKS, 100) == [(1, 4), *((id, id) for id in range(5, 11))]
+    assert service.plan_ranges(ExportEntity.TEAMS, 4) == [(1, 1)]
+
+
+def test_export_writes_shards_and_manifest(file_session, tmp_path):
+    out = tmp_path / "out"
+
+    result = ExportService(file_session).export(ExportEntity.TASKS, out, shards=3, workers=1)
+
+    assert result.rows == 7 and len(result.shards) == 3
+    manifest = json.loads((out / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert [shard["file"] for shard in manifest["shards"]] == [f"tasks-{i:05d}.csv" for i in range(3)]
+    assert [shard["rows"] for shard in manifest["shards"]] == [2, 2, 3]
+    assert manifest["columns"] == export_columns(ExportEntity.TASKS) and manifest["merged"] is None
+
+    first = read_csv(out / "tasks-00000.csv")
+    assert first[0] == export_columns(ExportEntity.TASKS)
+    assert [row[0] for row in first[1:]] == ["1", "5"]
+    assert first[1][5:7] == ["PENDING", "HIGH"]
+
+
+def test_export_in_worker_processes_with_merge(file_session, tmp_path):
+    out = tmp_path / "out"
+
+    result = ExportService(file_session).export(ExportEntity.TASKS, out, shards=3, workers=2, merge=True)
+
+    assert result.workers == 2 and result.merged == "tasks.csv"
+    assert sorted(path.name for path in out.iterdir()) == [MANIFEST_NAME, "tasks.csv"]
+    rows = read_csv(out / "tasks.csv")
+    assert rows[0][0] == "id"
+    assert [row[0] for row in rows[1:]] == ["1", "5", "6", "7", "8", "9", "10"]
+
+
+def test_export_replaces_previous_files(file_session, tmp_path):
+    service = ExportService(file_session)
+    service.export(ExportEntity.TASKS, tmp_path, shards=3, workers=1)
+    service.export(ExportEntity.TEAMS, tmp_path, workers=1)
+
+    service.export(ExportEntity.TASKS, tmp_path, shards=1, workers=1, merge=True)
+
+    assert sorted(path.name for path in tmp_path.iterdir() if path.name.startswith("tasks")) == ["tasks.csv"]
+    assert (tmp_path / "teams-00000.csv").exists()
+
+    service.export(ExportEntity.TASKS, tmp_path, shards=2, workers=1)
+    assert sorted(path.name for path in tmp_path.iterdir() if path.name.startswith("tasks")) == [
+        "tasks-00000.csv", "tasks-00001.csv"
+    ]
+
+
+def test_export_jsonl_skips_counters(file_session, tmp_path):
+    ExportService(file_session).export(ExportEntity.TEAMS, tmp_path, ExportFormat.JSONL, merge=True, workers=1)
+
+    lines = (tmp_path / "teams.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["description"] for line in lines] == ["Time, com virgula"]
+    assert "tasks_count" not in json.loads(lines[0])
+
+
+def test_export_empty_table(file_session, tmp_path):
+    file_session.exec(delete(Employee))
+    file_session.commit()
+
+    result = ExportService(file_session).export(ExportEntity.EMPLOYEES, tmp_path, ExportFormat.TSV, merge=True)
+
+    assert result.rows == 0 and result.shards == []
+    assert (tmp_path / "employees.tsv").read_text(encoding="utf-8") == "\t".join(export_columns(ExportEntity.EMPLOYEES)) + "\n"
+
+
+def test_export_requires_file_database(session, tmp_path):
+    with pytest.raises(ValueError, match="arquivo"):
+        ExportService(session).export(ExportEntity.TASKS, tmp_path)
+
+
+def test_e2e_export_in_memory_database_fails(tmp_path):
+    result = runner.invoke(app, ["export", "tasks", str(tmp_path / "out")])
+
+    assert result.exit_code == 1
+    assert "Erro ao exportar tasks" in result.output
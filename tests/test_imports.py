@@ -0,0 +1,139 @@
+import json
+
+import pytest
+from sqlmodel import select
+from typer.testing import CliRunner
+
+from app.database import create_db_and_tables
+from app.employees.models import Employee
+from app.imports.schemas import ImportEntity, ImportFormat
+from app.imports.services import ImportService, read_rows
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.teams.models import Team
+from main import app
+
+from tests.fixtures import query_counter, session
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def team(session):
+    team = Team(name="Alpha", description="Time")
+    session.add(team)
+    session.commit()
+    return team
+
+
+def test_read_rows_csv_skips_empty_values(tmp_path):
+    path = tmp_path / "teams.csv"
+    path.write_text("name,description\nA,Time A\nB,\n", encoding="utf-8")
+
+    assert list(read_rows(path)) == [(2, {"name": "A", "description": "Time A"}), (3, {"name": "B"})]
+
+
+def test_read_rows_jsonl(tmp_path):
+    path = tmp_path / "teams.jsonl"
+    path.write_text('{"name": "A"}\n\n{"name": "B"}\n', encoding="utf-8")
+
+    assert list(read_rows(path)) == [(1, {"name": "A"}), (3, {"name": "B"})]
+    assert list(read_rows(path, ImportFormat.JSONL)) == list(read_rows(path))
+
+
+def test_import_tasks_in_batches(session, team, query_counter):
+    rows = [(i, {"title": f"T{i}", "description": "D", "team_id": team.id, "priority": "high"}) for i in range(10)]
+    query_counter.clear()
+
+    result = ImportService(session, batch_size=4).import_rows(ImportEntity.TASKS, rows)
+
+    assert (result.total, result.imported, result.errors) == (10, 10, [])
+    assert len([s for s in query_counter.statements if s.startswith("INSERT")]) == 3
+    tasks = session.exec(select(Task)).all()
+    assert len(tasks) == 10
+    assert all(t.priority == TaskPriority.HIGH and t.status == TaskStatus.PENDING for t in tasks)
+
+
+def test_import_reports_row_errors_without_aborting(session, team):
+    rows = [
+        (2, {"name": "Ana", "email": "ana@email.com", "team_id": team.id}),
+        (3, {"name": "Bia", "email": "invalido", "team_id": team.id}),
+        (4, {"name": "Ana", "email": "outra@email.com", "team_id": team.id}),
+        (5, {"name": "Caio", "email": "caio@email.com"}),
+        (6, {"name": "Duda", "email": "duda@email.com", "team_id": team.id}),
+    ]
+
+    result = ImportService(session, batch_size=10).import_rows(ImportEntity.EMPLOYEES, rows)
+
+    assert result.imported == 2
+    assert [e.line for e in result.errors] == [3, 5, 4]
+    assert "Email invalido" in result.errors[0].message
+    assert "team_id" in result.errors[1].message
+    assert "UNIQUE" in result.errors[2].message
+    assert [e.name for e in session.exec(select(Employee).order_by(Employee.id)).all()] == ["Ana", "Duda"]
+
+
+def test_import_file_reports_malformed_lines(session, tmp_path):
+    path = tmp_path / "teams.jsonl"
+    path.write_text('{"name": "A", "description": "D"}\n{"name": \n[1, 2]\n{"name": "B", "description": "D"}\n', encoding="utf-8")
+
+    result = ImportService(session).import_file(ImportEntity.TEAMS, path)
+
+    assert (result.total, result.imported) == (4, 2)
+    assert [(e.line, e.message) for e in result.errors] == [
+        (2, "JSON invalido: Expecting value."),
+        (3, "A linha deve ser um objeto JSON."),
+    ]
+
+
+def test_import_file_rejects_csv_rows_with_extra_fields(session, tmp_path):
+    path = tmp_path / "teams.csv"
+    path.write_text("name,description\nA,Time A,extra\nB,Time B\n", encoding="utf-8")
+
+    result = ImportService(session).import_file(ImportEntity.TEAMS, path)
+
+    assert result.imported == 1
+    assert [(e.line, e.message) for e in result.errors] == [(2, "Linha com mais campos que o cabecalho.")]
+    assert [t.name for t in session.exec(select(Team)).all()] == ["B"]
+
+
+def test_import_rows_reports_non_string_keys(session):
+    result = ImportService(session).import_rows(ImportEntity.TEAMS, [(1, {1: "A"}), (2, {"name": "B", "description": "D"})])
+
+    assert result.imported == 1
+    assert [e.line for e in result.errors] == [1]
+
+
+def test_e2e_import_teams(tmp_path):
+    path = tmp_path / "teams.jsonl"
+    path.write_text("\n".join(json.dumps({"name": f"Import{i}", "description": "D"}) for i in range(3)), encoding="utf-8")
+
+    result = runner.invoke(app, ["import", "teams", str(path), "--batch-size", "2"])
+
+    assert result.exit_code == 0
+    assert "Importadas: 3" in result.output
+
+
+def test_e2e_import_with_errors_exits_non_zero(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text("title,description,team_id\n,D,1\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["import", "tasks", str(path)])
+
+    assert result.exit_code == 1
+    assert "Linhas rejeitadas" in result.output
+
+
+def test_e2e_import_malformed_jsonl_reports_lines(tmp_path):
+    path = tmp_path / "teams.jsonl"
+    path.write_text('{"name": "Valido", "description": "D"}\nnao e json\n', encoding="utf-8")
+
+    result = runner.invoke(app, ["import", "teams", str(path)])
+
+    assert result.exit_code == 1
+    assert "Erro ao importar" not in result.output
+    assert "Importadas: 1" in result.output and "JSON invalido" in result.output
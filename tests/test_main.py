@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from main import app
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("sqlalchemy", "sqlmodel", "pydantic", "app.database")
+
+
+def imported_modules(*args):
+    """Executa main.py com ``-X importtime`` e retorna os modulos importados."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"]])
+def test_startup_skips_orm_stack(args):
+    loaded = imported_modules(*args)
+
+    assert not [m for m in loaded if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES]
+
+
+def test_help_lists_lazy_subcommands():
+    result = CliRunner().invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in ("employees", "teams", "tasks", "import"):
+        assert name in result.output
+
+
+def test_version():
+    result = CliRunner().invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert "TODO CLI v1.0.0" in result.output
+
+
+def test_profile_prints_query_summary(tmp_path, monkeypatch):
+    from app import database
+
+    engine = database.build_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    monkeypatch.setattr(database, "_engine", engine)
+    database.create_db_and_tables()
+
+    result = CliRunner().invoke(app, ["--profile", "teams", "list"])
+    assert result.exit_code == 0
+    assert "Consultas SQL" in result.output
+    assert "FROM teams" in result.output
+    assert "1 statements" in result.output
+    engine.dispose()
+
+
+def run_cli(db_path, *args):
+    """Executa main.py em um processo novo, sem modelos importados de antemao."""
+    return subprocess.run(
+        [sys.executable, "main.py", *args],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, "TODO_CLI_DB_URL": f"sqlite:///{db_path}"}
+    )
+
+
+@pytest.mark.parametrize("args", [
+    ["teams", "create", "--name", "Alpha", "--description", "Time Alpha"],
+    ["teams", "list"],
+    ["employees", "create", "--name", "Ana", "--email", "ana@email.com", "--team", "1"],
+    ["employees", "list"],
+    ["recount"],
+])
+def test_lazy_subcommand_registers_models(tmp_path, args):
+    db_path = tmp_path / "cli.db"
+    run_cli(db_path)
+    assert run_cli(db_path, "teams", "create", "--name", "Base", "--description", "Time base").returncode == 0
+
+    result = run_cli(db_path, *args)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "failed to locate a name" not in result.stdout + result.stderr
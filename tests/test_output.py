@@ -0,0 +1,47 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.output import OutputFormat, write_rows
+
+HEADER = ("id", "name")
+CHUNKS = [[(1, "Ana"), (2, "Bia\tSilva")], [(3, None)]]
+
+
+def render(format: OutputFormat, chunks=CHUNKS) -> str:
+    out = io.StringIO()
+    assert write_rows(format, HEADER, iter(chunks), out) == sum(len(chunk) for chunk in chunks)
+    return out.getvalue()
+
+
+def test_write_json():
+    assert json.loads(render(OutputFormat.JSON)) == [
+        {"id": 1, "name": "Ana"},
+        {"id": 2, "name": "Bia\tSilva"},
+        {"id": 3, "name": None},
+    ]
+
+
+def test_write_json_empty():
+    assert json.loads(render(OutputFormat.JSON, [])) == []
+
+
+def test_write_jsonl():
+    lines = render(OutputFormat.JSONL).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+
+def test_write_csv():
+    rows = list(csv.reader(io.StringIO(render(OutputFormat.CSV))))
+    assert rows == [["id", "name"], ["1", "Ana"], ["2", "Bia\tSilva"], ["3", ""]]
+
+
+def test_write_tsv_replaces_separators():
+    assert render(OutputFormat.TSV) == "id\tname\n1\tAna\n2\tBia Silva\n3\t\n"
+
+
+def test_write_table_is_not_streamable():
+    with pytest.raises(ValueError):
+        render(OutputFormat.TABLE)
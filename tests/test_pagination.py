@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from app.pagination import iter_pages
+
+
+def make_fetch(ids):
+    calls = []
+
+    def fetch(limit, after_id):
+        calls.append((limit, after_id))
+        rows = [SimpleNamespace(id=i) for i in ids if after_id is None or i > after_id]
+        return rows[:limit]
+
+    return fetch, calls
+
+
+def test_iter_pages_walks_cursor():
+    fetch, calls = make_fetch([1, 2, 3, 5, 8])
+    pages = [[row.id for row in page] for page in iter_pages(fetch, page_size=2)]
+    assert pages == [[1, 2], [3, 5], [8]]
+    assert calls == [(2, None), (2, 2), (2, 5)]
+
+
+def test_iter_pages_respects_limit_and_after_id():
+    fetch, calls = make_fetch(range(1, 11))
+    pages = [[row.id for row in page] for page in iter_pages(fetch, page_size=3, limit=4, after_id=2)]
+    assert pages == [[3, 4, 5], [6]]
+    assert calls == [(3, 2), (1, 5)]
+
+
+def test_iter_pages_empty():
+    fetch, _ = make_fetch([])
+    assert list(iter_pages(fetch, page_size=10)) == []
@@ -0,0 +1,60 @@
+import pstats
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from app import database
+from app.profiling import CommandProfiler, categorize
+from main import app
+
+
+@pytest.fixture
+def file_engine(tmp_path, monkeypatch):
+    engine = database.build_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    monkeypatch.setattr(database, "_engine", engine)
+    database.create_db_and_tables()
+    yield engine
+    engine.dispose()
+
+
+def test_categorize():
+    assert categorize("/site-packages/sqlalchemy/orm/loading.py") == "ORM"
+    assert categorize("/site-packages/sqlalchemy/engine/base.py") == "SQL"
+    assert categorize("~", "<method 'execute' of 'sqlite3.Cursor' objects>") == "SQL"
+    assert categorize("/site-packages/pydantic/main.py") == "Pydantic"
+    assert categorize("/site-packages/rich/table.py") == "Rich"
+    assert categorize("/app/tasks/cli.py") is None
+
+
+def test_cprofile_attributes_sql_time(file_engine):
+    profiler = CommandProfiler("cprofile").start()
+    with database.session_scope() as session:
+        session.connection().exec_driver_sql(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 200000) SELECT count(*) FROM n"
+        ).all()
+    report = profiler.stop()
+
+    assert report.categories["SQL"] > 0
+    assert any("sqlite3.Cursor" in hotspot.function for hotspot in report.hotspots)
+
+
+def test_sample_mode_collects_stacks(tmp_path):
+    output = tmp_path / "stacks.folded"
+    profiler = CommandProfiler("sample", str(output), interval=0.001).start()
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    report = profiler.stop()
+
+    assert sum(report.categories.values()) > 0
+    assert "test_sample_mode_collects_stacks" in output.read_text(encoding="utf-8")
+
+
+def test_profile_out_writes_pstats_file(tmp_path, file_engine):
+    output = tmp_path / "tasks.prof"
+    result = CliRunner().invoke(app, ["--profile-out", str(output), "tasks", "list"])
+
+    assert result.exit_code == 0
+    assert "Hotspots" in result.output
+    assert pstats.Stats(str(output)).total_calls > 0
@@ -0,0 +1,182 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlmodel import delete, or_, select, update
+from typer.testing import CliRunner
+
+from app.database import create_db_and_tables
+from app.employees.models import Employee
+from app.migrations import create_report_tracking
+from app.reports.models import ReportQueuedTask, ReportRefresh, TaskReportEntry
+from app.reports.schemas import EmployeeReportRow, TeamReportRow
+from app.reports.services import REFRESH_OVERLAP, ReportService
+from app.tasks.models import Task, TaskPriority, TaskStatus
+from app.tasks.services import TaskService
+from app.teams.models import Team
+from main import app
+
+from tests.fixtures import query_counter, session
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def data(session):
+    alpha, beta = Team(name="Alpha", description="A"), Team(name="Beta", description="B")
+    session.add_all([alpha, beta])
+    session.commit()
+    ana = Employee(name="Ana", email="ana@email.com", team_id=alpha.id)
+    session.add(ana)
+    session.commit()
+    tasks = [
+        Task(title="T1", description="D", team_id=alpha.id, owner_id=ana.id, status=TaskStatus.PENDING, priority=TaskPriority.HIGH),
+        Task(title="T2", description="D", team_id=alpha.id, owner_id=ana.id, status=TaskStatus.COMPLETED, priority=TaskPriority.HIGH),
+        Task(title="T3", description="D", team_id=beta.id, status=TaskStatus.IN_PROGESS, priority=TaskPriority.LOW),
+    ]
+    session.add_all(tasks)
+    session.commit()
+    return alpha, beta, ana, tasks
+
+
+def age_refresh(session):
+    # Simula um refresh antigo: so o que mudar depois dele e reprocessado.
+    session.exec(update(ReportRefresh).values(watermark=datetime.now() - REFRESH_OVERLAP * 10))
+    session.exec(update(Task).values(created_at=datetime(2024, 1, 1), updated_at=None))
+    session.commit()
+
+
+def test_first_refresh_builds_reports(session, data):
+    alpha, beta, ana, _ = data
+    service = ReportService(session)
+
+    result = service.refresh()
+
+    assert result.full and result.changed == 3
+    assert service.get_team_report() == [
+        TeamReportRow(alpha.id, "Alpha", 2, 1, 0, 1, 2, 1),
+        TeamReportRow(beta.id, "Beta", 1, 0, 1, 0, 0, 0),
+    ]
+    assert service.get_employee_report() == [EmployeeReportRow(ana.id, "Ana", "Alpha", 2, 1, 0, 1, 2, 1)]
+
+
+def test_incremental_refresh_applies_only_changes(session, data):
+    alpha, beta, ana, tasks = data
+    service = ReportService(session)
+    service.refresh()
+    age_refresh(session)
+
+    assert service.refresh().changed == 0
+
+    task_service = TaskService(session)
+    task_service.update_task_status(tasks[0].id, TaskStatus.COMPLETED)
+    task_service.assign_task(tasks[2].id, ana.id)
+    task_service.delete_task(tasks[1].id)
+    session.add(Task(title="T4", description="D", team_id=beta.id, status=TaskStatus.PENDING, priority=TaskPriority.HIGH))
+    session.commit()
+
+    result = service.refresh()
+
+    assert not result.full and result.changed == 4
+    assert service.get_team_report() == [
+        TeamReportRow(alpha.id, "Alpha", 1, 0, 0, 1, 1, 0),
+        TeamReportRow(beta.id, "Beta", 2, 1, 1, 0, 1, 1),
+    ]
+    assert service.get_employee_report() == [EmployeeReportRow(ana.id, "Ana", "Alpha", 2, 0, 1, 1, 1, 0)]
+    assert session.exec(select(ReportQueuedTask)).all() == []
+
+
+def test_incremental_refresh_matches_full_rebuild(session, data):
+    alpha, beta, ana, tasks = data
+    service = ReportService(session)
+    service.refresh()
+
+    TaskService(session).bulk_update_status(TaskStatus.COMPLETED, filters=None, ids=[task.id for task in tasks])
+    session.exec(delete(Task).where(Task.team_id == beta.id))
+    session.commit()
+    incremental = (service.refresh(), service.get_team_report(), service.get_employee_report())
+    full = (service.refresh(full=True), service.get_team_report(), service.get_employee_report())
+
+    assert incremental[1:] == full[1:] == (
+        [TeamReportRow(alpha.id, "Alpha", 2, 0, 0, 2, 2, 0)],
+        [EmployeeReportRow(ana.id, "Ana", "Alpha", 2, 0, 0, 2, 2, 0)],
+    )
+    assert len(session.exec(select(TaskReportEntry)).all()) == 2
+
+
+def test_refresh_reads_only_changed_tasks(session, data, query_counter):
+    service = ReportService(session)
+    service.refresh()
+    age_refresh(session)
+    TaskService(session).update_task_status(data[3][0].id, TaskStatus.IN_PROGESS)
+
+    query_counter.clear()
+    assert service.refresh().changed == 1
+    assert all(record.rows <= 1 for record in query_counter if "FROM tasks" in record.statement)
+
+    since = datetime.now()
+    changed = select(Task.id).where(or_(Task.created_at >= since, Task.updated_at >= since))
+    compiled = changed.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"))
+    assert "ix_tasks_created_at" in plan and "ix_tasks_updated_at" in plan
+
+
+def test_refresh_applies_writes_with_old_timestamps(session, data):
+    alpha, beta, ana, tasks = data
+    service = ReportService(session)
+    service.refresh()
+    age_refresh(session)
+
+    # Uma transacao longa grava ``updated_at`` no inicio e confirma depois do
+    # refresh: o horario fica fora da janela, mas a fila registra a tarefa.
+    session.exec(update(Task).where(Task.id == tasks[0].id).values(
+        status=TaskStatus.COMPLETED, updated_at=datetime(2024, 1, 1)
+    ))
+    session.commit()
+
+    assert service.refresh().changed == 1
+    assert service.get_team_report()[0] == TeamReportRow(alpha.id, "Alpha", 2, 0, 0, 2, 2, 0)
+    assert session.exec(select(ReportQueuedTask)).all() == []
+
+
+def test_changes_before_first_refresh_are_not_queued(session, data):
+    session.add(Task(title="T4", description="D", team_id=data[0].id, status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+    session.exec(update(Task).values(status=TaskStatus.COMPLETED))
+    session.exec(delete(Task))
+    session.commit()
+    assert session.exec(select(ReportQueuedTask)).all() == []
+
+
+def test_report_tracking_migrates_legacy_deletion_queue(session):
+    connection = session.connection()
+    connection.exec_driver_sql("CREATE TABLE report_deleted_tasks (task_id INTEGER PRIMARY KEY)")
+    connection.exec_driver_sql(
+        "CREATE TRIGGER reports_tasks_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT OR IGNORE INTO report_deleted_tasks (task_id) VALUES (old.id); END"
+    )
+    connection.exec_driver_sql("INSERT INTO report_deleted_tasks (task_id) VALUES (7)")
+
+    create_report_tracking(connection)
+    session.commit()
+
+    names = {name for name, in session.connection().exec_driver_sql("SELECT name FROM sqlite_master")}
+    assert "report_deleted_tasks" not in names and "reports_tasks_delete" not in names
+    assert [row.task_id for row in session.exec(select(ReportQueuedTask))] == [7]
+
+
+def test_e2e_reports():
+    result = runner.invoke(app, ["reports", "team", "--format", "json", "--full"])
+    assert result.exit_code == 0
+    assert isinstance(json.loads(result.output), list)
+
+    result = runner.invoke(app, ["reports", "employee"])
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["reports", "refresh"])
+    assert result.exit_code == 0
+    assert "incremental" in result.output
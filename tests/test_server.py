@@ -0,0 +1,103 @@
+import socket
+import threading
+
+import pytest
+import typer
+
+from app.database import create_db_and_tables
+from main import app
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requer sockets Unix")
+
+
+@pytest.fixture(autouse= True)
+def setup_database():
+    create_db_and_tables(test=True)
+
+
+@pytest.fixture
+def runner():
+    from app.server.services import CommandRunner
+
+    return CommandRunner(typer.main.get_command(app))
+
+
+def test_runner_captures_output_and_exit_code(runner):
+    exit_code, output = runner.run(["teams", "create", "--name", "Servidor", "--description", "Time"])
+    assert exit_code == 0
+    assert "Servidor" in output
+
+    exit_code, output = runner.run(["tasks", "create", "--title", "Sem descricao"])
+    assert exit_code == 2
+    assert "Missing option" in output
+
+    exit_code, output = runner.run(["inexistente"])
+    assert exit_code == 2
+
+
+def test_run_shell_executes_lines_until_exit(runner, capsys):
+    from app.server.services import run_shell
+
+    lines = iter(["", "teams list", "exit", "tasks list"])
+    run_shell(runner, read_line=lambda prompt: next(lines))
+
+    output = capsys.readouterr().out
+    assert "Lista de Times" in output
+    assert "Lista de Tarefas" not in output
+
+
+@pytest.fixture
+def socket_path(runner, tmp_path, monkeypatch):
+    from app import database
+    from app.server.services import CommandServer
+
+    # O banco em memoria e por thread; o servidor atende em outra thread.
+    engine = database.build_engine(f"sqlite:///{tmp_path / 'server.db'}", "performance")
+    monkeypatch.setattr(database, "_engine", engine)
+    runner.warm_up()
+
+    path = str(tmp_path / "s.sock")
+    server = CommandServer(path, runner)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        engine.dispose()
+
+
+def test_serve_and_client_round_trip(socket_path):
+    from app.server.client import send_command
+
+    send_command(["teams", "create", "--name", "Remoto", "--description", "Time"], socket_path)
+    exit_code, output = send_command(["teams", "list"], socket_path)
+    assert exit_code == 0
+    assert "Remoto" in output
+
+    exit_code, _ = send_command(["tasks", "create"], socket_path)
+    assert exit_code == 2
+
+
+@pytest.mark.parametrize("argv", [["shell"], ["--db-url", "sqlite://", "serve"], ["--profile", "client", "teams", "list"]])
+def test_server_rejects_interactive_and_server_commands(socket_path, argv):
+    from app.server.client import send_command
+
+    exit_code, output = send_command(argv, socket_path)
+    assert exit_code == 2
+    assert "nao pode ser executado pelo servidor" in output
+
+    # O runner continua livre para os proximos clientes.
+    exit_code, output = send_command(["teams", "list"], socket_path)
+    assert exit_code == 0
+
+
+def test_subcommand_name_skips_root_options(runner):
+    from app.server.services import subcommand_name
+
+    assert subcommand_name(runner.command, ["--db-url", "shell", "teams", "list"]) == "teams"
+    assert subcommand_name(runner.command, ["--profile", "--", "serve"]) == "serve"
+    assert subcommand_name(runner.command, ["--version"]) is None
@@ -1,8 +1,11 @@
+import json
+from datetime import datetime
 import pytest
+from sqlmodel import select
 from pydantic import ValidationError
 
-from app.tasks.services import TaskService
-from app.tasks.schemas import TaskCreate
+from app.tasks.services import SNIPPET_END, SNIPPET_START, TaskService, build_match_query
+from app.tasks.schemas import TaskCreate, TaskDimension, TaskFilter, TaskRow, TaskSort
 from app.tasks.models import TaskStatus, TaskPriority, Task
 
 from app.teams.services import TeamService
@@ -13,10 +16,12 @@ from app.employees.schemas import EmployeeCreate
 
 from app.database import create_db_and_tables
 
-from tests.fixtures import session
+from tests.fixtures import query_budget, query_counter, session
 
+import typer
 from typer.testing import CliRunner
 from main import app
+from app.tasks.cli import parse_where
 
 runner = CliRunner()
 
@@ -95,6 +100,238 @@ def test_get_all_tasks_returns_created(session, setup_team):
     assert len(tasks) == 2
 
 
+def test_get_all_tasks_loads_team_and_owner(session, setup_team, setup_employee):
+    TaskService(session).create_task(TaskCreate(title="T1", description="D1", team_id=setup_team.id, owner_id=setup_employee.id))
+    session.expunge_all()
+
+    tasks = TaskService(session).get_all_tasks()
+    session.expunge_all()
+
+    assert tasks[0].team.name == "Alpha"
+    assert tasks[0].owner.name == "Maria"
+
+
+def test_get_all_tasks_query_count_constant(session, setup_team, query_counter):
+    service = TaskService(session)
+    service.create_task(TaskCreate(title="T0", description="", team_id=setup_team.id))
+    session.expunge_all()
+    query_counter.clear()
+    for task in service.get_all_tasks():
+        task.team.name, task.owner
+    single = len(query_counter)
+
+    beta = TeamService(session).create(TeamCreate(name="Beta", description="Outro time"))
+    for i in range(20):
+        employee = EmployeeService(session).create_employee(
+            EmployeeCreate(name=f"E{i}", email=f"e{i}@email.com", team_id=beta.id)
+        )
+        service.create_task(TaskCreate(title=f"T{i + 1}", description="", team_id=beta.id, owner_id=employee.id))
+    session.expunge_all()
+    query_counter.clear()
+    for task in service.get_all_tasks():
+        task.team.name, task.owner.name if task.owner else None
+
+    assert len(query_counter) == single
+
+
+def test_get_all_tasks_keyset_pagination(session, setup_team):
+    service = TaskService(session)
+    ids = [service.create_task(TaskCreate(title=f"T{i}", description="", team_id=setup_team.id)).id for i in range(5)]
+
+    first = service.get_all_tasks(limit=2)
+    second = service.get_all_tasks(limit=2, after_id=first[-1].id)
+    rest = service.get_all_tasks(after_id=second[-1].id)
+
+    assert [t.id for t in first + second + rest] == ids
+
+
+def test_get_task_rows_projects_displayed_columns(session, setup_team, setup_employee, query_counter):
+    service = TaskService(session)
+    owner_name = setup_employee.name
+    for i in range(3):
+        service.create_task(TaskCreate(title=f"T{i}", description="", team_id=setup_team.id, owner_id=setup_employee.id if i else None))
+    session.expunge_all()
+    query_counter.clear()
+
+    rows = service.get_task_rows(limit=2, after_id=1)
+
+    assert rows == [
+        TaskRow(2, "T1", TaskStatus.PENDING, TaskPriority.MEDIUM, "Alpha", owner_name),
+        TaskRow(3, "T2", TaskStatus.PENDING, TaskPriority.MEDIUM, "Alpha", owner_name),
+    ]
+    assert "description" not in query_counter.statements[0]
+    assert len(session.identity_map) == 0
+
+
+@pytest.fixture
+def filter_tasks(session, setup_team, setup_employee):
+    other = TeamService(session).create(TeamCreate(name="Beta", description="Outro time"))
+    tasks = [
+        Task(title="A", description="D", team_id=setup_team.id, owner_id=setup_employee.id,
+             status=TaskStatus.PENDING, priority=TaskPriority.HIGH, created_at=datetime(2024, 1, 1)),
+        Task(title="B", description="D", team_id=setup_team.id,
+             status=TaskStatus.COMPLETED, priority=TaskPriority.LOW, created_at=datetime(2024, 3, 1)),
+        Task(title="C", description="D", team_id=other.id, owner_id=setup_employee.id,
+             status=TaskStatus.PENDING, priority=TaskPriority.MEDIUM, created_at=datetime(2024, 2, 1)),
+    ]
+    session.add_all(tasks)
+    session.commit()
+    return TaskService(session)
+
+
+@pytest.mark.parametrize("filters, titles", [
+    (TaskFilter(), ["A", "B", "C"]),
+    (TaskFilter(statuses=[TaskStatus.PENDING]), ["A", "C"]),
+    (TaskFilter(priorities=[TaskPriority.LOW, TaskPriority.MEDIUM]), ["B", "C"]),
+    (TaskFilter(team_id=1, statuses=[TaskStatus.PENDING]), ["A"]),
+    (TaskFilter(owner_id=1), ["A", "C"]),
+    (TaskFilter(created_after=datetime(2024, 1, 15)), ["B", "C"]),
+    (TaskFilter(sort=TaskSort.PRIORITY_DESC), ["A", "C", "B"]),
+    (TaskFilter(sort=TaskSort.STATUS), ["A", "C", "B"]),
+    (TaskFilter(sort=TaskSort.CREATED_AT_DESC), ["B", "C", "A"]),
+    (TaskFilter(sort=TaskSort.ID_DESC, owner_id=1), ["C", "A"]),
+])
+def test_get_task_rows_filters(filter_tasks, filters, titles):
+    assert [row.title for row in filter_tasks.get_task_rows(filters=filters)] == titles
+
+
+def test_iter_task_rows_filters_as_records(filter_tasks):
+    chunks = list(filter_tasks.iter_task_rows(chunk_size=1, filters=TaskFilter(statuses=[TaskStatus.PENDING]), as_records=True))
+    assert [chunk[0].title for chunk in chunks] == ["A", "C"]
+    assert chunks[0][0].status == TaskStatus.PENDING
+
+
+def test_explain_task_rows_uses_indexes(filter_tasks):
+    plan = "\n".join(filter_tasks.explain_task_rows(filters=TaskFilter(team_id=1, statuses=[TaskStatus.PENDING])))
+    assert "ix_tasks_team_id_status" in plan
+
+    plan = "\n".join(filter_tasks.explain_task_rows(filters=TaskFilter(created_after=datetime(2024, 1, 1), sort=TaskSort.CREATED_AT)))
+    assert "ix_tasks_created_at" in plan
+
+
+@pytest.fixture
+def search_tasks(session, setup_team):
+    session.add_all([
+        Task(title="Corrigir login", description="Erro de autenticação no SSO", team_id=setup_team.id,
+             status=TaskStatus.PENDING, priority=TaskPriority.HIGH),
+        Task(title="Documentar API", description="Explicar o fluxo de login e autenticação", team_id=setup_team.id,
+             status=TaskStatus.PENDING, priority=TaskPriority.LOW),
+        Task(title="Atualizar dependências", description="Versões novas", team_id=setup_team.id,
+             status=TaskStatus.COMPLETED, priority=TaskPriority.LOW),
+    ])
+    session.commit()
+    return TaskService(session)
+
+
+def test_search_tasks_ranks_title_matches_first(search_tasks):
+    results = search_tasks.search_tasks("login")
+
+    assert [r.title for r in results] == ["Corrigir login", "Documentar API"]
+    assert results[0].team_name == "Alpha"
+    assert f"{SNIPPET_START}login{SNIPPET_END}" in results[1].snippet
+
+
+@pytest.mark.parametrize("query, titles", [
+    ("autent*", ["Corrigir login", "Documentar API"]),
+    ("autenticacao sso", ["Corrigir login"]),
+    ("dependências!", ["Atualizar dependências"]),
+    ("inexistente", []),
+    ("  ", []),
+])
+def test_search_tasks_queries(search_tasks, query, titles):
+    assert sorted(r.title for r in search_tasks.search_tasks(query)) == titles
+
+
+def test_search_tasks_raw_syntax(search_tasks):
+    assert [r.title for r in search_tasks.search_tasks("title: login OR title: api", raw=True)] == [
+        "Corrigir login", "Documentar API"
+    ]
+
+
+def test_search_index_follows_updates_and_deletes(session, search_tasks):
+    task = session.exec(select(Task).where(Task.title == "Corrigir login")).one()
+    task.title = "Corrigir cadastro"
+    session.commit()
+    assert [r.title for r in search_tasks.search_tasks("cadastro")] == ["Corrigir cadastro"]
+    assert [r.title for r in search_tasks.search_tasks("login")] == ["Documentar API"]
+
+    session.delete(task)
+    session.commit()
+    assert search_tasks.search_tasks("sso") == []
+
+
+def test_build_match_query():
+    assert build_match_query('bug "login" pref*') == '"bug" "login" "pref"*'
+
+
+def test_bulk_update_status_by_filter_single_update(filter_tasks, query_counter):
+    query_counter.clear()
+
+    updated = filter_tasks.bulk_update_status(TaskStatus.IN_PROGESS, filters=TaskFilter(team_id=1))
+
+    assert updated == 2
+    assert [s.split()[0] for s in query_counter.statements] == ["UPDATE"]
+    assert [row.status for row in filter_tasks.get_task_rows()] == [
+        TaskStatus.IN_PROGESS, TaskStatus.IN_PROGESS, TaskStatus.PENDING
+    ]
+    assert filter_tasks.bulk_update_status(TaskStatus.IN_PROGESS, filters=TaskFilter(team_id=1)) == 0
+
+
+def test_bulk_update_status_by_ids_in_chunks(filter_tasks, query_counter, monkeypatch):
+    monkeypatch.setattr("app.tasks.services.BULK_UPDATE_CHUNK", 2)
+    query_counter.clear()
+
+    updated = filter_tasks.bulk_update_status(
+        TaskStatus.COMPLETED, ids=[1, 2, 3, 99], filters=TaskFilter(statuses=[TaskStatus.PENDING])
+    )
+
+    assert updated == 2
+    assert len([s for s in query_counter.statements if s.startswith("UPDATE")]) == 2
+    assert {row.status for row in filter_tasks.get_task_rows()} == {TaskStatus.COMPLETED}
+
+
+def test_bulk_assign(filter_tasks, setup_employee):
+    assert filter_tasks.bulk_assign(setup_employee.id, ids=[1, 2, 3]) == 1
+    assert {row.owner_name for row in filter_tasks.get_task_rows()} == {"Maria"}
+
+    with pytest.raises(Exception, match="Funcionario nao encontrado"):
+        filter_tasks.bulk_assign(999, ids=[1])
+
+
+def test_bulk_update_requires_criteria(filter_tasks):
+    with pytest.raises(ValueError):
+        filter_tasks.bulk_update_status(TaskStatus.COMPLETED)
+    with pytest.raises(ValueError, match="filtro"):
+        filter_tasks.bulk_update_status(TaskStatus.COMPLETED, filters=TaskFilter())
+    with pytest.raises(ValueError, match="id"):
+        filter_tasks.bulk_assign(1, ids=[])
+
+    assert [row.status for row in filter_tasks.get_task_rows()].count(TaskStatus.COMPLETED) == 1
+
+
+def test_parse_where():
+    filters = parse_where("team=3, status=in_progess|0, priority=HIGH, assignee=2, created_after=2024-01-01")
+    assert filters == TaskFilter(
+        team_id=3, owner_id=2, statuses=[TaskStatus.IN_PROGESS, TaskStatus.PENDING],
+        priorities=[TaskPriority.HIGH], created_after=datetime(2024, 1, 1)
+    )
+    with pytest.raises(typer.BadParameter):
+        parse_where("team")
+
+
+def test_iter_task_rows_yields_plain_tuples(session, setup_team, setup_employee):
+    service = TaskService(session)
+    for i in range(5):
+        service.create_task(TaskCreate(title=f"T{i}", description="", team_id=setup_team.id, owner_id=setup_employee.id if i % 2 else None))
+
+    chunks = list(service.iter_task_rows(chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert tuple(chunks[0][1])[1:] == ("T1", "PENDING", "MEDIUM", "Alpha", setup_employee.name)
+    assert chunks[0][0][-1] is None
+    assert [len(chunk) for chunk in service.iter_task_rows(limit=2, after_id=2)] == [2]
+
+
 def test_get_task_by_id(session, setup_team):
     task = TaskService(session).create_task(TaskCreate(title="Verificar", description="Tarefa", team_id=setup_team.id))
     found = TaskService(session).get_task_by_id(task.id)
@@ -127,6 +364,26 @@ def test_assign_task_to_employee(session, setup_team, setup_employee):
     assert assigned.owner_id == setup_employee.id
 
 
+def test_task_writes_skip_refresh(session, setup_team, setup_employee, query_budget):
+    service = TaskService(session)
+    with query_budget(1):
+        task = service.create_task(TaskCreate(title="Uma ida", description="", team_id=setup_team.id))
+    with query_budget(1):
+        updated = service.update_task_status(task.id, TaskStatus.IN_PROGESS)
+    with query_budget(1):
+        assigned = service.assign_task(task.id, setup_employee.id)
+
+    assert task.id is not None and task.created_at is not None
+    assert updated.status == TaskStatus.IN_PROGESS and updated.updated_at is not None
+    assert assigned.owner_id == setup_employee.id
+    assert session.get(Task, task.id).owner_id == setup_employee.id
+
+
+def test_update_missing_task_returns_none(session):
+    assert TaskService(session).update_task_status(999, TaskStatus.COMPLETED) is None
+    assert TaskService(session).assign_task(999, 1) is None
+
+
 def test_delete_task(session, setup_team):
     task = TaskService(session).create_task(TaskCreate(title="Excluir", description="", team_id=setup_team.id))
     TaskService(session).delete_task(task.id)
@@ -146,6 +403,38 @@ def test_get_task_statistics(session, setup_team):
     assert stats.get("Media") == 2
     assert stats.get("Alta") == 1
 
+def test_get_task_statistics_single_query(session, setup_team, query_counter):
+    TaskService(session).create_task(TaskCreate(title="T1", description="", team_id=setup_team.id, priority=TaskPriority.HIGH))
+    query_counter.clear()
+    stats = TaskService(session).get_task_statistics()
+    assert stats == {"Baixa": 0, "Media": 0, "Alta": 1, "total": 1}
+    assert len(query_counter) == 1
+
+def test_get_task_breakdown_combined_dimensions(session, setup_team, setup_employee, query_counter):
+    service = TaskService(session)
+    service.create_task(TaskCreate(title="T1", description="", team_id=setup_team.id, priority=TaskPriority.HIGH))
+    service.create_task(TaskCreate(title="T2", description="", team_id=setup_team.id, priority=TaskPriority.HIGH,
+                                   owner_id=setup_employee.id))
+    task = service.create_task(TaskCreate(title="T3", description="", team_id=setup_team.id, priority=TaskPriority.LOW,
+                                          owner_id=setup_employee.id))
+    service.update_task_status(task.id, TaskStatus.COMPLETED)
+    query_counter.clear()
+
+    rows = service.get_task_breakdown([TaskDimension.OWNER, TaskDimension.STATUS])
+
+    assert len(query_counter) == 1
+    assert [(r["owner_name"], r["status"], r["total"]) for r in rows] == [
+        (None, TaskStatus.PENDING, 1),
+        ("Maria", TaskStatus.COMPLETED, 1),
+        ("Maria", TaskStatus.PENDING, 1),
+    ]
+
+def test_get_task_breakdown_by_team(session, setup_team):
+    TaskService(session).create_task(TaskCreate(title="T1", description="", team_id=setup_team.id))
+    TaskService(session).create_task(TaskCreate(title="T2", description="", team_id=setup_team.id))
+    rows = TaskService(session).get_task_breakdown([TaskDimension.TEAM])
+    assert rows == [{"team_id": setup_team.id, "team_name": "Alpha", "total": 2}]
+
 def test_e2e_create_task_missing_title_argument():
     result = runner.invoke(app, ["tasks", "create"])
     assert result.exit_code != 0
@@ -177,4 +466,90 @@ def teste_e2e_list_task_success():
    result = runner.invoke(app, ["tasks", "list"])
    assert "Task1" in result.output
    assert "Task2" in result.output
-   assert "Task3" in result.output
\ No newline at end of file
+   assert "Task3" in result.output
+
+def teste_e2e_task_stats():
+   result = runner.invoke(app, ["tasks", "stats", "--by", "priority", "--by", "status"])
+   assert result.exit_code == 0
+   assert "Prioridade" in result.output
+   assert "Status" in result.output
+
+
+def teste_e2e_list_task_limit():
+   result = runner.invoke(app, ["tasks", "list", "--limit", "1", "--page-size", "1"])
+   assert result.exit_code == 0
+   assert "Task1" in result.output
+   assert "Task2" not in result.output
+   assert "--after-id" in result.output
+
+
+def teste_e2e_list_task_stream():
+   result = runner.invoke(app, ["tasks", "list", "--stream", "--page-size", "1"])
+   assert result.exit_code == 0
+   lines = result.output.splitlines()
+   assert lines[0] == "id\ttitle\tstatus\tpriority\tteam\towner"
+   assert any(line.split("\t")[1] == "Task1" for line in lines[1:])
+
+
+def teste_e2e_list_task_stream_conflicting_format():
+   result = runner.invoke(app, ["tasks", "list", "--format", "json", "--stream"])
+   assert result.exit_code == 2
+   assert "--stream" in result.output
+
+   result = runner.invoke(app, ["tasks", "list", "--format", "tsv", "--stream"])
+   assert result.exit_code == 0
+
+
+def teste_e2e_list_task_json():
+   result = runner.invoke(app, ["tasks", "list", "--format", "json"])
+   assert result.exit_code == 0
+   tasks = json.loads(result.output)
+   assert {"title": "Task1", "status": "PENDING"}.items() <= tasks[0].items()
+
+
+def teste_e2e_list_task_filters():
+   result = runner.invoke(app, ["tasks", "list", "--team", "1", "--status", "0", "--sort", "-id", "--format", "jsonl"])
+   assert result.exit_code == 0
+   assert "Task1" in result.output
+
+   result = runner.invoke(app, ["tasks", "list", "--status", "2"])
+   assert "Nenhuma tarefa encontrada" in result.output
+
+
+def teste_e2e_list_task_explain():
+   result = runner.invoke(app, ["tasks", "list", "--team", "1", "--status", "0", "--explain"])
+   assert result.exit_code == 0
+   assert "ix_tasks_team_id_status" in result.output
+
+
+def teste_e2e_list_task_after_id_requires_id_sort():
+   result = runner.invoke(app, ["tasks", "list", "--sort", "title", "--after-id", "1"])
+   assert result.exit_code == 1
+
+
+def teste_e2e_search_tasks():
+   result = runner.invoke(app, ["tasks", "search", "descri*"])
+   assert result.exit_code == 0
+   assert "Task1" in result.output
+
+   result = runner.invoke(app, ["tasks", "search", '"aberta', "--raw"])
+   assert result.exit_code == 1
+   assert "Erro ao buscar tarefas" in result.output
+
+
+def teste_e2e_bulk_set_status_and_reassign():
+   result = runner.invoke(app, ["tasks", "set-status", "COMPLETED", "--where", "team=1,status=PENDING|IN_PROGESS"])
+   assert result.exit_code == 0
+   assert "tarefa(s) atualizada(s)" in result.output
+
+   result = runner.invoke(app, ["tasks", "list", "--status", "0", "--team", "1"])
+   assert "Nenhuma tarefa encontrada" in result.output
+
+   result = runner.invoke(app, ["tasks", "set-status", "PENDING", "--ids", "1,2"])
+   assert result.output.startswith("2 tarefa(s)")
+
+   result = runner.invoke(app, ["tasks", "reassign", "999", "--ids", "1"])
+   assert result.exit_code == 1
+
+   result = runner.invoke(app, ["tasks", "set-status", "PENDING"])
+   assert result.exit_code == 1
@@ -6,11 +6,13 @@ from typer.testing import CliRunner
 from app.database import create_db_and_tables
 from main import app
 
+from app.employees.models import Employee
+from app.tasks.models import Task, TaskPriority, TaskStatus
 from app.teams.models import Team
-from app.teams.schemas import TeamCreate, TeamResponse
+from app.teams.schemas import TeamCreate, TeamResponse, TeamRow
 from app.teams.services import TeamService
 
-from tests.fixtures import session
+from tests.fixtures import query_budget, query_counter, session
 
 @pytest.fixture
 def team_service(session):
@@ -28,6 +30,12 @@ def test_create_team_success(team_service: TeamService):
     assert team.name == "Team A"
     assert team.description == "Time de desenvolvimento"
 
+def test_create_team_single_statement(team_service: TeamService, query_budget):
+    with query_budget(1):
+        team = team_service.create(TeamCreate(name="Team C", description="Sem refresh"))
+    assert team.id is not None
+
+
 def test_creat_team_default_description_none():
     schema = TeamCreate(name="Team B")
     assert schema.description is None
@@ -56,6 +64,75 @@ def test_get_all_teams(team_service: TeamService):
     assert len(teams) == 1
     assert teams[0].name == "Team B"
 
+def test_get_all_teams_counts(team_service: TeamService):
+    session = team_service.session
+    alpha = Team(name="Alpha", description="A")
+    beta = Team(name="Beta", description="B")
+    session.add_all([alpha, beta])
+    session.commit()
+    session.add_all([
+        Employee(name="Ana", email="ana@email.com", team_id=alpha.id),
+        Employee(name="Bia", email="bia@email.com", team_id=alpha.id),
+        Task(title="T1", description="D", team_id=alpha.id, status=TaskStatus.PENDING, priority=TaskPriority.LOW),
+        Task(title="T2", description="D", team_id=beta.id, status=TaskStatus.PENDING, priority=TaskPriority.LOW),
+    ])
+    session.commit()
+
+    teams = team_service.get_all()
+
+    assert [(t.name, t.employees_count, t.tasks_count) for t in teams] == [("Alpha", 2, 1), ("Beta", 0, 1)]
+
+def test_get_all_teams_query_count_constant(team_service: TeamService, query_counter, query_budget):
+    session = team_service.session
+    session.add(Team(name="T0", description="D"))
+    session.commit()
+    query_counter.clear()
+    team_service.get_all()
+    single = len(query_counter)
+
+    for i in range(1, 20):
+        team = Team(name=f"T{i}", description="D")
+        session.add(team)
+        session.flush()
+        session.add(Employee(name=f"E{i}", email=f"e{i}@email.com", team_id=team.id))
+        session.add(Task(title="T", description="D", team_id=team.id, status=TaskStatus.PENDING, priority=TaskPriority.LOW))
+    session.commit()
+
+    with query_budget(single):
+        assert len(team_service.get_all()) == 20
+
+def test_get_all_teams_keyset_pagination(team_service: TeamService):
+    for name in ("A", "B", "C"):
+        team_service.session.add(Team(name=name, description="D"))
+    team_service.session.commit()
+
+    first = team_service.get_all(limit=1)
+    rest = team_service.get_all(after_id=first[-1].id)
+
+    assert [t.name for t in first] == ["A"]
+    assert [t.name for t in rest] == ["B", "C"]
+
+def test_iter_team_rows_matches_get_all(team_service: TeamService):
+    for name in ("A", "B", "C"):
+        team_service.session.add(Team(name=name, description="D"))
+    team_service.session.commit()
+
+    chunks = list(team_service.iter_team_rows(chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert [tuple(row) for chunk in chunks for row in chunk] == [
+        (t.id, t.name, t.description, t.employees_count, t.tasks_count, t.open_tasks_count) for t in team_service.get_all()
+    ]
+
+def test_get_team_rows_matches_get_all(team_service: TeamService):
+    team_service.session.add_all([Team(name="A", description="D"), Team(name="B", description="E")])
+    team_service.session.commit()
+
+    rows = team_service.get_team_rows(limit=5)
+
+    assert rows == [TeamRow(1, "A", "D", 0, 0, 0), TeamRow(2, "B", "E", 0, 0, 0)]
+    assert [row.name for row in team_service.get_team_rows(after_id=1)] == ["B"]
+
 def test_get_all_teams_empty(team_service: TeamService):
     teams = team_service.get_all()
     assert teams == []